@@ -22,32 +22,52 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-30     xqyjlj       initial version
+# 2026-10-18     xqyjlj       export action_coder_dump_stream
+# 2026-10-18     xqyjlj       import the actions lazily
 #
 
-from .coder_dump import action_coder_dump
-from .coder_generate import action_coder_generate
-from .package_description import action_package_description
-from .package_install import action_package_install
-from .package_list import action_package_list
-from .package_make import action_package_make
-from .package_uninstall import action_package_uninstall
-from .tools_check_ip import action_tools_check_ip
-from .tools_cmx_ip import action_tools_cmx_ip
-from .tools_csp2filter import action_tools_csp2filter
-from .tools_dbc import action_tools_candb_dump
-from .tools_yaml2json import action_tools_yaml2json
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "action_coder_dump",
-    "action_coder_generate",
-    "action_package_install",
-    "action_package_uninstall",
-    "action_package_list",
-    "action_package_make",
-    "action_package_description",
-    "action_tools_csp2filter",
-    "action_tools_cmx_ip",
-    "action_tools_check_ip",
-    "action_tools_candb_dump",
-    "action_tools_yaml2json",
-]
+if TYPE_CHECKING:
+    from .coder_dump import action_coder_dump, action_coder_dump_stream
+    from .coder_generate import action_coder_generate
+    from .package_description import action_package_description
+    from .package_install import action_package_install
+    from .package_list import action_package_list
+    from .package_make import action_package_make
+    from .package_uninstall import action_package_uninstall
+    from .tools_check_ip import action_tools_check_ip
+    from .tools_cmx_ip import action_tools_cmx_ip
+    from .tools_csp2filter import action_tools_csp2filter
+    from .tools_dbc import action_tools_candb_dump
+    from .tools_yaml2json import action_tools_yaml2json
+
+# the module of every action, imported on first access so that a cli command
+# only loads what it runs
+_MODULES = {
+    "action_coder_dump": ".coder_dump",
+    "action_coder_dump_stream": ".coder_dump",
+    "action_coder_generate": ".coder_generate",
+    "action_package_install": ".package_install",
+    "action_package_uninstall": ".package_uninstall",
+    "action_package_list": ".package_list",
+    "action_package_make": ".package_make",
+    "action_package_description": ".package_description",
+    "action_tools_csp2filter": ".tools_csp2filter",
+    "action_tools_cmx_ip": ".tools_cmx_ip",
+    "action_tools_check_ip": ".tools_check_ip",
+    "action_tools_candb_dump": ".tools_dbc",
+    "action_tools_yaml2json": ".tools_yaml2json",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
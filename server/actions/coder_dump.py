@@ -22,17 +22,31 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-29     xqyjlj       initial version
+# 2026-10-18     xqyjlj       reuse warm coder from cache
+# 2026-10-18     xqyjlj       add streamed dump frames
+# 2026-10-18     xqyjlj       use DiffUtils instead of difflib
+# 2026-10-18     xqyjlj       serialise dumps per project
+# 2026-10-18     xqyjlj       emit progress through the given socketio
+# 2026-10-18     xqyjlj       rate-limit progress with ProgressEmitter
+# 2026-10-18     xqyjlj       lock the project with project_lock
 #
 
-import difflib
+import zlib
 from pathlib import Path
+from typing import Iterator
 
 import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
-from coder.coder import Coder
-from flask_socketio import SocketIO, emit
+from coder.cache import CODER_CACHE
+from flask_socketio import SocketIO
+from loguru import logger
 from public.csp.project import Project
+from utils.diff import DiffUtils
 from utils.io import IoUtils
-from utils.summary import SummaryUtils
+from utils.lock import project_lock
+from utils.progress import ProgressBatch, ProgressEmitter
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+COMPRESS_THRESHOLD = 512
 
 
 class __Slot:
@@ -41,22 +55,19 @@ class __Slot:
         self.sid = ""
         self.socketio: SocketIO | None = None
 
-    def on_sio_dump_progress(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
-
+    def on_sio_dump_progress(self, batch: ProgressBatch):
         progress = sio_coder_dump_pb2.SioCoderDumpProgress(
-            count=count,
-            index=index,
-            file=file,
-        )
-        emit(
-            "coder/dump.progress",
-            progress.SerializeToString(),
-            to=self.sid,
+            count=batch.count,
+            index=batch.index,
+            file=batch.file,
+            files=batch.files,
         )
         if self.socketio:
+            self.socketio.emit(
+                "coder/dump.progress",
+                progress.SerializeToString(),
+                to=self.sid,
+            )
             self.socketio.sleep(0)
 
 
@@ -67,32 +78,119 @@ def action_coder_dump(
     content: dict | None,
     sid: str | None = None,
     socketio: SocketIO | None = None,
+    jobs: int = 1,
 ) -> dict:
-    summary = SummaryUtils.load_summary(project.vendor, project.targetChip)
-    coder = Coder(project, summary)
-
     files = {}
 
-    if sid:
-        slot = __Slot()
-        slot.sid = sid
-        slot.socketio = socketio
-        coder.emitter["dump"].connect(slot.on_sio_dump_progress)
+    # the warm coder of a project is shared, dump it for one request at a time
+    with project_lock(project):
+        coder = CODER_CACHE.get(project)
+        if sid:
+            slot = __Slot()
+            slot.sid = sid
+            slot.socketio = socketio
+            progress = ProgressEmitter(slot.on_sio_dump_progress)
+            with progress.connected_to(coder.emitter["dump"]):
+                dumped = coder.dump(jobs)
+        else:
+            dumped = coder.dump(jobs)
 
-    for file, data in coder.dump().items():
+    for file, data in dumped.items():
         files[file] = {"content": data}
 
     if diff and path is not None and content is not None:
-        for file, data in files.items():
-            lines = IoUtils.readlines(str(Path(project.folder()) / file))
-            text: str = data["content"]
-            dif = difflib.unified_diff(
-                lines,
-                text.splitlines(keepends=True),
-                fromfile=file,
-                tofile=file,
-                lineterm="",
-            )
-            files[file]["diff"] = "".join(dif)
+        items = [
+            (file, _read_lines(project, file), data["content"].splitlines(True))
+            for file, data in files.items()
+        ]
+        for file, dif in DiffUtils.unified_many(items).items():
+            files[file]["diff"] = dif
 
     return files
+
+
+def action_coder_dump_stream(
+    project: Project,
+    diff: bool,
+    path: str | None,
+    content: dict | None,
+    sid: str,
+    socketio: SocketIO,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compression: int = sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_NONE,
+) -> int:
+    """
+    Dump the project and emit every file as ``coder/dump.frame`` as soon as it
+    is rendered, large files are split into chunks of ``chunk_size`` bytes.
+
+    Returns the number of files sent, the caller emits the summary.
+    """
+    with_diff = diff and path is not None and content is not None
+
+    slot = __Slot()
+    slot.sid = sid
+    slot.socketio = socketio
+
+    count = 0
+    with project_lock(project):
+        coder = CODER_CACHE.get(project)
+        progress = ProgressEmitter(slot.on_sio_dump_progress)
+        with progress.connected_to(coder.emitter["dump"]):
+            for file, text in coder.iter_dump(jobs):
+                if text is None:
+                    logger.error(f"file {file!r} gen failed.")
+                    continue
+
+                dif = _diff_file(project, file, text) if with_diff else ""
+                for frame in _make_frames(file, text, dif, chunk_size, compression):
+                    socketio.emit(
+                        "coder/dump.frame",
+                        frame.SerializeToString(),
+                        to=sid,
+                    )
+                    socketio.sleep(0)
+                count += 1
+
+    return count
+
+
+def _read_lines(project: Project, file: str) -> list[str]:
+    return IoUtils.readlines(str(Path(project.folder()) / file))
+
+
+def _diff_file(project: Project, file: str, text: str) -> str:
+    lines = _read_lines(project, file)
+    return DiffUtils.unified_text(lines, text.splitlines(True), file, file)
+
+
+def _make_frames(
+    file: str, text: str, diff: str, chunk_size: int, compression: int
+) -> Iterator[sio_coder_dump_pb2.SioCoderDumpFrame]:
+    data = text.encode("utf-8")
+    if chunk_size <= 0:
+        chunk_size = DEFAULT_CHUNK_SIZE
+    # chunks are byte ranges, the client joins them before decoding utf-8
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    if len(chunks) == 0:
+        chunks = [b""]
+
+    for i, chunk in enumerate(chunks):
+        frame = sio_coder_dump_pb2.SioCoderDumpFrame(
+            file=file,
+            chunk=i,
+            chunks=len(chunks),
+            data=chunk,
+            compression=sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_NONE,
+        )
+        if (
+            compression == sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_ZLIB
+            and len(chunk) >= COMPRESS_THRESHOLD
+        ):
+            compressed = zlib.compress(chunk)
+            if len(compressed) < len(chunk):
+                frame.data = compressed
+                frame.compression = compression
+        if i == len(chunks) - 1:
+            frame.diff = diff
+        yield frame
@@ -22,20 +22,23 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-29     xqyjlj       initial version
+# 2026-10-18     xqyjlj       lock per output folder instead of globally
+# 2026-10-18     xqyjlj       emit progress through the given socketio
+# 2026-10-18     xqyjlj       rate-limit progress with ProgressEmitter
+# 2026-10-18     xqyjlj       lock the project with project_lock
 #
 
 import os
 
 import proto.sio_coder_generate_pb2 as sio_coder_generate_pb2
 from coder.coder import Coder
-from flask_socketio import SocketIO, emit
-from gevent.lock import Semaphore
+from flask_socketio import SocketIO
 from public.csp.project import Project
 from tqdm import tqdm
+from utils.lock import project_lock
+from utils.progress import ProgressBatch, ProgressEmitter
 from utils.summary import SummaryUtils
 
-__lock = Semaphore()
-
 
 class __Slot:
     def __init__(self):
@@ -43,55 +46,48 @@ class __Slot:
         self.sid = ""
         self.socketio: SocketIO | None = None
 
-    def on_generate_progress(self, sender, **kwargs):
-        write = kwargs["write"]
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
+    def on_generate_progress(self, batch: ProgressBatch):
         if self.__generated_bar is None:
-            self.__generated_bar = tqdm(total=count, desc="generate", unit="file")
-        self.__generated_bar.set_description(f"generate {os.path.basename(file)}")
-        self.__generated_bar.n = index
+            self.__generated_bar = tqdm(total=batch.count, desc="generate", unit="file")
+        self.__generated_bar.set_description(f"generate {os.path.basename(batch.file)}")
+        self.__generated_bar.n = batch.index
         self.__generated_bar.refresh()
 
-        if index == count:
+        if batch.done:
             self.__generated_bar.set_description("generate")
             self.__generated_bar.close()
             self.__generated_bar = None
 
-    def on_sio_generate_progress(self, sender, **kwargs):
-        write = kwargs["write"]
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
+    def on_sio_generate_progress(self, batch: ProgressBatch):
         progress = sio_coder_generate_pb2.SioCoderGenerateProgress(
-            count=count,
-            index=index,
-            file=file,
-            write=write,
-        )
-        emit(
-            "coder/generate.progress",
-            progress.SerializeToString(),
-            to=self.sid,
+            count=batch.count,
+            index=batch.index,
+            file=batch.file,
+            write=batch.items[-1]["write"],
+            files=batch.files,
+            writes=[item["write"] for item in batch.items],
         )
         if self.socketio:
+            self.socketio.emit(
+                "coder/generate.progress",
+                progress.SerializeToString(),
+                to=self.sid,
+            )
             self.socketio.sleep(0)
 
-    def on_generate(self, sender, **kwargs):
-        write = kwargs["write"]
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
-
-        if write:
-            print(
-                f"[{index}/{count}] generate {file!r}, because the file or config has been modified."
-            )
-        else:
-            print(
-                f"[{index}/{count}] skip {file!r}, because the file or config has not been modified."
-            )
+    def on_generate(self, batch: ProgressBatch):
+        for item in batch.items:
+            count = item["count"]
+            index = item["index"]
+            file = item["file"]
+            if item["write"]:
+                print(
+                    f"[{index}/{count}] generate {file!r}, because the file or config has been modified."
+                )
+            else:
+                print(
+                    f"[{index}/{count}] skip {file!r}, because the file or config has not been modified."
+                )
 
 
 def _action_coder_generate(
@@ -101,6 +97,7 @@ def _action_coder_generate(
     files: list[str] | None,
     sid: str | None,
     socketio: SocketIO | None = None,
+    jobs: int = 1,
 ) -> bool:
     summary = SummaryUtils.load_summary(project.vendor, project.targetChip)
     coder = Coder(project, summary)
@@ -108,17 +105,18 @@ def _action_coder_generate(
     if sid:
         slot.sid = sid
         slot.socketio = socketio
-        coder.emitter["generate"].connect(slot.on_sio_generate_progress)
+        emitter = ProgressEmitter(slot.on_sio_generate_progress)
+    elif progress:
+        emitter = ProgressEmitter(slot.on_generate_progress)
     else:
-        if progress:
-            coder.emitter["generate"].connect(slot.on_generate_progress)
-        else:
-            coder.emitter["generate"].connect(slot.on_generate)
+        # every file is printed, batching only saves calls
+        emitter = ProgressEmitter(slot.on_generate)
 
     if isinstance(files, list):
         if len(files) == 1 and files[0] == "all":
             files = None
-    coder.generate(path, files)
+    with emitter.connected_to(coder.emitter["generate"]):
+        coder.generate(path, files, jobs)
 
     return True
 
@@ -130,6 +128,10 @@ def action_coder_generate(
     files: list[str] | None = None,
     sid: str | None = None,
     socketio: SocketIO | None = None,
+    jobs: int = 1,
 ) -> bool:
-    with __lock:
-        return _action_coder_generate(project, path, progress, files, sid, socketio)
+    # generations of different projects may run side by side
+    with project_lock(project):
+        return _action_coder_generate(
+            project, path, progress, files, sid, socketio, jobs
+        )
@@ -22,19 +22,22 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-29     xqyjlj       initial version
+# 2026-10-18     xqyjlj       lock per package destination inside Package
+# 2026-10-18     xqyjlj       emit progress through the given socketio
+# 2026-10-18     xqyjlj       rate-limit progress with ProgressEmitter
+# 2026-10-18     xqyjlj       show the install progress in bytes
+# 2026-10-18     xqyjlj       show the bytes an upgrade saved
 #
 
-import time
+from contextlib import ExitStack
 
 import proto.sio_package_install_pb2 as sio_package_install_pb2
-from flask_socketio import SocketIO, emit
-from gevent.lock import Semaphore
+from flask_socketio import SocketIO
 from loguru import logger
 from packages.description import PackageDescription
 from packages.package import Package
 from tqdm import tqdm
-
-__lock = Semaphore()
+from utils.progress import ProgressBatch, ProgressEmitter
 
 
 class __Slot:
@@ -42,54 +45,45 @@ class __Slot:
         self.__generated_bar = None
         self.sid = ""
         self.socketio: SocketIO | None = None
-        self.__last_emit_time = 0
 
-    def on_install_progress(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
+    def on_install_progress(self, batch: ProgressBatch):
         if self.__generated_bar is None:
-            self.__generated_bar = tqdm(total=count, desc="install", unit="file")
-        self.__generated_bar.set_description(f"install {file}")
-        self.__generated_bar.n = index
+            self.__generated_bar = tqdm(
+                total=batch.total, desc="install", unit="B", unit_scale=True
+            )
+        self.__generated_bar.set_description(f"install {batch.file}")
+        self.__generated_bar.n = batch.size
+        if batch.saved:
+            saved = tqdm.format_sizeof(batch.saved)
+            self.__generated_bar.set_postfix_str(f"saved {saved}B", refresh=False)
         self.__generated_bar.refresh()
 
-        if index == count:
+        if batch.done:
             self.__generated_bar.set_description("install")
             self.__generated_bar.close()
             self.__generated_bar = None
 
-    def on_sio_install_progress(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
-
-        # Throttle emissions to at most every 500ms
-        current_time = time.time()
-        time_since_last_emit = current_time - self.__last_emit_time
-
-        # Always emit the final progress update or if enough time has passed
-        if index == count or time_since_last_emit >= 0.05:
-            progress = sio_package_install_pb2.SioPackageInstallProgress(
-                count=count,
-                index=index,
-                file=file,
-            )
-            emit(
+    def on_sio_install_progress(self, batch: ProgressBatch):
+        progress = sio_package_install_pb2.SioPackageInstallProgress(
+            count=batch.count,
+            index=batch.index,
+            file=batch.file,
+            files=batch.files,
+            size=batch.size,
+            total=batch.total,
+            saved=batch.saved,
+        )
+        if self.socketio:
+            self.socketio.emit(
                 "package/install.progress",
                 progress.SerializeToString(),
                 to=self.sid,
             )
-            if self.socketio:
-                self.socketio.sleep(0)
-            self.__last_emit_time = current_time
-
-    def on_install(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
+            self.socketio.sleep(0)
 
-        print(f"[{index}/{count}] install {file}")
+    def on_install(self, batch: ProgressBatch):
+        for item in batch.items:
+            print(f"[{item['index']}/{item['count'] or '?'}] install {item['file']}")
 
 
 def _action_package_install(
@@ -101,16 +95,20 @@ def _action_package_install(
 ) -> PackageDescription | None:
     package = Package()
     slot = __Slot()
+    emitters = []
     if sid and socketio:
         slot.sid = sid
         slot.socketio = socketio
-        package.emitter["install"].connect(slot.on_sio_install_progress)
+        emitters.append(ProgressEmitter(slot.on_sio_install_progress))
     else:
         if progress:
-            package.emitter["install"].connect(slot.on_install_progress)
+            emitters.append(ProgressEmitter(slot.on_install_progress))
         if verbose:
-            package.emitter["install"].connect(slot.on_install)
-    package_desc = package.install(path)
+            emitters.append(ProgressEmitter(slot.on_install))
+    with ExitStack() as stack:
+        for emitter in emitters:
+            stack.enter_context(emitter.connected_to(package.emitter["install"]))
+        package_desc = package.install(path)
     if package_desc is None:
         logger.error(f"Failed to install {path}")
         return package_desc
@@ -128,5 +126,5 @@ def action_package_install(
     sid: str | None = None,
     socketio: SocketIO | None = None,
 ) -> PackageDescription | None:
-    with __lock:
-        return _action_package_install(path, progress, verbose, sid, socketio)
+    # Package.install locks the destination folder and the package index
+    return _action_package_install(path, progress, verbose, sid, socketio)
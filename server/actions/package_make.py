@@ -22,13 +22,18 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-11-17     xqyjlj       initial version
+# 2026-10-18     xqyjlj       rate-limit progress with ProgressEmitter
+# 2026-10-18     xqyjlj       choose the package format, level and jobs
 #
 
+from contextlib import ExitStack
+
 from flask_socketio import emit
 from loguru import logger
 from packages.description import PackageDescription
 from packages.package import Package
 from tqdm import tqdm
+from utils.progress import ProgressBatch, ProgressEmitter
 
 
 class __Slot:
@@ -36,53 +41,64 @@ class __Slot:
         self.__generated_bar = None
         self.sid = ""
 
-    def on_make_progress(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
+    def on_make_progress(self, batch: ProgressBatch):
         if self.__generated_bar is None:
-            self.__generated_bar = tqdm(total=count, desc="make", unit="file")
-        self.__generated_bar.set_description(f"make {file}")
-        self.__generated_bar.n = index
+            self.__generated_bar = tqdm(total=batch.count, desc="make", unit="file")
+        self.__generated_bar.set_description(f"make {batch.file}")
+        self.__generated_bar.n = batch.index
         self.__generated_bar.refresh()
 
-        if index == count:
+        if batch.done:
             self.__generated_bar.set_description("make")
             self.__generated_bar.close()
             self.__generated_bar = None
 
-    def on_sio_make_progress(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
+    def on_sio_make_progress(self, batch: ProgressBatch):
         emit(
             "package/make.progress",
-            {"count": count, "index": index, "file": file},
+            {
+                "count": batch.count,
+                "index": batch.index,
+                "file": batch.file,
+                "files": batch.files,
+            },
             to=self.sid,
         )
 
-    def on_make(self, sender, **kwargs):
-        count = kwargs["count"]
-        index = kwargs["index"]
-        file = kwargs["file"]
-
-        print(f"[{index}/{count}] make {file}")
+    def on_make(self, batch: ProgressBatch):
+        for item in batch.items:
+            print(f"[{item['index']}/{item['count']}] make {item['file']}")
 
 
 def action_package_make(
-    path: str, progress: bool, verbose: bool, sid: str | None = None
+    path: str,
+    progress: bool,
+    verbose: bool,
+    sid: str | None = None,
+    fmt: str = "auto",
+    level: int | None = None,
+    jobs: int = 0,
 ) -> PackageDescription | None:
     package = Package()
     slot = __Slot()
+    emitters = []
     if sid:
         slot.sid = sid
-        package.emitter["make"].connect(slot.on_sio_make_progress)
+        emitters.append(ProgressEmitter(slot.on_sio_make_progress))
     else:
         if progress:
-            package.emitter["make"].connect(slot.on_make_progress)
+            emitters.append(ProgressEmitter(slot.on_make_progress))
         if verbose:
-            package.emitter["make"].connect(slot.on_make)
-    package_desc = package.make(path)
+            emitters.append(ProgressEmitter(slot.on_make))
+    with ExitStack() as stack:
+        for emitter in emitters:
+            stack.enter_context(emitter.connected_to(package.emitter["make"]))
+        try:
+            package_desc = package.make(path, fmt, level, jobs)
+        except ValueError as e:
+            # an unknown format or a level out of its range
+            logger.error(e)
+            return None
     if package_desc is None:
         logger.error(f"Failed to make {path}")
         return package_desc
@@ -22,14 +22,12 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-11-22     xqyjlj       initial version
+# 2026-10-18     xqyjlj       lock per package destination inside Package
 #
 
-from gevent.lock import Semaphore
 from loguru import logger
 from packages.package import Package
 
-__lock = Semaphore()
-
 
 def _action_package_uninstall(kind: str, name: str, version: str) -> bool:
     package = Package()
@@ -40,5 +38,5 @@ def _action_package_uninstall(kind: str, name: str, version: str) -> bool:
 
 
 def action_package_uninstall(kind: str, name: str, version: str) -> bool:
-    with __lock:
-        return _action_package_uninstall(kind, name, version)
+    # Package.uninstall locks the package folder and the package index
+    return _action_package_uninstall(kind, name, version)
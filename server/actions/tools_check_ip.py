@@ -22,6 +22,7 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-10-09     xqyjlj       initial version
+# 2026-10-18     xqyjlj       split the checks from the printing for the daemon
 #
 
 from dataclasses import dataclass
@@ -307,41 +308,53 @@ class IpChecker:
 
     def print_results(self):
         """打印详细的检查结果"""
-        if self.warnings:
-            logger.warning("[!] Warnings:")
-            for warning in self.warnings:
-                logger.warning(f"  - [{warning.id}] {warning}")
-
-        if self.errors:
-            logger.error("[x] Errors:")
-            for error in self.errors:
-                logger.error(f"  - [{error.id}] {error}")
-        else:
-            logger.success("[OK] All checks passed!")
-
-        # 汇总
-        if self.errors:
-            logger.error(
-                f"Summary: {len(self.errors)} error(s), {len(self.warnings)} warning(s)"
-            )
-        elif self.warnings:
-            logger.warning(f"Summary: {len(self.warnings)} warning(s)")
-        else:
-            logger.success("Summary: No issues found")
+        print_check_results(
+            [f"[{error.id}] {error}" for error in self.errors],
+            [f"[{warning.id}] {warning}" for warning in self.warnings],
+        )
 
 
-def action_tools_check_ip(ip: Ip) -> bool:
+def print_check_results(errors: list[str], warnings: list[str]):
     """
-    检查 IP 配置的有效性。
+    打印已格式化的检查结果，也用于守护进程返回的结果。
+
+    Args:
+        errors: "[id] 描述" 形式的错误
+        warnings: "[id] 描述" 形式的警告
+    """
+    if warnings:
+        logger.warning("[!] Warnings:")
+        for warning in warnings:
+            logger.warning(f"  - {warning}")
+
+    if errors:
+        logger.error("[x] Errors:")
+        for error in errors:
+            logger.error(f"  - {error}")
+    else:
+        logger.success("[OK] All checks passed!")
+
+    # 汇总
+    if errors:
+        logger.error(f"Summary: {len(errors)} error(s), {len(warnings)} warning(s)")
+    elif warnings:
+        logger.warning(f"Summary: {len(warnings)} warning(s)")
+    else:
+        logger.success("Summary: No issues found")
+
+
+def check_ip(ip: Ip) -> tuple[IpChecker, bool] | None:
+    """
+    运行所有检查，不打印结果。
 
     Args:
         ip: 要检查的 IP 对象
 
     Returns:
-        所有检查通过返回 True，否则返回 False
+        检查器及是否全部通过，IP 为空时返回 None
     """
     if not ip.origin:
-        return False
+        return None
 
     checker = IpChecker(ip)
 
@@ -349,7 +362,26 @@ def action_tools_check_ip(ip: Ip) -> bool:
     param_valid = checker.check_parameters()
     container_valid = checker.check_containers()
 
+    return checker, param_valid and container_valid
+
+
+def action_tools_check_ip(ip: Ip) -> bool:
+    """
+    检查 IP 配置的有效性。
+
+    Args:
+        ip: 要检查的 IP 对象
+
+    Returns:
+        所有检查通过返回 True，否则返回 False
+    """
+    result = check_ip(ip)
+    if result is None:
+        return False
+
+    checker, valid = result
+
     # 打印详细结果
     checker.print_results()
 
-    return param_valid and container_valid
+    return valid
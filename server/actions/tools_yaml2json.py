@@ -22,6 +22,7 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-10-19     xqyjlj       initial version
+# 2026-10-18     xqyjlj       load with the safe loader
 #
 
 import glob
@@ -30,7 +31,7 @@ import os
 from pathlib import Path
 
 from loguru import logger
-from ruamel.yaml import YAML
+from utils.io import IoUtils
 
 
 def action_tools_yaml2json(path: str) -> bool:
@@ -46,9 +47,7 @@ def action_tools_yaml2json(path: str) -> bool:
         file = Path(yaml_file)
         json_file = file.parent / f"{file.stem}.json"
 
-        with open(yaml_file, "r", encoding="utf-8") as fp:
-            yaml = YAML()
-            yaml_data = yaml.load(fp)
+        yaml_data = IoUtils.read_yaml(yaml_file)
 
         with open(json_file, "w", encoding="utf-8") as fp:
             json.dump(yaml_data, fp, indent=4, ensure_ascii=False)
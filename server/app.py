@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        app.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       serve the cli in client mode
+# 2026-10-18     xqyjlj       negotiate and compress the rest responses
+# 2026-10-18     xqyjlj       resolve delta dump content per sid
+# 2026-10-18     xqyjlj       add the sio/project/patch event
+# 2026-10-18     xqyjlj       load projects and describe packages as the jobs do
+#
+
+import datetime
+import functools
+import json
+import os
+import time
+
+import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
+import proto.sio_job_pb2 as sio_job_pb2
+import proto.sio_package_description_pb2 as sio_package_description_pb2
+import proto.sio_package_list_pb2 as sio_package_list_pb2
+import proto.sio_package_uninstall_pb2 as sio_package_uninstall_pb2
+import proto.sio_project_patch_pb2 as sio_project_patch_pb2
+import proto.sio_tools_check_ip_pb2 as sio_tools_check_ip_pb2
+from actions.coder_dump import action_coder_dump
+from actions.coder_generate import action_coder_generate
+from actions.package_description import action_package_description
+from actions.package_install import action_package_install
+from actions.package_list import action_package_list
+from actions.package_uninstall import action_package_uninstall
+from actions.tools_check_ip import check_ip
+from flask import Flask, Response, abort, g, jsonify, request
+from flask_socketio import SocketIO
+from jobs.handlers import description_message, load_project
+from jobs.scheduler import JobScheduler
+from jobs.session import SESSIONS
+from jobs.worker import LOG_LEVEL_ENV
+from loguru import logger
+from utils.content import ContentUtils
+from utils.ip import IpUtils
+from utils.lock import LockManager
+from utils.metrics import METRICS
+from utils.progress import INTERVAL_ENV
+from utils.sys import SysUtils
+
+app = Flask("csp-server")
+socketio = SocketIO(app, cors_allowed_origins="*")
+scheduler = JobScheduler(socketio)
+client_online = {}
+
+HTTP_REQUESTS = METRICS.counter(
+    "csp_http_requests_total",
+    "REST requests by route, method and status.",
+    ("route", "method", "status"),
+)
+HTTP_LATENCY = METRICS.histogram(
+    "csp_http_request_seconds", "REST request latency by route.", ("route",)
+)
+SIO_EVENTS = METRICS.counter(
+    "csp_sio_events_total",
+    "Socket events by event and status (ok/error).",
+    ("event", "status"),
+)
+SIO_LATENCY = METRICS.histogram(
+    "csp_sio_event_seconds",
+    "Socket handler latency by event, jobs are measured separately.",
+    ("event",),
+)
+
+
+@app.before_request
+def before_request():
+    g.metrics_start = time.perf_counter()
+
+
+@app.after_request
+def after_request(response: Response):
+    start = g.get("metrics_start")
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else "unknown"
+        HTTP_REQUESTS.inc(
+            route=route, method=request.method, status=str(response.status_code)
+        )
+        HTTP_LATENCY.observe(time.perf_counter() - start, route=route)
+    return ContentUtils.compress(response)
+
+
+def on_event(event: str):
+    """``socketio.on`` that also records the count and latency of the event."""
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(*args):
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = handler(*args)
+                status = "ok"
+                return result
+            finally:
+                SIO_EVENTS.inc(event=event, status=status)
+                SIO_LATENCY.observe(time.perf_counter() - start, event=event)
+
+        return socketio.on(event)(wrapper)
+
+    return decorator
+
+
+@app.route("/api/coder/dump", methods=["POST"])
+def api_coder_dump():
+    payload = request.json
+    if payload is None:
+        logger.error("Called with missing JSON payload")
+        abort(400, description="Missing JSON payload.")
+
+    logger.trace(f"Call api/coder/dump with {payload!r}")
+
+    arg_content = payload.get("content")
+    arg_path = payload.get("path")
+    arg_diff = payload.get("diff", False)
+
+    if not isinstance(arg_path, str):
+        logger.error(f"Called with invalid path: {arg_path!r}")
+        abort(400, description="'path' must be a file path string")
+
+    try:
+        project = load_project(arg_content, arg_path)
+    except ValueError as e:
+        abort(400, description=str(e))
+    try:
+        files = action_coder_dump(project, arg_diff, arg_path, arg_content)
+    except Exception as e:
+        logger.exception(f"Dump failed: {str(e)!r}")
+        abort(500, description=str(e))
+    if files is None or len(files) == 0:
+        abort(500, description="Unknown error, please see more in server log")
+
+    # json by default, protobuf or msgpack on request
+    return ContentUtils.respond(
+        {"files": files},
+        lambda: sio_coder_dump_pb2.SioCoderDumpResponse(
+            success=True, files=files, count=len(files)
+        ),
+    )
+
+
+@app.route("/api/coder/generate", methods=["POST"])
+def api_coder_generate():
+    payload = request.json
+    if payload is None:
+        logger.error("Called with missing JSON payload")
+        abort(400, description="Missing JSON payload.")
+
+    logger.trace(f"Call api/coder/generate with {payload!r}")
+
+    arg_path = payload.get("path")
+    arg_output = payload.get("output")
+
+    if not isinstance(arg_path, str):
+        logger.error(f"Called with invalid file path: {arg_path!r}")
+        abort(400, description="'file' must be a file path string")
+
+    try:
+        project = load_project(None, arg_path)
+    except ValueError as e:
+        abort(400, description=str(e))
+
+    try:
+        result = action_coder_generate(project, arg_output, False)
+        if not result:
+            abort(500, description="Generation failed, please see more in server log")
+        return jsonify({"success": True})
+    except Exception as e:
+        logger.exception(f"Generate failed: {str(e)!r}")
+        abort(500, description=str(e))
+
+
+@app.route("/api/package/install", methods=["POST"])
+def api_package_install():
+    payload = request.json
+    if payload is None:
+        logger.error("Called with missing JSON payload")
+        abort(400, description="Missing JSON payload.")
+
+    arg_path = payload.get("path")
+
+    logger.trace(f"Call api/package/install with {payload!r}")
+
+    if not isinstance(arg_path, str):
+        logger.error(f"Called with invalid path: {arg_path!r}")
+        abort(400, description="'path' must be a file path string")
+
+    try:
+        package_desc = action_package_install(arg_path, False, False)
+        if package_desc is None:
+            abort(500, description="Unknown error, please see more in server log")
+        return jsonify(package_desc.origin)
+    except Exception as e:
+        logger.exception(f"Install failed: {str(e)!r}")
+        abort(500, description=str(e))
+
+
+@app.route("/api/package/list", methods=["GET"])
+def api_package_list():
+    logger.trace(f"Call api/package/list")
+    try:
+        result = action_package_list()
+    except Exception as e:
+        logger.exception(f"List failed: {str(e)!r}")
+        abort(500, description=str(e))
+
+    # json by default, protobuf or msgpack on request
+    return ContentUtils.respond(
+        result,
+        lambda: sio_package_list_pb2.SioPackageListResponse(
+            success=True, packages=result
+        ),
+    )
+
+
+@app.route("/api/metrics", methods=["GET"])
+def api_metrics():
+    # prometheus text format
+    return Response(
+        METRICS.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.route("/api/server/info", methods=["GET"])
+def api_server_info():
+    # checked by the cli before forwarding a command to this server
+    return jsonify(
+        {
+            "version": SysUtils.version(),
+            "packages": SysUtils.packages_folder(),
+            "database": SysUtils.database_folder(),
+        }
+    )
+
+
+@app.route("/api/server/jobs", methods=["GET"])
+def api_server_jobs():
+    # size and load of the job worker pool
+    return jsonify(scheduler.stats())
+
+
+@app.route("/api/server/locks", methods=["GET"])
+def api_server_locks():
+    # wait statistics of the project and package locks
+    return jsonify(LockManager.all_stats())
+
+
+@app.route("/api/client/online", methods=["GET"])
+def online():
+    payload = request.args.to_dict()
+
+    arg_id = payload.get("id")
+
+    logger.trace(f"Call api/client/online with {payload!r}")
+
+    if not isinstance(arg_id, str):
+        logger.error(f"Called with invalid id: {arg_id!r}")
+        abort(400, description="'id' must be a string")
+
+    client_online.setdefault(arg_id, {"time": datetime.datetime.now()})
+
+    return jsonify({"success": True})
+
+
+@app.route("/api/client/offline", methods=["GET"])
+def offline():
+    payload = request.args.to_dict()
+
+    arg_id = payload.get("id")
+
+    logger.trace(f"Call api/client/offline with {payload!r}")
+
+    if not isinstance(arg_id, str):
+        logger.error(f"Called with invalid id: {arg_id!r}")
+        abort(400, description="'id' must be a string")
+
+    if arg_id in client_online:
+        del client_online[arg_id]
+
+    if len(client_online.keys()) == 0:
+        logger.info("No client online, the server will be closed.")
+        os._exit(0)
+
+    return jsonify({"success": True})
+
+
+# ------------------------------------------------------------------------------
+
+
+@on_event("sio/coder/dump")
+def sio_coder_dump(data: bytes):
+    # args: (content: str, path: str, diff: bool=False, stream: bool=False, chunk_size: int=0, compression: int=0,
+    #        content_data?: bytes, content_encoding?: int, content_delta?: bool, content_session?: bool)
+    # emit:
+    #   job/status (id: str, kind: str, state: SioJobState)
+    #   coder/dump.result (success: bool, result?: dict, error?: str, streamed?: bool, count?: int)
+    #   coder/dump.progress (count: int, index: int, file: str)
+    #   coder/dump.frame (file: str, chunk: int, chunks: int, data: bytes, compression: int, diff?: str), only if stream
+    sid: str = request.sid  # type: ignore
+    try:
+        # a delta needs the previous content of this sid, which only we keep
+        data = SESSIONS.resolve_dump(sid, data)
+    except Exception as e:
+        logger.error(f"{sid!r} sent an unresolvable dump: {str(e)!r}")
+        socketio.emit(
+            "coder/dump.result",
+            sio_coder_dump_pb2.SioCoderDumpResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+        return
+    scheduler.submit("coder/dump", sid, data)
+
+
+@on_event("sio/project/patch")
+def sio_project_patch(data: bytes):
+    # args: (ops: bytes, revision?: int)
+    # emit:
+    #   project/patch.result (success: bool, error?: str, revision: int)
+    sid: str = request.sid  # type: ignore
+    msg = sio_project_patch_pb2.SioProjectPatchRequest()
+    msg.ParseFromString(data)
+    session = SESSIONS.get(sid)
+
+    logger.trace(
+        f"{sid!r} calling sio/project/patch with ops:{msg.ops!r}, revision:{msg.revision!r}"
+    )
+    try:
+        session.patch(json.loads(msg.ops), msg.revision)
+    except Exception as e:
+        logger.error(f"Patch failed: {str(e)!r}")
+        socketio.emit(
+            "project/patch.result",
+            sio_project_patch_pb2.SioProjectPatchResponse(
+                success=False,
+                error=str(e),
+                revision=session.revision,
+            ).SerializeToString(),
+            to=sid,
+        )
+        return
+
+    socketio.emit(
+        "project/patch.result",
+        sio_project_patch_pb2.SioProjectPatchResponse(
+            success=True,
+            revision=session.revision,
+        ).SerializeToString(),
+        to=sid,
+    )
+
+
+@on_event("sio/coder/generate")
+def sio_coder_generate(data: bytes):
+    # args: (path: str, output: str, files?: str[])
+    # emit:
+    #   job/status (id: str, kind: str, state: SioJobState)
+    #   coder/generate.result (success: bool, error?: str)
+    #   coder/generate.progress (count: int, index: int, file: str, write: bool)
+    sid: str = request.sid  # type: ignore
+    scheduler.submit("coder/generate", sid, data)
+
+
+@on_event("sio/package/install")
+def sio_package_install(data: bytes):
+    # args: (path: str)
+    # emit:
+    #   job/status (id: str, kind: str, state: SioJobState)
+    #   package/install.result (success: bool, error?: str)
+    #   package/install.progress (count: int, index: int, file: str)
+    sid: str = request.sid  # type: ignore
+    scheduler.submit("package/install", sid, data)
+
+
+@on_event("sio/job/cancel")
+def sio_job_cancel(data: bytes):
+    # args: (id: str)
+    # emit:
+    #   job/cancel.result (success: bool, error?: str)
+    sid: str = request.sid  # type: ignore
+
+    msg = sio_job_pb2.SioJobCancelRequest()
+    msg.ParseFromString(data)
+    arg_id = msg.id
+
+    logger.trace(f"{sid!r} calling sio/job/cancel with id:{arg_id!r}")
+
+    error = scheduler.cancel(arg_id, sid)
+    socketio.emit(
+        "job/cancel.result",
+        sio_job_pb2.SioJobCancelResponse(
+            success=error is None,
+            error=error,
+        ).SerializeToString(),
+        to=sid,
+    )
+
+
+@on_event("disconnect")
+def sio_disconnect(*args):
+    sid: str = request.sid  # type: ignore
+    scheduler.cancel_sid(sid)
+    SESSIONS.drop(sid)
+
+
+@on_event("sio/package/uninstall")
+def sio_package_uninstall(data: bytes):
+    # args: (type: str, name: str, version: str)
+    # emit:
+    #   package/uninstall.result (success: bool, error?: str)
+    sid: str = request.sid  # type: ignore
+
+    msg = sio_package_uninstall_pb2.SioPackageUninstallRequest()
+    msg.ParseFromString(data)
+    arg_type = msg.type
+    arg_name = msg.name
+    arg_version = msg.version
+
+    logger.trace(
+        f"{sid!r} calling sio/package/uninstall with type:{arg_type!r}, name:{arg_name!r}, version:{arg_version!r}"
+    )
+
+    try:
+        result = action_package_uninstall(arg_type, arg_name, arg_version)
+        if result:
+            socketio.emit(
+                "package/uninstall.result",
+                sio_package_uninstall_pb2.SioPackageUninstallResponse(
+                    success=True,
+                ).SerializeToString(),
+                to=sid,
+            )
+        else:
+            socketio.emit(
+                "package/uninstall.result",
+                sio_package_uninstall_pb2.SioPackageUninstallResponse(
+                    success=False,
+                    error="Unknown error, please see more in server log",
+                ).SerializeToString(),
+                to=sid,
+            )
+    except Exception as e:
+        logger.exception(f"Uninstall failed: {str(e)!r}")
+        socketio.emit(
+            "package/uninstall.result",
+            sio_package_uninstall_pb2.SioPackageUninstallResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+@on_event("sio/package/list")
+def sio_package_list():
+    # emit:
+    #   package/list.result (success: bool, error?: str, result?: dict)
+    sid: str = request.sid  # type: ignore
+    logger.trace(f"{sid!r} calling sio/package/list")
+    try:
+        result = action_package_list()
+        socketio.emit(
+            "package/list.result",
+            sio_package_list_pb2.SioPackageListResponse(
+                success=True,
+                packages=result,
+            ).SerializeToString(),
+            to=sid,
+        )
+    except Exception as e:
+        logger.exception(f"List failed: {str(e)!r}")
+        socketio.emit(
+            "package/list.result",
+            sio_package_list_pb2.SioPackageListResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+@on_event("sio/package/description")
+def sio_package_description(data: bytes):
+    # args: (type: str, name: str, version: str)
+    # emit:
+    #   package/description.result (success: bool, error?: str, result?: dict)
+    sid: str = request.sid  # type: ignore
+    msg = sio_package_description_pb2.SioPackageDescriptionRequest()
+    msg.ParseFromString(data)
+    arg_type = msg.type
+    arg_name = msg.name
+    arg_version = msg.version
+
+    logger.trace(
+        f"{sid!r} calling sio/package/description with type:{arg_type!r}, name:{arg_name!r}, version:{arg_version!r}"
+    )
+    try:
+        package_desc = action_package_description(arg_type, arg_name, arg_version)
+        if package_desc is None:
+            socketio.emit(
+                "package/description.result",
+                sio_package_description_pb2.SioPackageDescriptionResponse(
+                    success=False,
+                    error="Unknown error, please see more in server log",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        socketio.emit(
+            "package/description.result",
+            sio_package_description_pb2.SioPackageDescriptionResponse(
+                success=True,
+                description=description_message(package_desc),
+            ).SerializeToString(),
+            to=sid,
+        )
+    except Exception as e:
+        logger.exception(f"Description failed: {str(e)!r}")
+        socketio.emit(
+            "package/description.result",
+            sio_package_description_pb2.SioPackageDescriptionResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+@on_event("sio/tools/check-ip")
+def sio_tools_check_ip(data: bytes):
+    # args: (path?: str, vendor?: str, name?: str, type?: str)
+    # emit:
+    #   tools/check-ip.result (success: bool, error?: str, valid: bool, errors: str[], warnings: str[])
+    sid: str = request.sid  # type: ignore
+    msg = sio_tools_check_ip_pb2.SioToolsCheckIpRequest()
+    msg.ParseFromString(data)
+
+    logger.trace(
+        f"{sid!r} calling sio/tools/check-ip with path:{msg.path!r}, vendor:{msg.vendor!r}, name:{msg.name!r}, type:{msg.type!r}"
+    )
+    try:
+        if msg.path:
+            ip = IpUtils.load_ip_from_file(msg.path)
+        else:
+            ip = IpUtils.load_ip(msg.vendor, msg.type, msg.name)
+        result = check_ip(ip)
+        if result is None:
+            socketio.emit(
+                "tools/check-ip.result",
+                sio_tools_check_ip_pb2.SioToolsCheckIpResponse(
+                    success=False,
+                    error="Failed to load the ip, please see more in server log",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        checker, valid = result
+        socketio.emit(
+            "tools/check-ip.result",
+            sio_tools_check_ip_pb2.SioToolsCheckIpResponse(
+                success=True,
+                valid=valid,
+                errors=[f"[{error.id}] {error}" for error in checker.errors],
+                warnings=[f"[{warning.id}] {warning}" for warning in checker.warnings],
+            ).SerializeToString(),
+            to=sid,
+        )
+    except Exception as e:
+        logger.exception(f"Check ip failed: {str(e)!r}")
+        socketio.emit(
+            "tools/check-ip.result",
+            sio_tools_check_ip_pb2.SioToolsCheckIpResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+def serve(
+    port: int, debug: bool, workers: int, progress_interval: float, log_level: str
+):
+    # inherited by the job worker processes
+    os.environ[LOG_LEVEL_ENV] = log_level
+    os.environ[INTERVAL_ENV] = str(progress_interval)
+    scheduler.start(workers)
+
+    logger.info(f"Serving on http://127.0.0.1:{port}")
+    socketio.run(app, host="0.0.0.0", port=port, debug=debug, use_reloader=False)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        bytecode_cache.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       count hits and misses in metrics
+# 2026-10-18     xqyjlj       evict single buckets, tolerate a removed folder
+#
+
+import os
+from pathlib import Path
+
+import jinja2
+from jinja2.bccache import Bucket
+from loguru import logger
+from utils.metrics import CACHE_REQUESTS
+from utils.sys import SysUtils
+
+
+class BytecodeCache(jinja2.FileSystemBytecodeCache):
+    """
+    On-disk jinja2 bytecode cache, one folder per hal package version.
+
+    Buckets are keyed by jinja2 version, template name, template file and the
+    checksum of the template source, so a changed template or a jinja2 upgrade
+    never hits stale bytecode. When the whole cache grows over ``max_size``
+    bytes, the least recently used buckets of all hal versions are removed.
+    """
+
+    MAX_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, hal: str, version: str, max_size: int = MAX_SIZE):
+        self._root = Path(SysUtils.cache_folder()) / "jinja2"
+        folder = self._root / (hal or "unknown") / (version or "unknown")
+        folder.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(folder), "%s.cache")
+
+        self._folder = folder
+        self._max_size = max_size
+        self.evict()
+
+    def get_bucket(
+        self,
+        environment: jinja2.Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = self.get_cache_key(f"{jinja2.__version__}|{checksum}|{name}", filename)
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        CACHE_REQUESTS.inc(
+            cache="jinja2", result="miss" if bucket.code is None else "hit"
+        )
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            return
+        # mark the bucket as recently used
+        try:
+            os.utime(self._get_cache_filename(bucket))
+        except OSError:
+            pass
+
+    def dump_bytecode(self, bucket: Bucket):
+        # another process may have evicted the whole folder
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except FileNotFoundError:
+            logger.debug(f"skip jinja2 bytecode cache {self.directory!r}")
+
+    def evict(self):
+        buckets = []
+        total = 0
+        # in-progress writes end with ``.tmp``, never touch them
+        for file in self._root.glob("*/*/*.cache"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            buckets.append((stat.st_mtime, stat.st_size, file))
+            total += stat.st_size
+
+        if total <= self._max_size:
+            return
+
+        for _, size, file in sorted(buckets):
+            logger.debug(f"evict jinja2 bytecode cache {str(file)!r}")
+            try:
+                file.unlink()
+            except OSError:
+                pass
+            total -= size
+            if total <= self._max_size:
+                break
+
+        # fails on folders still holding buckets or written to
+        for folder in (*self._root.glob("*/*"), *self._root.glob("*")):
+            if folder in (self._folder, self._folder.parent):
+                continue
+            try:
+                folder.rmdir()
+            except OSError:
+                pass
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        cache.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       count hits and misses in metrics
+#
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+from public.csp.project import Project
+from utils.metrics import CACHE_REQUESTS
+from utils.summary import SummaryUtils
+from utils.sys import SysUtils
+
+from .coder import Coder
+
+
+class CoderCache:
+    """
+    Keep warm ``Coder`` instances for the serve mode.
+
+    An entry is keyed by ``(project path, hal, halVersion)`` and is only reused
+    while the fingerprint of the files it was built from (summary, package
+    index, generator sources) is unchanged.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self._capacity = capacity
+        self._entries: OrderedDict[tuple[str, str, str], tuple[tuple, Coder]] = (
+            OrderedDict()
+        )
+
+    def get(self, project: Project) -> Coder:
+        key = (project.path(), project.gen.hal, project.gen.halVersion)
+        fingerprint = self._fingerprint(project)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            coder = entry[1]
+            coder.rebind(project)
+            self._entries.move_to_end(key)
+            logger.trace(f"coder cache hit for {key!r}")
+            CACHE_REQUESTS.inc(cache="coder", result="hit")
+            return coder
+
+        logger.trace(f"coder cache miss for {key!r}")
+        CACHE_REQUESTS.inc(cache="coder", result="miss")
+        summary = SummaryUtils.load_summary(project.vendor, project.targetChip)
+        coder = Coder(project, summary)
+        self._entries[key] = (fingerprint, coder)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+        return coder
+
+    def clear(self):
+        self._entries.clear()
+
+    @staticmethod
+    def _stat(path: str | Path) -> tuple:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return str(path), 0, -1
+        return str(path), st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _fingerprint(project: Project) -> tuple:
+        files = [
+            SummaryUtils.summary_file(project.vendor, project.targetChip),
+            os.path.join(SysUtils.database_folder(), "schema", "summary.yml"),
+            SysUtils.packages_index_file(),
+        ]
+        generator_folder = Path(project.hal_folder()) / "tools" / "generator"
+        if project.hal_folder() and generator_folder.is_dir():
+            files.extend(sorted(generator_folder.glob("*.py")))
+            files.extend(sorted((generator_folder / "filters").glob("*.py")))
+        return tuple(CoderCache._stat(file) for file in files)
+
+
+CODER_CACHE = CoderCache()
@@ -22,27 +22,54 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-07     xqyjlj       initial version
+# 2026-10-18     xqyjlj       support rebinding a warm coder to a new project
+# 2026-10-18     xqyjlj       only re-render dumped files whose configs changed
+# 2026-10-18     xqyjlj       support rendering on a process pool
+# 2026-10-18     xqyjlj       persist compiled templates in a bytecode cache
+# 2026-10-18     xqyjlj       extract user code in a single pass
+# 2026-10-18     xqyjlj       read every output file at most once per run
+# 2026-10-18     xqyjlj       skip unchanged files with the gen-state manifest
+# 2026-10-18     xqyjlj       add iter_dump to stream dumped files
+# 2026-10-18     xqyjlj       record phase timings and cache hits in metrics
+# 2026-10-18     xqyjlj       write generated files atomically
 #
 
 
+import copy
 import hashlib
+import json
 import os
-import re
 import sys
 import time
 import xml.etree.ElementTree as etree
 from pathlib import Path
 from types import ModuleType
+from typing import Iterator
 
 import jinja2
 from blinker import Signal
 from loguru import logger
 from public.csp.project import Project
 from public.csp.summary import Summary
+from utils.io import IoUtils
+from utils.metrics import CACHE_REQUESTS, METRICS
+from utils.summary import SummaryUtils
 from utils.sys import SYS_UTILS
 
+from .bytecode_cache import BytecodeCache
+from .dependency import ConfigsDependency, RenderRecord
 from .filters import FILTERS
+from .gen_state import GenState
 from .generator_loader import GeneratorLoader
+from .parallel import ParallelRenderer
+from .snapshot import FileSnapshot
+from .user_code import UserCodeScanner
+
+CODER_PHASE = METRICS.histogram(
+    "csp_coder_phase_seconds",
+    "Time spent in each phase of the coder, render and write are per file.",
+    ("phase",),
+)
 
 
 class Coder:
@@ -52,6 +79,10 @@ class Coder:
         self._summary = summary
         self.files_table = {}
         self._generator = None
+        self._environment: jinja2.Environment | None = None
+        self._dump_records: dict[str, RenderRecord] = {}
+        self._dump_state: tuple[str, dict] | None = None
+        self._snapshot = FileSnapshot()
 
         self.__emitter = {
             "dump": Signal("dump"),
@@ -65,6 +96,7 @@ class Coder:
         # 如果halVersion为空字符串，尝试使用"latest"版本号
         if not self._halVersion:
             from packages import Package
+
             index = Package().index()
             hal_versions = index.versions("hal", self._hal)
             if hal_versions:
@@ -80,12 +112,34 @@ class Coder:
 
         self._generator = self._load_generator()
         self.files_table = self._get_files_table()
+        self._project_fingerprint = self._fingerprint_project(self._project)
 
     @property
     def emitter(self):
         return self.__emitter
 
-    def generate(self, output: str | None = None, files: list[str] | None = None):
+    def rebind(self, project: Project, summary: Summary | None = None):
+        """
+        Point a warm coder at a new ``Project`` of the same hal package.
+
+        The generator, the filters and the jinja2 environment are kept, the files
+        table is only rebuilt when the project content has changed.
+        """
+        self._project = project
+        if summary is not None:
+            self._summary = summary
+
+        fingerprint = self._fingerprint_project(project)
+        if fingerprint != self._project_fingerprint:
+            self.files_table = self._get_files_table()
+            self._project_fingerprint = fingerprint
+
+    def generate(
+        self,
+        output: str | None = None,
+        files: list[str] | None = None,
+        jobs: int = 1,
+    ):
         if not self._check_hal_folder():
             return
 
@@ -93,7 +147,6 @@ class Coder:
             output = self._project.folder()
 
         data = self._get_loaded_data()
-        env = self._get_environment()
 
         gen_files = []
         for file, info in self.files_table.items():
@@ -112,12 +165,37 @@ class Coder:
             gen_files = l
 
         count = len(gen_files)
+        state = GenState(output, self._get_gen_state_key(data))
+        self._snapshot.clear()
+        stale = [
+            (file, self.files_table[file])
+            for file in gen_files
+            if not self._is_gen_state_fresh(
+                state, file, f"{output}/{file}".replace("\\", "/")
+            )
+        ]
+        CACHE_REQUESTS.inc(count - len(stale), cache="gen_state", result="hit")
+        CACHE_REQUESTS.inc(len(stale), cache="gen_state", result="miss")
+        rendered = iter(())
+        if len(stale) > 0:
+            rendered = self._render_files(stale, self._get_environment(), data, jobs)
+        stale_files = set(file for file, _ in stale)
+
         index = 0
         for file in gen_files:
-            info = self.files_table[file]
             index += 1
-            context = self._render(file, info, env, data)
             path = f"{output}/{file}".replace("\\", "/")
+            if file not in stale_files:
+                self.__emitter["generate"].send(
+                    "coder",
+                    file=path,
+                    index=index,
+                    count=count,
+                    write=False,
+                )
+                continue
+
+            context, reads = next(rendered)
             if context:
                 changed = self._check_file_changed(path, context)
                 if changed:
@@ -128,8 +206,10 @@ class Coder:
                         count=count,
                         write=True,
                     )
-                    with open(path, "w", encoding="utf-8") as file:
-                        file.write(context)
+                    with CODER_PHASE.time(phase="write"):
+                        # the user code blocks of a file survive a failed write
+                        IoUtils.write_text(path, context)
+                    self._snapshot.update(path, context)
                 else:
                     self.__emitter["generate"].send(
                         "coder",
@@ -138,8 +218,18 @@ class Coder:
                         count=count,
                         write=False,
                     )
+                state.set(
+                    file,
+                    self._get_gen_inputs(file, reads),
+                    reads,
+                    FileSnapshot.md5(context),
+                    path,
+                )
             else:
+                state.remove(file)
                 logger.error(f"file {path!r} gen failed.")
+        self._snapshot.clear()
+        state.save()
 
         for file, info in self.files_table.items():
             if not info.get("gen", True):
@@ -149,37 +239,78 @@ class Coder:
 
         self._copy_library()
 
-    def dump(self) -> dict:
+    def dump(self, jobs: int = 1) -> dict:
+        context_table = {}
+        for file, context in self.iter_dump(jobs):
+            if context is not None:
+                context_table[file] = context
+            else:
+                logger.error(f"file {file!r} gen failed.")
+        return context_table
+
+    def iter_dump(self, jobs: int = 1) -> Iterator[tuple[str, str | None]]:
+        """
+        Render the files in memory and yield ``(file, context)`` as soon as each
+        one is ready, ``context`` is ``None`` when the render failed.
+        """
         if len(self.files_table) == 0:
-            return {}
+            return
 
         data = self._get_loaded_data()
         env = self._get_environment()
+        changed = self._get_dump_changed_paths(env)
 
-        context_table = {}
-        count = 0
-        for file, info in self.files_table.items():
-            if info.get("gen", True):
-                count += 1
+        gen_files = [
+            (file, info)
+            for file, info in self.files_table.items()
+            if info.get("gen", True)
+        ]
+        count = len(gen_files)
+
+        stale = [
+            (file, info)
+            for file, info in gen_files
+            if not self._is_dump_record_valid(file, info, changed)
+        ]
+        CACHE_REQUESTS.inc(count - len(stale), cache="dump", result="hit")
+        CACHE_REQUESTS.inc(len(stale), cache="dump", result="miss")
+        self._snapshot.clear()
+        rendered = self._render_files(stale, env, data, jobs)
+        stale_files = set(file for file, _ in stale)
 
         index = 0
-        for file, info in self.files_table.items():
-            if info.get("gen", True):
+        completed = False
+        try:
+            for file, info in gen_files:
                 index += 1
-                suffix = Path(file).suffix
-                context = self._render(file, info, env, data)
+                if file in stale_files:
+                    context, reads = next(rendered)
+                    self._dump_records[file] = RenderRecord(
+                        info=copy.deepcopy(info),
+                        stat=self._stat_project_file(file),
+                        reads=reads,
+                        context=context,
+                    )
+                else:
+                    context = self._dump_records[file].context
                 self.__emitter["dump"].send(
                     "coder",
                     file=file,
                     index=index,
                     count=count,
                 )
-                if context is not None:
-                    context_table[file] = context
-                else:
-                    logger.error(f"file {file!r} gen failed.")
-
-        return context_table
+                yield file, context
+            completed = True
+        finally:
+            self._snapshot.clear()
+            if not completed:
+                # the records not reached yet are stale, start over next time
+                self._dump_state = None
+                self._dump_records.clear()
+
+        for file in list(self._dump_records):
+            if file not in self.files_table:
+                del self._dump_records[file]
 
     def files_list(self) -> list[str]:
         return list(self.files_table.keys())
@@ -190,7 +321,8 @@ class Coder:
 
         try:
             loader = GeneratorLoader(self._package_name, self._generator_folder)
-            return loader.load()
+            with CODER_PHASE.time(phase="load_generator"):
+                return loader.load()
         except Exception as e:
             logger.error(f"Failed to load generator: {e}")
             return None
@@ -198,7 +330,8 @@ class Coder:
     def _get_files_table(self) -> dict[str, dict[str, str]]:
         if self._generator is None:
             return {}
-        files = self._generator.files_table(self._project)
+        with CODER_PHASE.time(phase="files_table"):
+            files = self._generator.files_table(self._project)
         return files
 
     def _copy_library(self):
@@ -236,37 +369,35 @@ class Coder:
 
     @staticmethod
     def match_user(
-        path: str, prefix1: str, suffix1: str, prefix2: str, suffix2: str
+        path: str,
+        prefix1: str,
+        suffix1: str,
+        prefix2: str,
+        suffix2: str,
+        snapshot: FileSnapshot | None = None,
     ) -> dict:
-        code = {}
-        if os.path.isfile(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = f.read()
-                for s in re.findall(
-                    f"{prefix1} user code begin (.*), do not change this comment!{suffix1}",
-                    data,
-                ):
-                    matcher = f"{prefix1} user code begin {s}, do not change this comment!{suffix1}\n(.*){prefix2} user code end {s}, do not change this comment!{suffix2}"
-                    result = str.rstrip(re.findall(matcher, data, re.S)[0])
-                    if result:
-                        code[s] = result
-                        # code[s] = str.rstrip(result)
-                        # # noinspection PyUnresolvedReferences
-                        # if code[s] != '':
-                        #     code[s] = code[s] + '\n'
-                    else:
-                        code[s] = ""
+        if snapshot is None:
+            snapshot = FileSnapshot()
+        data = snapshot.text(path)
+        if data is None:
+            return {}
+
+        scanner = UserCodeScanner.get(prefix1, suffix1, prefix2, suffix2)
+        code, problems = scanner.scan(data)
+        for problem in problems:
+            logger.warning(f"{path!r}: {problem}")
         return code
 
     def _render(
         self, path: str, info: dict, env: jinja2.Environment, args: dict
     ) -> str:
+        args = dict(args)
         abs_path = f"{self._project.folder()}/{path}"
         template_name = info.get("template")
         force = info.get("force", True)
-        if force == False and os.path.isfile(abs_path):
-            with open(abs_path, "r", encoding="utf-8") as fp:
-                return fp.read()
+        entry = self._snapshot.get(abs_path)
+        if force == False and entry is not None:
+            return entry.text or ""
 
         if template_name is None:
             template_name = f"{os.path.basename(path)}.j2"
@@ -282,6 +413,7 @@ class Coder:
             except jinja2.exceptions.TemplateNotFound:
                 return ""
 
+            args["user_code"] = {}
             if suffix.lower() in [
                 ".c",
                 ".h",
@@ -300,12 +432,16 @@ class Coder:
                 ".icf",
             ]:
                 args["user_code"] = self.match_user(
-                    abs_path, r"/\*\*<", r" \*/", r"/\*\*>", r" \*/"
+                    abs_path, *UserCodeScanner.C_STYLE, self._snapshot
                 )
             elif Path(abs_path).name == "xmake.lua":
-                args["user_code"] = self.match_user(abs_path, "----<", "", "---->", "")
+                args["user_code"] = self.match_user(
+                    abs_path, *UserCodeScanner.XMAKE_STYLE, self._snapshot
+                )
             elif Path(abs_path).name == "CMakeLists.txt":
-                args["user_code"] = self.match_user(abs_path, "# --<", "", "# -->", "")
+                args["user_code"] = self.match_user(
+                    abs_path, *UserCodeScanner.CMAKE_STYLE, self._snapshot
+                )
 
             args["file"] = os.path.basename(path)
             args["brief"] = info.get(
@@ -316,29 +452,164 @@ class Coder:
             context = template.render({"CSP": args})
             context = context.strip() + "\n"
 
-            time_pattern = (
-                r"\b\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\b"  # YYYY-MM-DD HH:MM:SS
-            )
-            gen_md5 = hashlib.md5(
-                re.sub(time_pattern, "", context).encode("utf-8")
-            ).hexdigest()
-            file_context = ""
-            if os.path.isfile(abs_path):
-                with open(abs_path, "r", encoding="utf-8") as file:
-                    file_context = file.read()
-                    file_md5 = hashlib.md5(
-                        re.sub(time_pattern, "", file_context).encode("utf-8")
-                    ).hexdigest()
-            else:
-                file_md5 = ""
-
-            if gen_md5 == file_md5:
-                context = file_context
+            # keep the file as is when only the timestamps differ
+            if (
+                entry is not None
+                and entry.text is not None
+                and FileSnapshot.normalized_md5(context) == entry.normalized_md5
+            ):
+                context = entry.text
 
         return context
 
+    @staticmethod
+    def _fingerprint_project(project: Project) -> str:
+        content = json.dumps(project.origin, sort_keys=True, default=str)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _get_dump_changed_paths(self, env: jinja2.Environment) -> set[str] | None:
+        """
+        Get the config paths changed since the previous dump.
+
+        ``None`` means that something other than the configs changed (project
+        settings or templates on disk), so every file has to be rendered again.
+        """
+        origin = self._project.origin
+        configs = origin.get("configs", {})
+        rest = {key: value for key, value in origin.items() if key != "configs"}
+        rest = json.dumps(rest, sort_keys=True, default=str)
+
+        changed = None
+        if (
+            self._dump_state is not None
+            and self._dump_state[0] == rest
+            and all(template.is_up_to_date for template in (env.cache or {}).values())
+        ):
+            changed = ConfigsDependency.changed_paths(self._dump_state[1], configs)
+
+        self._dump_state = (rest, copy.deepcopy(configs))
+        if changed is None:
+            self._dump_records.clear()
+        return changed
+
+    def _get_gen_state_key(self, data: dict) -> str:
+        """
+        Hash what every generated file depends on, apart from the configs.
+        """
+        origin = {
+            key: value
+            for key, value in self._project.origin.items()
+            if key != "configs"
+        }
+        shared = {
+            key: value
+            for key, value in data.items()
+            if key not in ("project", "summary", "time")
+        }
+
+        sources = [
+            SummaryUtils.summary_file(self._project.vendor, self._project.targetChip)
+        ]
+        sources.extend(sorted(self._generator_folder.glob("*.py")))
+        sources.extend(sorted(self._filters_folder.glob("*.py")))
+        for folder in [
+            Path(SYS_UTILS.templates_folder()),
+            self._generator_folder / "templates",
+        ]:
+            sources.extend(sorted(p for p in folder.rglob("*") if p.is_file()))
+
+        return GenState.hash(
+            [
+                self._hal,
+                self._halVersion,
+                origin,
+                shared,
+                GenState.stat_files(sources),
+            ]
+        )
+
+    def _get_gen_inputs(self, file: str, reads: set[str] | list[str]) -> str:
+        configs = self._project.configs
+        values = {
+            read: configs.origin if read == "" else configs.get(read) for read in reads
+        }
+        return GenState.hash([self.files_table[file], values])
+
+    def _is_gen_state_fresh(self, state: GenState, file: str, path: str) -> bool:
+        entry = state.get(file)
+        if entry is None:
+            return False
+        if entry.get("inputs") != self._get_gen_inputs(file, entry.get("reads", [])):
+            return False
+        if entry.get("stat") and entry["stat"] == GenState.stat(path):
+            return True
+
+        # the file was touched, it is still fresh if the content is the same
+        snapshot = self._snapshot.get(path)
+        if snapshot is not None and snapshot.md5 == entry.get("output"):
+            state.touch(file, path)
+            return True
+        return False
+
+    def _stat_project_file(self, path: str) -> tuple:
+        try:
+            st = os.stat(f"{self._project.folder()}/{path}")
+        except OSError:
+            return ()
+        return st.st_mtime_ns, st.st_size
+
+    def _is_dump_record_valid(
+        self, path: str, info: dict, changed: set[str] | None
+    ) -> bool:
+        record = self._dump_records.get(path)
+        return (
+            changed is not None
+            and record is not None
+            and record.info == info
+            and record.stat == self._stat_project_file(path)
+            and not ConfigsDependency.overlaps(record.reads, changed)
+        )
+
+    def _render_files(
+        self,
+        items: list[tuple[str, dict]],
+        env: jinja2.Environment,
+        args: dict,
+        jobs: int = 1,
+    ) -> Iterator[tuple[str | None, set[str]]]:
+        """
+        Render ``(path, info)`` items in order.
+
+        Each result comes with the config paths read while rendering it. With
+        ``jobs > 1`` the files are rendered on a process pool.
+        """
+        if jobs > 1 and len(items) > 1:
+            results = ParallelRenderer(self._project, jobs).render(items, args)
+            for (path, _), (context, reads, entry) in zip(items, results):
+                self._snapshot.put(f"{self._project.folder()}/{path}", entry)
+                yield context, reads
+            return
+
+        for path, info in items:
+            with self._project.configs.record() as reads:
+                with CODER_PHASE.time(phase="render"):
+                    context = self._render(path, info, env, args)
+            yield context, reads
+
     def _get_environment(self) -> jinja2.Environment:
+        if self._environment is None:
+            with CODER_PHASE.time(phase="environment"):
+                self._environment = self._create_environment()
+        return self._environment
+
+    def _create_environment(self) -> jinja2.Environment:
         package_folder = self._project.hal_folder()
+        try:
+            bytecode_cache = BytecodeCache(self._hal, self._halVersion)
+        except OSError as e:
+            logger.warning(f"jinja2 bytecode cache disabled: {e}")
+            bytecode_cache = None
+
         env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(
                 [
@@ -346,6 +617,7 @@ class Coder:
                     f"{package_folder}/tools/generator/templates",
                 ]
             ),
+            bytecode_cache=bytecode_cache,
         )
 
         # env.add_extension("jinja2.ext.i18n")
@@ -386,11 +658,10 @@ class Coder:
         return data
 
     def _check_file_changed(self, path: str, context: str) -> bool:
-        gen_md5 = hashlib.md5(context.encode("utf-8")).hexdigest()
-        if os.path.isfile(path):
-            with open(path, "r", encoding="utf-8") as file:
-                file_context = file.read()
-                file_md5 = hashlib.md5(file_context.encode("utf-8")).hexdigest()
+        gen_md5 = FileSnapshot.md5(context)
+        entry = self._snapshot.get(path)
+        if entry is not None:
+            file_md5 = entry.md5
         else:
             Path(path).parent.mkdir(parents=True, exist_ok=True)
             file_md5 = ""
@@ -453,7 +724,9 @@ class Coder:
         include_node.text = includes_content
 
         # update scatter file path
-        scatter_node = tree.find("Targets/Target/TargetOption/TargetArmAds/LDads/ScatterFile")
+        scatter_node = tree.find(
+            "Targets/Target/TargetOption/TargetArmAds/LDads/ScatterFile"
+        )
         if scatter_node is not None:
             # Update scatter file path to point to the correct location
             scatter_node.text = "hal/libraries/cmsis/device/arm/SP28038_flash.scf"
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        dependency.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class RenderRecord:
+    """The result of one render together with what it depended on."""
+
+    info: dict
+    stat: tuple
+    reads: set[str] = field(default_factory=set)
+    context: str | None = None
+
+
+class ConfigsDependency:
+
+    @staticmethod
+    def changed_paths(old: Any, new: Any, prefix: str = "") -> set[str]:
+        """
+        Return the dotted paths that differ between two configs trees.
+
+        Equal subtrees are skipped with a single comparison, so the cost is
+        proportional to the size of the change rather than of the tree.
+        """
+        if old == new:
+            return set()
+
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            return {prefix}
+
+        changed = set()
+        for key in old.keys() | new.keys():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if key not in old or key not in new:
+                changed.add(path)
+            else:
+                changed |= ConfigsDependency.changed_paths(old[key], new[key], path)
+        return changed
+
+    @staticmethod
+    def overlaps(reads: set[str], changed: set[str]) -> bool:
+        """
+        Check whether any read path is equal to, inside or above a changed path.
+
+        The empty path stands for the whole tree.
+        """
+        if not changed:
+            return False
+        if "" in reads or "" in changed:
+            return True
+
+        for read in reads:
+            for path in changed:
+                if (
+                    read == path
+                    or path.startswith(f"{read}.")
+                    or read.startswith(f"{path}.")
+                ):
+                    return True
+        return False
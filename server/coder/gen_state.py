@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        gen_state.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+from loguru import logger
+
+
+class GenState:
+    """
+    The generation state manifest of an output folder, ``.csp/gen-state``.
+
+    The manifest is keyed by a hash of everything shared by all files (hal
+    package, generator and filters sources, templates, project settings). For
+    every output file it stores the hash of its own inputs (files table entry
+    and the configs it read), the md5 of what was written and the stat of the
+    file afterwards. When both the inputs and the file on disk are unchanged,
+    ``generate`` neither renders nor compares the file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, folder: str, key: str):
+        self._file = Path(folder) / ".csp" / "gen-state"
+        self._key = key
+        self._files: dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def hash(value: Any) -> str:
+        content = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def stat(path: str | Path) -> list:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return []
+        return [st.st_mtime_ns, st.st_size]
+
+    @staticmethod
+    def stat_files(files: Iterable[str | Path]) -> list:
+        return [[str(file), *GenState.stat(file)] for file in files]
+
+    def get(self, file: str) -> dict | None:
+        return self._files.get(file)
+
+    def set(self, file: str, inputs: str, reads: Iterable[str], output: str, path: str):
+        self._files[file] = {
+            "inputs": inputs,
+            "reads": sorted(reads),
+            "output": output,
+            "stat": self.stat(path),
+        }
+        self._dirty = True
+
+    def touch(self, file: str, path: str):
+        """Refresh the stat of a file whose content is known to be unchanged."""
+        self._files[file]["stat"] = self.stat(path)
+        self._dirty = True
+
+    def remove(self, file: str):
+        if self._files.pop(file, None) is not None:
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+
+        data = {"version": self.VERSION, "key": self._key, "files": self._files}
+        tmp = self._file.with_name(f"{self._file.name}.tmp")
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self._file)
+        except OSError as e:
+            logger.warning(f"failed to save {str(self._file)!r}: {e}")
+            return
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"ignore broken {str(self._file)!r}: {e}")
+            return
+
+        if (
+            isinstance(data, dict)
+            and data.get("version") == self.VERSION
+            and data.get("key") == self._key
+            and isinstance(data.get("files"), dict)
+        ):
+            self._files = data["files"]
+        else:
+            # something shared by every file changed, start over
+            self._dirty = True
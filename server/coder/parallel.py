@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        parallel.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       send back the snapshot of the rendered file
+# 2026-10-18     xqyjlj       send back the metrics recorded by the worker
+#
+
+import dataclasses
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from public.csp.project import Project
+from utils.metrics import METRICS
+from utils.summary import SummaryUtils
+
+from .snapshot import SnapshotEntry
+
+_coder = None
+_data = {}
+
+
+def _init_worker(origin: dict, user_data: dict, data: dict):
+    # coder.py imports this module, so import it lazily to avoid the cycle
+    from .coder import Coder
+
+    global _coder, _data
+
+    project = Project(origin, user_data)
+    summary = SummaryUtils.load_summary(project.vendor, project.targetChip)
+    _coder = Coder(project, summary)
+    _data = _coder._get_loaded_data()
+    _data.update(data)
+    # build the environment (and import the filters) before the first task
+    _coder._get_environment()
+
+
+def _render_worker(
+    item: tuple[str, dict],
+) -> tuple[str | None, set[str], SnapshotEntry | None, dict]:
+    from .coder import CODER_PHASE
+
+    path, info = item
+    project = _coder._project  # type: ignore
+    snapshot = _coder._snapshot  # type: ignore
+    with project.configs.record() as reads, CODER_PHASE.time(phase="render"):
+        context = _coder._render(path, info, _coder._get_environment(), _data)  # type: ignore
+
+    # the text stays here, the hashes are enough for the changed-file check
+    entry = snapshot.get(f"{project.folder()}/{path}")
+    if entry is not None:
+        entry = dataclasses.replace(entry, text=None)
+    snapshot.clear()
+    # timings of this file, with the initializer ones on the first call
+    return context, reads, entry, METRICS.drain()
+
+
+class ParallelRenderer:
+    """
+    Render files of one project on a pool of worker processes.
+
+    Every worker loads the hal generator, the filters and the jinja2
+    environment once, then renders the files it is given. Results are
+    returned in the order of the input, each with the snapshot entry of the
+    file on disk so that the caller does not read it again. The metrics
+    recorded by a worker are merged into the ones of this process.
+    """
+
+    def __init__(self, project: Project, jobs: int):
+        self._project = project
+        self._jobs = max(1, jobs)
+
+    def render(
+        self, items: list[tuple[str, dict]], data: dict
+    ) -> Iterator[tuple[str | None, set[str], SnapshotEntry | None]]:
+        # the project is rebuilt in every worker, only plain data is sent
+        origin = json.loads(json.dumps(self._project.origin, default=str))
+        user_data = {
+            "hal_folder": self._project.hal_folder(),
+            "toolchains_folder": self._project.toolchains_folder(),
+            "path": self._project.path(),
+        }
+        shared = {
+            key: value
+            for key, value in data.items()
+            if key not in ("project", "summary")
+        }
+
+        workers = min(self._jobs, len(items))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(origin, user_data, shared),
+        ) as executor:
+            for context, reads, entry, metrics in executor.map(_render_worker, items):
+                METRICS.merge(metrics)
+                yield context, reads, entry
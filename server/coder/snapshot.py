@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        snapshot.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+
+# YYYY-MM-DD HH:MM:SS
+TIME_PATTERN = re.compile(r"\b\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\b")
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    text: str | None
+    md5: str
+    normalized_md5: str
+
+
+class FileSnapshot:
+    """
+    Contents of the output files seen during one generate or dump run.
+
+    Each file is read at most once, its raw md5 and its md5 without
+    timestamps are computed together and shared by the user code matcher,
+    the render and the changed-file check. Missing files are cached too.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, SnapshotEntry | None] = {}
+
+    @staticmethod
+    def md5(text: str) -> str:
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def normalized_md5(text: str) -> str:
+        return FileSnapshot.md5(TIME_PATTERN.sub("", text))
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normpath(os.path.abspath(path))
+
+    def get(self, path: str) -> SnapshotEntry | None:
+        key = self._key(path)
+        if key in self._entries:
+            return self._entries[key]
+
+        entry = None
+        if os.path.isfile(key):
+            with open(key, "r", encoding="utf-8") as f:
+                text = f.read()
+            entry = SnapshotEntry(text, self.md5(text), self.normalized_md5(text))
+        self._entries[key] = entry
+        return entry
+
+    def text(self, path: str) -> str | None:
+        entry = self.get(path)
+        return None if entry is None else entry.text
+
+    def put(self, path: str, entry: SnapshotEntry | None):
+        self._entries[self._key(path)] = entry
+
+    def update(self, path: str, text: str):
+        """Record the content just written to ``path``."""
+        self.put(path, SnapshotEntry(text, self.md5(text), self.normalized_md5(text)))
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        user_code.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import functools
+import re
+
+
+class UserCodeScanner:
+    """
+    Extract ``user code begin/end`` blocks from a generated file in one pass.
+
+    The prefixes and suffixes are regular expression fragments, one pair for
+    the begin marker and one for the end marker, e.g. ``/**<`` and ``/**>``
+    for C sources.
+    """
+
+    C_STYLE = (r"/\*\*<", r" \*/", r"/\*\*>", r" \*/")
+    XMAKE_STYLE = ("----<", "", "---->", "")
+    CMAKE_STYLE = ("# --<", "", "# -->", "")
+
+    def __init__(self, prefix1: str, suffix1: str, prefix2: str, suffix2: str):
+        self._pattern = re.compile(
+            f"{prefix1} user code begin (?P<begin>.*), do not change this comment!{suffix1}\n"
+            f"|{prefix2} user code end (?P<end>.*), do not change this comment!{suffix2}"
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get(
+        prefix1: str, suffix1: str, prefix2: str, suffix2: str
+    ) -> "UserCodeScanner":
+        """Get the scanner of a comment style, compiled once per process."""
+        return UserCodeScanner(prefix1, suffix1, prefix2, suffix2)
+
+    def scan(self, data: str) -> tuple[dict[str, str], list[str]]:
+        """
+        Scan ``data`` and return the user code blocks with the marker problems.
+
+        The content of each block is right-stripped. A begin marker without an
+        end marker, an end marker without a begin marker and a begin marker
+        repeated before its end marker are reported and the broken block is
+        skipped.
+        """
+        code = {}
+        problems = []
+        opened: dict[str, int] = {}
+
+        for match in self._pattern.finditer(data):
+            name = match.group("begin")
+            if name is not None:
+                if name in opened:
+                    problems.append(f"user code begin {name!r} is repeated")
+                opened[name] = match.end()
+                continue
+
+            name = match.group("end")
+            start = opened.pop(name, None)
+            if start is None:
+                problems.append(f"user code end {name!r} has no begin marker")
+                continue
+            code[name] = data[start : match.start()].rstrip()
+
+        for name in opened:
+            problems.append(f"user code begin {name!r} has no end marker")
+
+        return code, problems
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        handlers.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       import the actions from their modules
+# 2026-10-18     xqyjlj       pass the render jobs of coder/generate
+# 2026-10-18     xqyjlj       accept raw json/msgpack dump content
+# 2026-10-18     xqyjlj       dump the project session of the sid
+# 2026-10-18     xqyjlj       share project loading and descriptions with app
+#
+
+from dataclasses import dataclass
+from typing import Callable
+
+import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
+import proto.sio_coder_generate_pb2 as sio_coder_generate_pb2
+import proto.sio_package_description_pb2 as sio_package_description_pb2
+import proto.sio_package_install_pb2 as sio_package_install_pb2
+from actions.coder_dump import action_coder_dump, action_coder_dump_stream
+from actions.coder_generate import action_coder_generate
+from actions.package_install import action_package_install
+from flask_socketio import SocketIO
+from google.protobuf.message import Message
+from loguru import logger
+from packages.description import PackageDescription
+from public.csp.project import Project
+from utils.project import ProjectUtils
+
+from .session import WORKER_PROJECTS, request_content
+
+
+def load_project(content: dict | None, path: str) -> Project:
+    """
+    Load the project of a request, from ``content`` if given or else from the
+    file at ``path``. Raises ``ValueError`` with the error to send back.
+    """
+    if content:
+        if not ProjectUtils.check_project(content):
+            logger.error(f"Called with invalid content: {content!r}")
+            raise ValueError("'project' does not conform to expected schema.")
+        return ProjectUtils.load_project(content, path)
+
+    project = ProjectUtils.load_project_from_file(path)
+    if not project.origin:
+        logger.error(f"Called with invalid path: {path!r}")
+        raise ValueError(f"Failed to load file: {path}")
+    return project
+
+
+def description_message(
+    package_desc: PackageDescription,
+) -> sio_package_description_pb2.Description:
+    description = sio_package_description_pb2.Description()
+    description.name = package_desc.name
+    description.version = package_desc.version
+    description.license = package_desc.license
+    description.type = package_desc.type
+    description.vendor = package_desc.vendor
+    description.support = package_desc.support
+
+    # Convert vendorUrl map
+    for key, value in package_desc.vendorUrl.origin.items():
+        description.vendorUrl[key] = value
+
+    # Convert description map
+    for key, value in package_desc.description.origin.items():
+        description.description[key] = value
+
+    # Convert url map
+    for key, value in package_desc.url.origin.items():
+        description.url[key] = value
+
+    # Convert author
+    author = package_desc.author
+    author_pb = sio_package_description_pb2.Author()
+    author_pb.name = author.name
+    author_pb.email = author.email
+    author_pb.website.blog = author.website.blog
+    author_pb.website.github = author.website.github
+    description.author.CopyFrom(author_pb)
+    return description
+
+
+def run_coder_dump(socketio: SocketIO, sid: str, data: bytes):
+    msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+    msg.ParseFromString(data)
+    arg_path = msg.path
+    arg_diff = msg.diff
+    arg_stream = msg.stream
+
+    if msg.content_session:
+        try:
+            project = WORKER_PROJECTS.resolve(sid, msg)
+        except Exception as e:
+            logger.error(f"Failed to resolve the project session: {str(e)!r}")
+            socketio.emit(
+                "coder/dump.result",
+                sio_coder_dump_pb2.SioCoderDumpResponse(
+                    success=False,
+                    error=str(e),
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+        arg_content = project.origin
+        logger.trace(
+            f"{sid!r} calling sio/coder/dump with session revision:{msg.session_revision!r}, path:{arg_path!r}, diff:{arg_diff!r}"
+        )
+    else:
+        try:
+            arg_content = request_content(msg)
+        except ValueError as e:
+            logger.error(f"Called with undecodable content: {str(e)!r}")
+            socketio.emit(
+                "coder/dump.result",
+                sio_coder_dump_pb2.SioCoderDumpResponse(
+                    success=False,
+                    error=f"Failed to decode 'content_data': {e}",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        logger.trace(
+            f"{sid!r} calling sio/coder/dump with content:{arg_content!r}, path:{arg_path!r}, diff:{arg_diff!r}"
+        )
+
+        if not isinstance(arg_path, str):
+            logger.error(f"Called with invalid path: {arg_path!r}")
+            socketio.emit(
+                "coder/dump.result",
+                sio_coder_dump_pb2.SioCoderDumpResponse(
+                    success=False,
+                    error="'path' must be a file path string",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        try:
+            project = load_project(arg_content, arg_path)
+        except ValueError as e:
+            socketio.emit(
+                "coder/dump.result",
+                sio_coder_dump_pb2.SioCoderDumpResponse(
+                    success=False,
+                    error=str(e),
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+    try:
+        if arg_stream:
+            count = action_coder_dump_stream(
+                project,
+                arg_diff,
+                arg_path,
+                arg_content,
+                sid,
+                socketio,
+                chunk_size=msg.chunk_size,
+                compression=msg.compression,
+            )
+            if count == 0:
+                logger.error(f"Dump failed: empty result")
+                socketio.emit(
+                    "coder/dump.result",
+                    sio_coder_dump_pb2.SioCoderDumpResponse(
+                        success=False,
+                        error="Unknown error, please see more in server log",
+                    ).SerializeToString(),
+                    to=sid,
+                )
+                return
+
+            logger.trace(f"Dump successful, {count} files streamed")
+            socketio.emit(
+                "coder/dump.result",
+                sio_coder_dump_pb2.SioCoderDumpResponse(
+                    success=True,
+                    streamed=True,
+                    count=count,
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        files = action_coder_dump(
+            project, arg_diff, arg_path, arg_content, sid, socketio
+        )
+        if files is None or len(files) == 0:
+            logger.error(f"Dump failed: empty result")
+            socketio.emit(
+                "coder/dump.result",
+                sio_coder_dump_pb2.SioCoderDumpResponse(
+                    success=False,
+                    error="Unknown error, please see more in server log",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        logger.trace(f"Dump successful")
+        socketio.emit(
+            "coder/dump.result",
+            sio_coder_dump_pb2.SioCoderDumpResponse(
+                success=True,
+                files=files,
+                count=len(files),
+            ).SerializeToString(),
+            to=sid,
+        )
+    except Exception as e:
+        logger.exception(f"Dump failed: {str(e)!r}")
+        socketio.emit(
+            "coder/dump.result",
+            sio_coder_dump_pb2.SioCoderDumpResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+def run_coder_generate(socketio: SocketIO, sid: str, data: bytes):
+    msg = sio_coder_generate_pb2.SioCoderGenerateRequest()
+    msg.ParseFromString(data)
+    arg_path = msg.path
+    arg_output = msg.output
+    arg_files = list(msg.files)
+    arg_jobs = max(1, msg.jobs)
+
+    logger.trace(
+        f"{sid!r} calling sio/coder/generate with path:{arg_path!r}, output:{arg_output!r}, files:{arg_files!r}, jobs:{arg_jobs!r}"
+    )
+
+    if not isinstance(arg_path, str):
+        logger.error(f"Called with invalid file path: {arg_path!r}")
+        socketio.emit(
+            "coder/generate.result",
+            sio_coder_generate_pb2.SioCoderGenerateResponse(
+                success=False,
+                error="'file' must be a file path string",
+            ).SerializeToString(),
+            to=sid,
+        )
+        return
+
+    try:
+        project = load_project(None, arg_path)
+    except ValueError as e:
+        socketio.emit(
+            "coder/generate.result",
+            sio_coder_generate_pb2.SioCoderGenerateResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+        return
+
+    try:
+        result = action_coder_generate(
+            project, arg_output, False, arg_files, sid, socketio, arg_jobs
+        )
+        if not result:
+            logger.error(f"Generate failed: unknown error")
+            socketio.emit(
+                "coder/generate.result",
+                sio_coder_generate_pb2.SioCoderGenerateResponse(
+                    success=False,
+                    error="Generation failed, please see more in server log",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        logger.trace(f"Generate successful")
+        socketio.emit(
+            "coder/generate.result",
+            sio_coder_generate_pb2.SioCoderGenerateResponse(
+                success=True,
+            ).SerializeToString(),
+            to=sid,
+        )
+    except Exception as e:
+        logger.exception(f"Generate failed: {str(e)!r}")
+        socketio.emit(
+            "coder/generate.result",
+            sio_coder_generate_pb2.SioCoderGenerateResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+def run_package_install(socketio: SocketIO, sid: str, data: bytes):
+    msg = sio_package_install_pb2.SioPackageInstallRequest()
+    msg.ParseFromString(data)
+    arg_path = msg.path
+
+    logger.trace(f"{sid!r} calling sio/package/install with path:{arg_path!r}")
+
+    if not isinstance(arg_path, str):
+        logger.error(f"Called with invalid path: {arg_path!r}")
+        socketio.emit(
+            "package/install.result",
+            sio_package_install_pb2.SioPackageInstallResponse(
+                success=False,
+                error="'path' must be a file path string",
+            ).SerializeToString(),
+            to=sid,
+        )
+        return
+
+    try:
+        package_desc = action_package_install(arg_path, False, False, sid, socketio)
+        if package_desc is None:
+            socketio.emit(
+                "package/install.result",
+                sio_package_install_pb2.SioPackageInstallResponse(
+                    success=False,
+                    error="Unknown error, please see more in server log",
+                ).SerializeToString(),
+                to=sid,
+            )
+            return
+
+        socketio.emit(
+            "package/install.result",
+            sio_package_install_pb2.SioPackageInstallResponse(
+                success=True,
+                description=description_message(package_desc),
+            ).SerializeToString(),
+            to=sid,
+        )
+    except Exception as e:
+        logger.exception(f"Install failed: {str(e)!r}")
+        socketio.emit(
+            "package/install.result",
+            sio_package_install_pb2.SioPackageInstallResponse(
+                success=False,
+                error=str(e),
+            ).SerializeToString(),
+            to=sid,
+        )
+
+
+@dataclass(frozen=True)
+class JobKind:
+    """
+    A kind of socket request that runs as a job.
+
+    ``run`` takes the ``socketio`` (or the ``JobChannel`` of a worker), the
+    requesting sid and the raw request, it emits the result itself. A lower
+    ``priority`` runs first. Jobs of an ``affine`` kind prefer the worker that
+    last ran a job for the same project, whose coder cache is warm. Requests
+    of a ``session`` kind may use the project session of their sid, the
+    scheduler completes them for the worker they are sent to.
+    """
+
+    name: str
+    priority: int
+    run: Callable[[SocketIO, str, bytes], None]
+    request: type[Message]
+    response: type[Message]
+    result_event: str
+    affine: bool = False
+    session: bool = False
+
+    def affinity(self, data: bytes) -> str:
+        if not self.affine:
+            return ""
+        msg = self.request()
+        try:
+            msg.ParseFromString(data)
+        except Exception:
+            return ""
+        return getattr(msg, "path", "")
+
+    def failure(self, error: str) -> bytes:
+        return self.response(success=False, error=error).SerializeToString()
+
+
+JOB_KINDS: dict[str, JobKind] = {
+    kind.name: kind
+    for kind in (
+        JobKind(
+            "coder/dump",
+            0,
+            run_coder_dump,
+            sio_coder_dump_pb2.SioCoderDumpRequest,
+            sio_coder_dump_pb2.SioCoderDumpResponse,
+            "coder/dump.result",
+            affine=True,
+            session=True,
+        ),
+        JobKind(
+            "coder/generate",
+            1,
+            run_coder_generate,
+            sio_coder_generate_pb2.SioCoderGenerateRequest,
+            sio_coder_generate_pb2.SioCoderGenerateResponse,
+            "coder/generate.result",
+            affine=True,
+        ),
+        JobKind(
+            "package/install",
+            2,
+            run_package_install,
+            sio_package_install_pb2.SioPackageInstallRequest,
+            sio_package_install_pb2.SioPackageInstallResponse,
+            "package/install.result",
+        ),
+    )
+}
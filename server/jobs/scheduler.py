@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        scheduler.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       record job timings and merge worker metrics
+# 2026-10-18     xqyjlj       forward project sessions to the workers
+# 2026-10-18     xqyjlj       cancel running jobs cooperatively
+#
+
+
+import atexit
+import itertools
+import multiprocessing
+import time
+import uuid
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+
+import gevent
+import proto.sio_job_pb2 as sio_job_pb2
+from flask_socketio import SocketIO
+from gevent.lock import BoundedSemaphore
+from gevent.queue import PriorityQueue
+from loguru import logger
+from utils.metrics import METRICS
+
+from .handlers import JOB_KINDS, JobKind
+from .session import SESSIONS
+from .worker import worker_main
+
+QUEUED = sio_job_pb2.SIO_JOB_STATE_QUEUED
+RUNNING = sio_job_pb2.SIO_JOB_STATE_RUNNING
+DONE = sio_job_pb2.SIO_JOB_STATE_DONE
+CANCELLED = sio_job_pb2.SIO_JOB_STATE_CANCELLED
+FAILED = sio_job_pb2.SIO_JOB_STATE_FAILED
+
+JOB_WAIT = METRICS.histogram(
+    "csp_job_wait_seconds", "Time jobs spent queued.", ("kind",)
+)
+JOB_RUN = METRICS.histogram(
+    "csp_job_run_seconds", "Time jobs spent on a worker.", ("kind", "state")
+)
+
+
+@dataclass
+class Job:
+    id: str
+    kind: JobKind
+    sid: str
+    data: bytes
+    affinity: str
+    state: int = QUEUED
+    # time.perf_counter() when queued, then when started
+    since: float = 0.0
+
+
+def _recv(conn: Connection):
+    # runs in the threadpool, which would print the EOFError of a dead worker
+    try:
+        return conn.recv()
+    except (EOFError, OSError):
+        return None
+
+
+class _Worker:
+    def __init__(self, context, index: int):
+        self.conn, child = context.Pipe()
+        # the id of the running job to stop, read by the worker at every emit
+        self.cancelled = context.Array("c", 32)
+        # not a daemon, the coder may start its own render processes
+        self.process = context.Process(
+            target=worker_main,
+            args=(child, self.cancelled),
+            name=f"csp-job-{index}",
+        )
+        self.process.start()
+        child.close()
+        self.job: Job | None = None
+        self.affinity = ""
+        # the project session revision this worker holds, by sid
+        self.sessions: dict[str, int] = {}
+
+
+class JobScheduler:
+    """
+    Run socket requests on a bounded pool of worker processes.
+
+    Rendering, extraction and hashing no longer block the event loop, so
+    other sockets and the REST api stay responsive. Every job gets an id,
+    reported to its sid through ``job/status``. Queued jobs run by priority
+    then in order of arrival. Progress and results emitted by a worker are
+    relayed to the requesting sid. A queued job is dropped on cancel, a
+    running one is asked to stop: it does at its next progress, between two
+    files, and its worker is kept. What it emits from then on is dropped.
+    """
+
+    def __init__(self, socketio: SocketIO):
+        self._socketio = socketio
+        self._context = multiprocessing.get_context("spawn")
+        self._queue: PriorityQueue = PriorityQueue()
+        self._seq = itertools.count()
+        self._jobs: dict[str, Job] = {}
+        self._workers: list[_Worker] = []
+        self._size = 0
+        self._slots: BoundedSemaphore | None = None
+        self._dispatcher: gevent.Greenlet | None = None
+        self._index = itertools.count()
+
+    def start(self, size: int):
+        self._size = size
+        self._slots = BoundedSemaphore(size)
+        # every worker blocks a thread while waiting for its messages
+        threadpool = gevent.get_hub().threadpool
+        threadpool.maxsize = max(threadpool.maxsize, size + 4)
+        self._dispatcher = gevent.spawn(self._dispatch)
+        atexit.register(self.stop)
+        logger.debug(f"job scheduler started with {size} workers")
+
+    def stop(self):
+        if self._dispatcher is not None:
+            self._dispatcher.kill(block=False)
+            self._dispatcher = None
+        for worker in list(self._workers):
+            if worker.process.is_alive():
+                worker.process.kill()
+
+    def submit(self, name: str, sid: str, data: bytes) -> str:
+        kind = JOB_KINDS[name]
+        job = Job(
+            uuid.uuid4().hex,
+            kind,
+            sid,
+            data,
+            kind.affinity(data),
+            since=time.perf_counter(),
+        )
+        self._jobs[job.id] = job
+        self._queue.put((kind.priority, next(self._seq), job))
+        logger.trace(f"{sid!r} queued job {job.id} ({name})")
+        self._emit_status(job)
+        return job.id
+
+    def cancel(self, job_id: str, sid: str) -> str | None:
+        """Cancel a job of ``sid``, return an error message on failure."""
+        job = self._jobs.get(job_id)
+        if job is None or job.sid != sid:
+            return f"Unknown job: {job_id}"
+
+        if job.state == QUEUED:
+            # the dispatcher skips it
+            self._jobs.pop(job.id, None)
+        elif job.state == RUNNING:
+            worker = next((w for w in self._workers if w.job is job), None)
+            if worker is None:
+                # its worker exited meanwhile
+                return f"Job {job_id} is already finished"
+            worker.cancelled.value = job.id.encode("ascii")
+        else:
+            return f"Job {job_id} is already finished"
+
+        job.state = CANCELLED
+        logger.info(f"{sid!r} cancelled job {job.id} ({job.kind.name})")
+        self._emit_result_failure(job, "Cancelled")
+        self._emit_status(job)
+        return None
+
+    def cancel_sid(self, sid: str):
+        """Drop the queued jobs of a disconnected sid, running ones finish."""
+        for job in list(self._jobs.values()):
+            if job.sid == sid and job.state == QUEUED:
+                job.state = CANCELLED
+                self._jobs.pop(job.id, None)
+        for worker in self._workers:
+            worker.sessions.pop(sid, None)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self._size,
+            "alive": len(self._workers),
+            "running": sum(1 for w in self._workers if w.job is not None),
+            "queued": sum(1 for j in self._jobs.values() if j.state == QUEUED),
+        }
+
+    def _dispatch(self):
+        while True:
+            self._slots.acquire()  # type: ignore
+            _, _, job = self._queue.get()
+            if job.state != QUEUED:
+                self._slots.release()  # type: ignore
+                continue
+
+            try:
+                worker = self._get_worker(job.affinity)
+                data = job.data
+                if job.kind.session:
+                    data = SESSIONS.prepare_dump(
+                        job.sid, data, worker.sessions.get(job.sid, 0)
+                    )
+                worker.conn.send((job.id, job.kind.name, job.sid, data))
+            except Exception as e:
+                logger.exception(f"Failed to start job {job.id}: {str(e)!r}")
+                self._jobs.pop(job.id, None)
+                job.state = FAILED
+                self._emit_result_failure(job, str(e))
+                self._emit_status(job)
+                self._slots.release()  # type: ignore
+                continue
+
+            worker.job = job
+            worker.affinity = job.affinity
+            job.state = RUNNING
+            now = time.perf_counter()
+            JOB_WAIT.observe(now - job.since, kind=job.kind.name)
+            job.since = now
+            self._emit_status(job)
+
+    def _get_worker(self, affinity: str) -> _Worker:
+        idle = [worker for worker in self._workers if worker.job is None]
+        for worker in idle:
+            if affinity and worker.affinity == affinity:
+                return worker
+        if idle:
+            return idle[0]
+
+        worker = _Worker(self._context, next(self._index))
+        self._workers.append(worker)
+        gevent.spawn(self._read, worker)
+        return worker
+
+    def _read(self, worker: _Worker):
+        threadpool = gevent.get_hub().threadpool
+        while True:
+            message = threadpool.apply(_recv, (worker.conn,))
+            if message is None:
+                break
+
+            if message[0] == "emit":
+                _, job_id, event, data, to = message
+                job = self._jobs.get(job_id)
+                if job is not None and job.state == RUNNING:
+                    self._socketio.emit(event, data, to=to)
+            elif message[0] == "metrics":
+                METRICS.merge(message[2])
+            elif message[0] == "session":
+                _, _, sid, revision = message
+                if revision:
+                    worker.sessions[sid] = revision
+                else:
+                    worker.sessions.pop(sid, None)
+            elif message[0] == "done":
+                job = worker.job
+                worker.job = None
+                if job is not None:
+                    self._jobs.pop(job.id, None)
+                    if job.state == RUNNING:
+                        job.state = DONE
+                        self._emit_status(job)
+                    self._observe_run(job)
+                    self._slots.release()  # type: ignore
+
+        # the worker exited, it was killed or it crashed
+        self._workers.remove(worker)
+        worker.conn.close()
+        threadpool.apply(worker.process.join)
+        job = worker.job
+        if job is None:
+            return
+
+        self._jobs.pop(job.id, None)
+        if job.state == RUNNING:
+            logger.error(
+                f"Worker of job {job.id} exited with code {worker.process.exitcode}"
+            )
+            job.state = FAILED
+            self._emit_result_failure(
+                job, "Worker process exited, please see more in server log"
+            )
+            self._emit_status(job)
+        self._observe_run(job)
+        self._slots.release()  # type: ignore
+
+    def _observe_run(self, job: Job):
+        state = sio_job_pb2.SioJobState.Name(job.state)  # type: ignore
+        state = state.removeprefix("SIO_JOB_STATE_").lower()
+        JOB_RUN.observe(
+            time.perf_counter() - job.since, kind=job.kind.name, state=state
+        )
+
+    def _emit_status(self, job: Job):
+        self._socketio.emit(
+            "job/status",
+            sio_job_pb2.SioJobStatus(
+                id=job.id,
+                kind=job.kind.name,
+                state=job.state,  # type: ignore
+            ).SerializeToString(),
+            to=job.sid,
+        )
+
+    def _emit_result_failure(self, job: Job, error: str):
+        self._socketio.emit(job.kind.result_event, job.kind.failure(error), to=job.sid)
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        session.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import copy
+import json
+from collections import OrderedDict
+from typing import Any
+
+import jsonschema
+import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.struct_pb2 import Struct
+from public.csp.project import Project
+from utils.project import ProjectUtils
+from utils.schema import SCHEMAS
+
+try:
+    import msgpack
+except ImportError:  # optional, msgpack content is then refused
+    msgpack = None
+
+JSON = sio_coder_dump_pb2.SIO_CODER_DUMP_CONTENT_ENCODING_JSON
+MSGPACK = sio_coder_dump_pb2.SIO_CODER_DUMP_CONTENT_ENCODING_MSGPACK
+
+
+def decode_content(data: bytes, encoding: int) -> Any:
+    """Decode raw project content, integers stay integers unlike a ``Struct``."""
+    if encoding == MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack content is not supported by this server")
+        return msgpack.unpackb(data, raw=False)
+    return json.loads(data)
+
+
+def request_content(msg: sio_coder_dump_pb2.SioCoderDumpRequest) -> dict:
+    """The project content of a dump request, raw data first."""
+    if msg.content_data:
+        content = decode_content(msg.content_data, msg.content_encoding)
+        if not isinstance(content, dict):
+            raise ValueError("'content_data' must encode an object")
+        return content
+    return MessageToDict(msg.content)
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """Apply a JSON merge patch (RFC 7386), ``target`` is updated in place."""
+    if not isinstance(patch, dict):
+        return patch
+    if not isinstance(target, dict):
+        target = {}
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        else:
+            target[key] = merge_patch(target.get(key), value)
+    return target
+
+
+def _pointer(path: Any) -> list[str]:
+    if not isinstance(path, str) or (path and not path.startswith("/")):
+        raise ValueError(f"Invalid json pointer: {path!r}")
+    if not path:
+        return []
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")
+    ]
+
+
+def _index(container: list, token: str, append: bool = False) -> int:
+    if append and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise ValueError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not append):
+        raise ValueError(f"Array index out of range: {token!r}")
+    return index
+
+
+class _Patcher:
+    """
+    Apply json patch operations copy on write.
+
+    Only the containers on the path of an operation are copied, once per
+    patch, so the original document is left untouched when an operation
+    fails and costs nothing when it succeeds.
+    """
+
+    def __init__(self, doc: Any):
+        self.doc = doc
+        self._copied: set[int] = set()
+
+    def _copy(self, value: Any) -> Any:
+        if isinstance(value, (dict, list)) and id(value) not in self._copied:
+            value = copy.copy(value)
+            self._copied.add(id(value))
+        return value
+
+    def _get(self, tokens: list[str]) -> Any:
+        value = self.doc
+        for token in tokens:
+            if isinstance(value, dict):
+                if token not in value:
+                    raise ValueError(f"Path does not exist: {token!r}")
+                value = value[token]
+            elif isinstance(value, list):
+                value = value[_index(value, token)]
+            else:
+                raise ValueError(f"Path does not exist: {token!r}")
+        return value
+
+    def _parent(self, tokens: list[str]) -> Any:
+        """The container of the last token, copied along the way."""
+        self.doc = parent = self._copy(self.doc)
+        for token in tokens[:-1]:
+            if isinstance(parent, dict):
+                if token not in parent:
+                    raise ValueError(f"Path does not exist: {token!r}")
+                child = parent[token] = self._copy(parent[token])
+            elif isinstance(parent, list):
+                index = _index(parent, token)
+                child = parent[index] = self._copy(parent[index])
+            else:
+                raise ValueError(f"Path does not exist: {token!r}")
+            parent = child
+        if not isinstance(parent, (dict, list)):
+            raise ValueError(f"Path does not exist: {tokens[-1]!r}")
+        return parent
+
+    def add(self, tokens: list[str], value: Any):
+        if not tokens:
+            self.doc = value
+            return
+        parent = self._parent(tokens)
+        if isinstance(parent, dict):
+            parent[tokens[-1]] = value
+        else:
+            parent.insert(_index(parent, tokens[-1], append=True), value)
+
+    def remove(self, tokens: list[str]) -> Any:
+        if not tokens:
+            raise ValueError("The document root cannot be removed")
+        parent = self._parent(tokens)
+        if isinstance(parent, dict):
+            if tokens[-1] not in parent:
+                raise ValueError(f"Path does not exist: {tokens[-1]!r}")
+            return parent.pop(tokens[-1])
+        return parent.pop(_index(parent, tokens[-1]))
+
+    def replace(self, tokens: list[str], value: Any):
+        if tokens:
+            self.remove(tokens)
+        self.add(tokens, value)
+
+    def apply(self, op: dict):
+        if not isinstance(op, dict):
+            raise ValueError(f"Invalid json patch operation: {op!r}")
+        name = op.get("op")
+        tokens = _pointer(op.get("path"))
+        if name in ("add", "replace", "test") and "value" not in op:
+            raise ValueError(f"Missing 'value' in {name!r} operation")
+
+        if name == "add":
+            self.add(tokens, op["value"])
+        elif name == "remove":
+            self.remove(tokens)
+        elif name == "replace":
+            self.replace(tokens, op["value"])
+        elif name == "move":
+            source = _pointer(op.get("from"))
+            if tokens[: len(source)] == source and tokens != source:
+                raise ValueError("A value cannot be moved into itself")
+            self.add(tokens, self.remove(source))
+        elif name == "copy":
+            self.add(tokens, copy.deepcopy(self._get(_pointer(op.get("from")))))
+        elif name == "test":
+            if self._get(tokens) != op["value"]:
+                raise ValueError(f"Test failed at {op.get('path')!r}")
+        else:
+            raise ValueError(f"Unknown json patch operation: {name!r}")
+
+
+def json_patch(doc: Any, ops: list) -> tuple[Any, set[str] | None]:
+    """
+    Apply json patch (RFC 6902) ``ops`` to ``doc``, which is left untouched.
+
+    Return the patched document and the top level keys that were touched,
+    ``None`` when the whole document was. Raise ``ValueError`` when an
+    operation fails, none of them is applied then.
+    """
+    if not isinstance(ops, list):
+        raise ValueError("A json patch must be an array of operations")
+    patcher = _Patcher(doc)
+    touched: set[str] | None = set()
+    for op in ops:
+        patcher.apply(op)
+        if op["op"] == "test":
+            continue
+        paths = [op["path"], op["from"]] if op["op"] == "move" else [op["path"]]
+        for path in paths:
+            tokens = _pointer(path)
+            if not tokens:
+                touched = None
+            elif touched is not None:
+                touched.add(tokens[0])
+    return patcher.doc, touched
+
+
+class ProjectSession:
+    """
+    The project content of a sid, set by ``sio/coder/dump`` or patched by
+    ``sio/project/patch``.
+
+    Content is kept as it arrived and only decoded when it has to be patched,
+    full requests cost the server process nothing. Every change bumps the
+    revision, the patches since the last full content are kept so that a
+    worker holding an older revision only has to replay them.
+    """
+
+    # patches kept for the workers, older revisions get the full content
+    HISTORY = 64
+
+    def __init__(self):
+        self.revision = 0
+        self.validated = False
+        self._content: dict | None = None
+        self._data: bytes = b""
+        self._encoding = JSON
+        self._struct: Struct | None = None
+        self._history: list[tuple[int, list]] = []
+
+    def content(self) -> dict | None:
+        if self._content is None:
+            if self._data:
+                self._content = decode_content(self._data, self._encoding)
+            elif self._struct is not None:
+                self._content = MessageToDict(self._struct)
+        return self._content
+
+    def _reset(self):
+        self.revision += 1
+        self.validated = False
+        self._content = None
+        self._data = b""
+        self._struct = None
+        self._history.clear()
+
+    def set_data(self, data: bytes, encoding: int):
+        self._reset()
+        self._data = data
+        self._encoding = encoding
+
+    def set_struct(self, struct: Struct):
+        self._reset()
+        self._struct = struct
+
+    def set_content(self, content: dict):
+        self._reset()
+        self._content = content
+
+    def validate(self):
+        """Validate the whole content once, raise ``ValueError`` if invalid."""
+        if self.validated:
+            return
+        content = self.content()
+        if content is None:
+            raise ValueError("No project content in this session")
+        if not ProjectUtils.check_project(content):
+            raise ValueError("'project' does not conform to expected schema.")
+        self.validated = True
+
+    def patch(self, ops: list, revision: int = 0):
+        """
+        Apply json patch ``ops``, validating only the top level keys they touch.
+
+        Raise ``ValueError`` and keep the content as it was when a patch fails
+        or leaves an invalid project.
+        """
+        if revision and revision != self.revision:
+            raise ValueError(
+                f"The session is at revision {self.revision}, not {revision}"
+            )
+        self.validate()
+        content, touched = json_patch(self.content(), ops)
+        try:
+            if touched is None:
+                SCHEMAS.validate("project", content)
+            else:
+                SCHEMAS.validate_keys("project", content, touched)
+        except jsonschema.ValidationError as e:
+            raise ValueError(
+                f"'project' does not conform to expected schema: {e.message}"
+            )
+
+        self._content = content
+        self.revision += 1
+        self._history.append((self.revision, ops))
+        del self._history[: -self.HISTORY]
+
+    def ops_since(self, revision: int) -> list | None:
+        """The patches from ``revision`` to the current one, if still kept."""
+        if not self._history or revision < self._history[0][0] - 1:
+            return None
+        return [ops for rev, ops in self._history if rev > revision]
+
+
+class SessionStore:
+    """The ``ProjectSession`` of every connected sid, in the server process."""
+
+    def __init__(self):
+        self._sessions: dict[str, ProjectSession] = {}
+
+    def get(self, sid: str) -> ProjectSession:
+        session = self._sessions.get(sid)
+        if session is None:
+            session = self._sessions[sid] = ProjectSession()
+        return session
+
+    def drop(self, sid: str):
+        self._sessions.pop(sid, None)
+
+    def resolve_dump(self, sid: str, data: bytes) -> bytes:
+        """
+        Remember the content of a dump request and resolve a delta.
+
+        A delta is merged into the previous content of ``sid`` and the request
+        is rewritten with the full content as json, so that any worker can run
+        it. A session request is checked to have a valid content. Raise
+        ``ValueError`` when the request cannot be resolved.
+        """
+        msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+        msg.ParseFromString(data)
+        session = self.get(sid)
+
+        if msg.content_session:
+            session.validate()
+            return data
+
+        if not msg.content_delta:
+            if msg.content_data:
+                session.set_data(msg.content_data, msg.content_encoding)
+            elif msg.HasField("content"):
+                session.set_struct(msg.content)
+            return data
+
+        base = session.content()
+        if base is None:
+            raise ValueError("No previous content to apply the delta to")
+        content = merge_patch(
+            base, decode_content(msg.content_data, msg.content_encoding)
+        )
+        if not isinstance(content, dict):
+            raise ValueError("The delta must patch an object")
+        session.set_content(content)
+
+        msg.content_data = json.dumps(
+            content, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        msg.content_encoding = JSON
+        msg.content_delta = False
+        return msg.SerializeToString()
+
+    def prepare_dump(self, sid: str, data: bytes, revision: int) -> bytes:
+        """
+        Complete a session dump request for a worker holding ``revision``.
+
+        The worker gets nothing when it is up to date, the patches it misses
+        when they are still kept, the full content otherwise.
+        """
+        msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+        msg.ParseFromString(data)
+        if not msg.content_session:
+            return data
+
+        session = self._sessions.get(sid)
+        if session is None or session.content() is None:
+            raise ValueError("No project content in this session")
+        session.validate()
+
+        msg.ClearField("content")
+        msg.content_data = b""
+        msg.content_encoding = JSON
+        msg.session_revision = session.revision
+        msg.session_base = 0
+        if revision != session.revision:
+            ops = session.ops_since(revision) if revision else None
+            if ops is None:
+                msg.content_data = json.dumps(
+                    session.content(), ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+            else:
+                msg.session_base = revision
+                msg.content_data = json.dumps(
+                    ops, ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+        return msg.SerializeToString()
+
+
+class WorkerProjects:
+    """
+    The session projects a job worker holds, by sid.
+
+    A project is patched in place of being parsed and validated again, the
+    server only forwards content that was validated already.
+    """
+
+    CAPACITY = 16
+
+    def __init__(self):
+        self._entries: OrderedDict[str, tuple[int, dict, Project]] = OrderedDict()
+
+    def revision(self, sid: str) -> int:
+        entry = self._entries.get(sid)
+        return entry[0] if entry is not None else 0
+
+    def resolve(self, sid: str, msg: sio_coder_dump_pb2.SioCoderDumpRequest) -> Project:
+        """Bring the project of ``sid`` to the revision of ``msg``."""
+        entry = self._entries.pop(sid, None)
+        path = msg.path
+        if msg.content_data and not msg.session_base:
+            content = decode_content(msg.content_data, msg.content_encoding)
+            project = ProjectUtils.load_project(content, path, check=False)
+        else:
+            if entry is None or entry[0] != (msg.session_base or msg.session_revision):
+                raise ValueError("The project session of this worker is out of date")
+            _, content, project = entry
+            touched: set[str] | None = set()
+            if msg.session_base:
+                for ops in decode_content(msg.content_data, JSON):
+                    content, keys = json_patch(content, ops)
+                    touched = (
+                        None if keys is None or touched is None else touched | keys
+                    )
+            if touched is None or "gen" in touched or project.path() != path:
+                # the hal and toolchains folders follow gen
+                project = ProjectUtils.load_project(content, path, check=False)
+            elif touched:
+                user_data = {
+                    "hal_folder": project.hal_folder(),
+                    "toolchains_folder": project.toolchains_folder(),
+                    "path": project.path(),
+                }
+                project = Project(content, user_data)
+
+        if not project.origin:
+            raise ValueError("Failed to load the project of this session")
+        self._entries[sid] = (msg.session_revision, content, project)
+        while len(self._entries) > self.CAPACITY:
+            self._entries.popitem(last=False)
+        return project
+
+    def drop(self, sid: str):
+        self._entries.pop(sid, None)
+
+
+SESSIONS = SessionStore()
+WORKER_PROJECTS = WorkerProjects()
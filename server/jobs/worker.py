@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        worker.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       send the metrics of every job to the server
+# 2026-10-18     xqyjlj       report the project session revision of the worker
+# 2026-10-18     xqyjlj       stop a cancelled job at its next emit
+#
+
+
+import datetime
+import os
+import sys
+from multiprocessing.connection import Connection
+
+from loguru import logger
+from utils.metrics import METRICS
+from utils.sys import SysUtils
+
+from .handlers import JOB_KINDS
+from .session import WORKER_PROJECTS
+
+LOG_LEVEL_ENV = "CSP_SERVER_LOG_LEVEL"
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobChannel:
+    """
+    Stands in for the ``SocketIO`` object inside a worker process.
+
+    Emits are sent back to the server process, which relays them to the
+    client while the job is still wanted. Once the scheduler has put the id
+    of the job in ``cancelled``, emits are dropped and every one but the
+    result raises ``JobCancelled``. Jobs emit between files, never while
+    writing one, so that is where they stop.
+    """
+
+    def __init__(
+        self, conn: Connection, job_id: str, cancelled=None, result_event: str = ""
+    ):
+        self._conn = conn
+        self._job_id = job_id
+        self._cancelled = cancelled
+        self._result_event = result_event
+
+    def is_cancelled(self) -> bool:
+        if self._cancelled is None:
+            return False
+        return self._cancelled.value == self._job_id.encode("ascii")
+
+    def emit(self, event: str, data=None, to: str | None = None, **kwargs):
+        if self.is_cancelled():
+            if event != self._result_event:
+                raise JobCancelled(f"Job {self._job_id} is cancelled")
+            return
+        self._conn.send(("emit", self._job_id, event, data, to))
+
+    def sleep(self, seconds: float = 0):
+        pass
+
+
+def _configure_logger():
+    today = datetime.datetime.today()
+    logger.configure(
+        handlers=[
+            {
+                "sink": sys.stderr,
+                "format": "<level>{message}</level>",
+                "colorize": True,
+                "level": os.environ.get(LOG_LEVEL_ENV, "INFO"),
+            }
+        ]
+    )
+    logger.add(
+        f"{SysUtils.exe_folder()}/log/csp-server-{today.year}-{today.month}.log",
+        rotation="10 MB",
+        level="TRACE",
+    )
+
+
+def worker_main(conn: Connection, cancelled=None):
+    """
+    Run jobs sent by the scheduler until the server goes away.
+
+    ``cancelled`` is a shared char array, the id of the job to stop.
+    """
+    _configure_logger()
+    while True:
+        try:
+            job_id, name, sid, data = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        kind = JOB_KINDS[name]
+        channel = JobChannel(conn, job_id, cancelled, kind.result_event)
+        try:
+            kind.run(channel, sid, data)  # type: ignore
+        except JobCancelled:
+            logger.info(f"Job {name} cancelled")
+        except Exception as e:
+            logger.exception(f"Job {name} failed: {str(e)!r}")
+            channel.emit(kind.result_event, kind.failure(str(e)), to=sid)
+        if kind.session:
+            # the scheduler forwards only what this worker misses next time
+            conn.send(("session", job_id, sid, WORKER_PROJECTS.revision(sid)))
+        conn.send(("metrics", job_id, METRICS.drain()))
+        conn.send(("done", job_id))
@@ -1,31 +1,31 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-
-# Licensed under the Apache License v. 2 (the "License")
-# You may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#     https://www.apache.org/licenses/LICENSE-2.0.html
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-#
-# Copyright (C) 2025-2025 xqyjlj<xqyjlj@126.com>
-#
-# @author      xqyjlj
-# @file        __init__.py
-#
-# Change Logs:
-# Date           Author       Notes
-# ------------   ----------   -----------------------------------------------
-# 2025-07-07     xqyjlj       initial version
-#
-
-from .package import Package
-from .index import PackageIndex
-from .description import PackageDescription
-
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2025 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        __init__.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2025-07-07     xqyjlj       initial version
+#
+
+from .description import PackageDescription
+from .index import PackageIndex
+from .package import Package
+
 __all__ = ['Package', 'PackageIndex', 'PackageDescription']
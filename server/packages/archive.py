@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        archive.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       link unchanged members from an installed version
+# 2026-10-18     xqyjlj       check a member against the installed copy before linking
+#
+
+
+import hashlib
+import os
+import posixpath
+import shutil
+import tarfile
+import tempfile
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterator
+
+from loguru import logger
+
+from .compress import zstd_reader
+from .store import file_digest
+
+# (index, count, file, size, total), count is 0 while the number of members is unknown
+ProgressCallback = Callable[[int, int, str, int, int], None]
+# (relative name, mode) of a member to the path of an installed file with its content,
+# as a manifest claims it, the content is checked before linking
+ReuseCallback = Callable[[str, int], str | None]
+
+COPY_BUFFER = 1024 * 1024
+# the work of one zip extraction task
+CHUNK_BYTES = 4 * 1024 * 1024
+CHUNK_FILES = 64
+# the data of a tar member checked for reuse is kept in memory up to this
+SPOOL_BYTES = 8 * 1024 * 1024
+# what the extraction filters of tarfile raise, nothing before they existed
+FILTER_ERRORS = (tarfile.FilterError,) if hasattr(tarfile, "FilterError") else ()
+
+
+def _as_completed(chunks: list, work: Callable, jobs: int) -> Iterator:
+    """Run ``work`` on every chunk and yield the chunks as they are done."""
+    if jobs <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            work(chunk)
+            yield chunk
+        return
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(chunks))) as executor:
+        futures = {executor.submit(work, chunk): chunk for chunk in chunks}
+        # yielded in this thread only, progress receivers are not thread safe
+        for future in as_completed(futures):
+            future.result()
+            yield futures[future]
+
+
+def _split(name: str) -> list[str]:
+    """The safe path components of a member name, as ``ZipFile.extract`` keeps them."""
+    parts = []
+    for part in name.replace("\\", "/").split("/"):
+        if part in ("", ".", ".."):
+            continue
+        # drop the drive of windows names
+        part = part.split(":")[-1] if os.name == "nt" else part
+        if part:
+            parts.append(part)
+    return parts
+
+
+class ArchiveExtractor:
+    """
+    Extract package archives, dropping a single top level directory.
+
+    A tar.gz or tar.zst is streamed through one decompression pass, members are
+    written as they come. The members of a zip are written in chunks by
+    ``jobs`` threads sharing the archive, so that inflating overlaps with
+    writing. In all cases the top level directory is stripped from the names
+    while writing, the tree is never moved afterwards. Progress reports the
+    members and the bytes done.
+
+    A member ``reuse`` knows an installed copy of is linked (or copied) from
+    it instead, if the content is the same: a zip member by the CRC32 of the
+    archive, it is then never inflated, a tar member by the sha256 of its
+    data. ``saved`` counts the bytes not extracted that way.
+    """
+
+    def __init__(
+        self,
+        on_progress: ProgressCallback | None = None,
+        jobs: int = 0,
+        reuse: ReuseCallback | None = None,
+    ):
+        self._on_progress = on_progress
+        self._jobs = jobs or min(8, (os.cpu_count() or 1) + 2)
+        self._reuse = reuse
+        self._saved = 0
+
+    @property
+    def saved(self) -> int:
+        return self._saved
+
+    def _progress(self, index: int, count: int, file: str, size: int, total: int):
+        if self._on_progress is not None:
+            self._on_progress(index, count, file, size, total)
+
+    @staticmethod
+    def _top(names: list[list[str]]) -> str:
+        """The directory all members are in, if there is exactly one."""
+        tops = {parts[0] for parts in names if parts}
+        if len(tops) != 1 or not any(len(parts) > 1 for parts in names):
+            return ""
+        return tops.pop()
+
+    def _source(self, parts: list[str], mode: int) -> str | None:
+        """The installed copy of a member, its content is still to be checked."""
+        if self._reuse is None:
+            return None
+        return self._reuse("/".join(parts), mode)
+
+    def _link(self, source: str, target: str, size: int) -> bool:
+        """Link the installed copy of a member to ``target``, False to extract it."""
+        try:
+            os.link(source, target)
+        except OSError:
+            # another filesystem, or the installed version is gone meanwhile
+            try:
+                shutil.copy2(source, target)
+            except OSError:
+                return False
+        self._saved += size
+        return True
+
+    def extract_zip(self, file: str, dest: str):
+        with zipfile.ZipFile(file, "r") as archive:
+            members = archive.infolist()
+            names = [_split(member.filename) for member in members]
+            top = self._top(names)
+            # a single top level file is not a directory to strip
+            if top and any(
+                len(parts) == 1 and not member.is_dir()
+                for parts, member in zip(names, members)
+            ):
+                top = ""
+
+            count = len(members)
+            total = sum(member.file_size for member in members)
+            index = size = 0
+            files = []
+            for member, parts in zip(members, names):
+                parts = parts[1:] if top else parts
+                if member.is_dir() or not parts:
+                    os.makedirs(os.path.join(dest, *parts), exist_ok=True)
+                    index += 1
+                    self._progress(index, count, member.filename, size, total)
+                else:
+                    files.append((member, os.path.join(dest, *parts)))
+
+            for parent in {os.path.dirname(target) for _, target in files}:
+                os.makedirs(parent, exist_ok=True)
+
+            extract = []
+            for member, target in files:
+                parts = _split(member.filename)[1 if top else 0 :]
+                source = self._source(parts, member.external_attr >> 16)
+                if (
+                    source is not None
+                    and self._same_zip(member, source)
+                    and self._link(source, target, member.file_size)
+                ):
+                    index += 1
+                    size += member.file_size
+                    self._progress(index, count, member.filename, size, total)
+                else:
+                    extract.append((member, target))
+
+            # a task writes a chunk of members, small files do not cost a future each
+            for chunk in _as_completed(
+                self._chunks(extract),
+                lambda chunk: self._write_zip(archive, chunk),
+                self._jobs,
+            ):
+                for member, _ in chunk:
+                    index += 1
+                    size += member.file_size
+                    self._progress(index, count, member.filename, size, total)
+
+    @staticmethod
+    def _same_zip(member: zipfile.ZipInfo, source: str) -> bool:
+        """Whether ``source`` has the size and CRC32 of ``member`` in the archive."""
+        try:
+            if os.path.getsize(source) != member.file_size:
+                return False
+            crc = 0
+            with open(source, "rb") as f:
+                while chunk := f.read(COPY_BUFFER):
+                    crc = zlib.crc32(chunk, crc)
+        except OSError:
+            return False
+        return crc == member.CRC
+
+    @staticmethod
+    def _chunks(
+        files: list[tuple[zipfile.ZipInfo, str]],
+    ) -> list[list[tuple[zipfile.ZipInfo, str]]]:
+        # the largest first, so that no thread is left alone with a big one
+        files = sorted(files, key=lambda item: item[0].file_size, reverse=True)
+        chunks: list[list[tuple[zipfile.ZipInfo, str]]] = []
+        chunk_size = 0
+        for item in files:
+            if (
+                not chunks
+                or chunk_size >= CHUNK_BYTES
+                or len(chunks[-1]) >= CHUNK_FILES
+            ):
+                chunks.append([])
+                chunk_size = 0
+            chunks[-1].append(item)
+            chunk_size += item[0].file_size
+        return chunks
+
+    @staticmethod
+    def _write_zip(archive: zipfile.ZipFile, chunk: list[tuple[zipfile.ZipInfo, str]]):
+        # ZipFile reads of different members are thread safe, the handle is shared
+        for member, target in chunk:
+            with archive.open(member) as source, open(target, "wb") as f:
+                shutil.copyfileobj(source, f, COPY_BUFFER)
+
+    @staticmethod
+    @contextmanager
+    def _open_tar(file: str, zst: bool) -> Iterator[tuple[tarfile.TarFile, BinaryIO]]:
+        with open(file, "rb") as raw:
+            if not zst:
+                with tarfile.open(fileobj=raw, mode="r|gz") as archive:
+                    yield archive, raw
+                return
+            with zstd_reader(raw) as reader:
+                with tarfile.open(fileobj=reader, mode="r|") as archive:
+                    yield archive, raw
+
+    def extract_tar_gz(self, file: str, dest: str):
+        with self._open_tar(file, False) as (archive, raw):
+            self._extract_tar(archive, raw, os.path.getsize(file), dest)
+
+    def extract_tar_zst(self, file: str, dest: str):
+        with self._open_tar(file, True) as (archive, raw):
+            self._extract_tar(archive, raw, os.path.getsize(file), dest)
+
+    @staticmethod
+    def read_member(file: str, file_type: str, name: str) -> bytes | None:
+        """
+        Read the member ``name`` of a zip, or of a tar if it is the first one.
+
+        A streamed tar is not read through for it, a member put first (like the
+        manifest of ``make-pkg``) only costs its own bytes.
+        """
+        if file_type == "zip":
+            with zipfile.ZipFile(file, "r") as archive:
+                try:
+                    return archive.read(name)
+                except KeyError:
+                    return None
+
+        with ArchiveExtractor._open_tar(file, file_type == "tar.zst") as (archive, _):
+            member = archive.next()
+            if member is None or not member.isfile():
+                return None
+            if "/".join(_split(member.name)) != name:
+                return None
+            reader = archive.extractfile(member)
+            return reader.read() if reader is not None else None
+
+    def _extract_tar(
+        self, archive: tarfile.TarFile, raw: BinaryIO, total: int, dest: str
+    ):
+        """Extract a streamed tar, ``raw`` is the compressed file for progress."""
+        # a safe name may still lead outside through a symbolic link extracted
+        # before it, only the realpath checks of the "data" filter catch that
+        data_filter = hasattr(tarfile, "data_filter")
+        options = {"filter": "data"} if data_filter else {}
+        root = os.path.realpath(dest)
+        top: str | None = None
+        index = 0
+        for member in archive:
+            parts = _split(member.name)
+            if top is None and parts:
+                # guess from the first member, undone if a later one is not in it
+                top = parts[0] if len(parts) > 1 or member.isdir() else ""
+            link = _split(member.linkname) if member.islnk() else None
+            if top and parts and not self._under(top, member, parts, link):
+                self._unstrip(dest, top)
+                top = ""
+
+            name = member.name
+            if top and parts:
+                parts = parts[1:]
+                link = link[1:] if link is not None else None
+            member.name = posixpath.join(*parts) if parts else "."
+            if link is not None:
+                member.linkname = posixpath.join(*link)
+            if member.issym() and not self._inside(member.name, member.linkname):
+                logger.warning(f"skip {name!r}, it links outside the package")
+            elif not data_filter and not self._contained(root, dest, member):
+                logger.warning(f"skip {name!r}, it is outside the package")
+            elif not (
+                member.isfile() and self._reuse_tar(archive, member, parts, dest)
+            ):
+                try:
+                    archive.extract(member, dest, **options)
+                except FILTER_ERRORS as e:
+                    logger.warning(f"skip {name!r}, {e}")
+
+            index += 1
+            self._progress(index, 0, name, raw.tell(), total)
+        self._progress(index, index, name if index else "", total, total)
+
+    def _reuse_tar(
+        self,
+        archive: tarfile.TarFile,
+        member: tarfile.TarInfo,
+        parts: list[str],
+        dest: str,
+    ) -> bool:
+        """
+        Link the installed copy of ``member`` if its data has the same sha256,
+        True once the member is written either way.
+
+        A streamed member is read only once, its data is kept while hashing and
+        written from there if it is not the same.
+        """
+        if not parts:
+            return False
+        source = self._source(parts, member.mode)
+        if source is None:
+            return False
+        if not self._contained(os.path.realpath(dest), dest, member):
+            # left to the extraction, which refuses it
+            return False
+        # the mode and time written, as the extraction would filter them
+        info = member
+        if hasattr(tarfile, "data_filter"):
+            try:
+                info = tarfile.data_filter(member, dest)
+            except FILTER_ERRORS:
+                return False
+        reader = archive.extractfile(member)
+        if reader is None:
+            return False
+
+        target = os.path.join(dest, *parts)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with tempfile.SpooledTemporaryFile(SPOOL_BYTES, dir=dest) as spool:
+            digest = hashlib.sha256()
+            while chunk := reader.read(COPY_BUFFER):
+                digest.update(chunk)
+                spool.write(chunk)
+            try:
+                same = file_digest(source) == digest.hexdigest()
+            except OSError:
+                same = False
+            if same and self._link(source, target, member.size):
+                return True
+
+            if not same:
+                logger.warning(f"{member.name!r} differs from {source!r}, extract it")
+            spool.seek(0)
+            with open(target, "wb") as f:
+                shutil.copyfileobj(spool, f, COPY_BUFFER)
+        archive.chmod(info, target)
+        archive.utime(info, target)
+        return True
+
+    @staticmethod
+    def _contained(root: str, dest: str, member: tarfile.TarInfo) -> bool:
+        """
+        Whether ``member`` and the target of a link stay in ``dest`` (``root``
+        resolved), through the symbolic links extracted so far.
+        """
+        target = os.path.realpath(os.path.join(dest, member.name))
+        paths = [target]
+        if member.issym():
+            paths.append(
+                os.path.realpath(os.path.join(os.path.dirname(target), member.linkname))
+            )
+        elif member.islnk():
+            paths.append(os.path.realpath(os.path.join(dest, member.linkname)))
+        return all(os.path.commonpath([root, path]) == root for path in paths)
+
+    @staticmethod
+    def _inside(name: str, target: str) -> bool:
+        """Whether a symbolic link ``name`` to ``target`` stays in the folder."""
+        if posixpath.isabs(target) or os.path.isabs(target):
+            return False
+        path = posixpath.normpath(posixpath.join(posixpath.dirname(name), target))
+        return path != ".." and not path.startswith("../")
+
+    @staticmethod
+    def _under(
+        top: str, member: tarfile.TarInfo, parts: list[str], link: list[str] | None
+    ) -> bool:
+        """Whether a member (and the target of a hard link) is in ``top``."""
+        if parts[0] != top or (len(parts) == 1 and not member.isdir()):
+            return False
+        return link is None or link[:1] == [top]
+
+    @staticmethod
+    def _unstrip(dest: str, top: str):
+        """Put what was written so far back into the ``top`` directory."""
+        folder = tempfile.mkdtemp(prefix="tmp.", dir=dest)
+        for entry in os.listdir(dest):
+            path = os.path.join(dest, entry)
+            if path != folder:
+                os.rename(path, os.path.join(folder, entry))
+        os.rename(folder, os.path.join(dest, top))
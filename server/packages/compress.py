@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        compress.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO
+
+try:
+    import zstandard
+except ImportError:  # optional, tar.zst packages can then not be made or installed
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b\x08"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# uncompressed bytes per gzip block, and the window primed from the previous one
+BLOCK_SIZE = 1024 * 1024
+WINDOW_SIZE = 32 * 1024
+
+
+def _deflate(block: bytes, window: bytes, level: int, last: bool) -> bytes:
+    if window:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, zdict=window
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # a sync flush ends the block on a byte boundary, the next one follows it
+    flush = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return compressor.compress(block) + compressor.flush(flush)
+
+
+class ParallelGzipWriter:
+    """
+    Write a gzip stream, compressing blocks on ``jobs`` threads as pigz does.
+
+    Every block is deflated on its own, primed with the last 32 KiB of the
+    previous one, and the blocks are joined into a single gzip member. Any
+    gzip reader reads it, the ratio is close to a single threaded deflate.
+    ``zlib`` releases the GIL while compressing.
+    """
+
+    def __init__(self, fileobj: BinaryIO, level: int = 6, jobs: int = 0):
+        if not 1 <= level <= 9:
+            raise ValueError(f"gzip level must be in 1..9, not {level}")
+        self._fileobj = fileobj
+        self._level = level
+        self._jobs = jobs or os.cpu_count() or 1
+        self._executor = (
+            ThreadPoolExecutor(max_workers=self._jobs) if self._jobs > 1 else None
+        )
+        self._pending: deque[Future] = deque()
+        self._buffer = bytearray()
+        self._window = b""
+        self._crc = 0
+        self._size = 0
+        self._closed = False
+
+        xfl = 2 if level == 9 else 4 if level == 1 else 0
+        header = struct.pack("<3sBIBB", GZIP_MAGIC, 0, int(time.time()), xfl, 255)
+        self._fileobj.write(header)
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= BLOCK_SIZE:
+            block = bytes(self._buffer[:BLOCK_SIZE])
+            del self._buffer[:BLOCK_SIZE]
+            self._submit(block, False)
+        return len(data)
+
+    def _submit(self, block: bytes, last: bool):
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        args = (block, self._window, self._level, last)
+        self._window = (self._window + block)[-WINDOW_SIZE:]
+
+        if self._executor is None:
+            self._fileobj.write(_deflate(*args))
+            return
+        self._pending.append(self._executor.submit(_deflate, *args))
+        # keep a bounded number of blocks in memory
+        while len(self._pending) > self._jobs * 2:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self):
+        """Write the last block and the trailer, ``fileobj`` is left open."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), True)
+            self._buffer.clear()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+            self._fileobj.write(
+                struct.pack("<II", self._crc & 0xFFFFFFFF, self._size & 0xFFFFFFFF)
+            )
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelGzipWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def zstd_writer(fileobj: BinaryIO, level: int = 10, jobs: int = 0):
+    """A zstd stream writer compressing on ``jobs`` threads, ``fileobj`` is left open."""
+    if zstandard is None:
+        raise ValueError("tar.zst packages need the 'zstandard' module")
+    if not 1 <= level <= 22:
+        raise ValueError(f"zstd level must be in 1..22, not {level}")
+    jobs = jobs or os.cpu_count() or 1
+    compressor = zstandard.ZstdCompressor(level=level, threads=jobs if jobs > 1 else 0)
+    return compressor.stream_writer(fileobj, closefd=False)
+
+
+def zstd_reader(fileobj: BinaryIO):
+    if zstandard is None:
+        raise ValueError("tar.zst packages need the 'zstandard' module")
+    return zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False)
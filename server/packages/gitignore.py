@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        gitignore.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterator
+
+from loguru import logger
+
+
+def _translate(pattern: str) -> str:
+    """The regex of a gitignore glob, ``*`` and ``?`` do not match ``/``."""
+    result = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**", i):
+            before = i == 0 or pattern[i - 1] == "/"
+            after = i + 2 == n or pattern[i + 2] == "/"
+            if before and after:
+                if i + 2 == n:
+                    # a trailing "/**" matches everything inside
+                    result.append(".*")
+                else:
+                    # a leading "**/" or a "/**/" matches zero or more folders
+                    result.append("(?:.*/)?")
+                    i += 1
+                i += 2
+                continue
+            # any other "**" is a "*"
+            result.append("[^/]*")
+            i += 2
+        elif c == "*":
+            result.append("[^/]*")
+            i += 1
+        elif c == "?":
+            result.append("[^/]")
+            i += 1
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            j = pattern.find("]", j)
+            if j < 0:
+                result.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1 : j].replace("\\", "\\\\")
+            if body[:1] in "!^":
+                body = "^" + body[1:]
+            result.append(f"(?!/)[{body}]")
+            i = j + 1
+        elif c == "\\" and i + 1 < n:
+            result.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            result.append(re.escape(c))
+            i += 1
+    return "".join(result)
+
+
+class GitIgnoreRules:
+    """
+    The patterns of one ``.gitignore``, compiled into a single regex.
+
+    The patterns are joined in reverse order as groups of one alternation, the
+    group that matches is then the last matching pattern, which decides as in
+    git. Folder only patterns (``build/``) get a second regex for folders.
+    """
+
+    def __init__(self, text: str):
+        self._file, self._file_negated = self._compile(text, False)
+        self._folder, self._folder_negated = self._compile(text, True)
+
+    @staticmethod
+    def _compile(text: str, folder: bool) -> tuple[re.Pattern | None, list[bool]]:
+        groups = []
+        negated = []
+        for line in text.splitlines():
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith(("\\!", "\\#")):
+                line = line[1:]
+            if line.endswith("/"):
+                if not folder:
+                    continue
+                line = line.rstrip("/")
+            if not line:
+                continue
+
+            if "/" in line:
+                # anchored to the folder of the .gitignore
+                regex = _translate(line.lstrip("/"))
+            else:
+                regex = f"(?:.*/)?{_translate(line)}"
+            groups.append(f"({regex})")
+            negated.append(negate)
+
+        if not groups:
+            return None, []
+        groups.reverse()
+        negated.reverse()
+        return re.compile(f"(?:{'|'.join(groups)})\\Z", re.S), negated
+
+    def match(self, path: str, folder: bool) -> bool | None:
+        """
+        Whether ``path``, relative to the ``.gitignore`` folder, is ignored.
+
+        ``None`` when no pattern matches it.
+        """
+        regex, negated = (
+            (self._folder, self._folder_negated)
+            if folder
+            else (self._file, self._file_negated)
+        )
+        if regex is None:
+            return None
+        m = regex.match(path)
+        if m is None:
+            return None
+        return not negated[m.lastindex - 1]  # type: ignore
+
+
+@lru_cache(maxsize=256)
+def _rules(text: str) -> GitIgnoreRules:
+    return GitIgnoreRules(text)
+
+
+class GitIgnoreMatcher:
+    """
+    The hierarchical ``.gitignore`` files of a folder tree.
+
+    The ``.gitignore`` of a folder is read when the walk enters it, a path is
+    only matched against the files of its own ancestors, the deepest one with
+    a matching pattern decides. Ignored folders are not walked into, so their
+    content is never looked at, as in git.
+    """
+
+    SKIP_FOLDERS = (".git",)
+
+    def __init__(self, base: str):
+        self._base = base
+        # by folder relative to base, "" for base
+        self._rules: dict[str, GitIgnoreRules] = {}
+
+    def add_folder(self, folder: str):
+        """Read the ``.gitignore`` of ``folder``, relative to the base."""
+        path = os.path.join(self._base, folder, ".gitignore")
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._rules[folder] = _rules(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to read .gitignore at {path}: {e}")
+
+    def is_ignored(self, path: str, folder: bool = False) -> bool:
+        """Whether ``path``, relative to the base with ``/``, is ignored."""
+        parts = path.split("/")
+        for depth in range(len(parts) - 1, -1, -1):
+            rules = self._rules.get("/".join(parts[:depth]))
+            if rules is None:
+                continue
+            ignored = rules.match("/".join(parts[depth:]), folder)
+            if ignored is not None:
+                return ignored
+        return False
+
+    def walk(self) -> Iterator[tuple[str, list[str]]]:
+        """Walk the base like ``os.walk``, yield ``(root, kept files)``."""
+        for root, dirs, files in os.walk(self._base):
+            folder = os.path.relpath(root, self._base).replace("\\", "/")
+            folder = "" if folder == "." else folder
+            self.add_folder(folder)
+            prefix = f"{folder}/" if folder else ""
+
+            dirs[:] = [
+                d
+                for d in dirs
+                if d not in self.SKIP_FOLDERS
+                and not self.is_ignored(prefix + d, folder=True)
+            ]
+            if self._rules:
+                files = [f for f in files if not self.is_ignored(prefix + f)]
+            yield root, files
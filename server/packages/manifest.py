@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        manifest.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import json
+import os
+
+from .store import file_digest
+
+MANIFEST_NAME = ".csppmanifest"
+
+
+class PackageManifest:
+    """
+    The sha256 and size of every file of a package, by relative path.
+
+    ``make-pkg`` writes it as the first member of the archive and an install
+    keeps it in the installed folder, so that the next version can link the
+    files it shares with an installed one instead of extracting them.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        version: str,
+        files: dict[str, tuple[str, int]] | None = None,
+    ):
+        self.kind = kind
+        self.name = name
+        self.version = version
+        self.files = files if files is not None else {}
+
+    @staticmethod
+    def from_files(
+        kind: str, name: str, version: str, files: list[tuple[str, str]]
+    ) -> "PackageManifest":
+        """Hash ``(source file, relative name)`` files."""
+        manifest = PackageManifest(kind, name, version)
+        for source, rel in files:
+            rel = rel.replace("\\", "/")
+            if rel != MANIFEST_NAME:
+                manifest.files[rel] = (file_digest(source), os.path.getsize(source))
+        return manifest
+
+    @staticmethod
+    def from_folder(
+        kind: str, name: str, version: str, folder: str
+    ) -> "PackageManifest":
+        files = []
+        for root, _, names in os.walk(folder):
+            for file in names:
+                path = os.path.join(root, file)
+                if os.path.isfile(path) and not os.path.islink(path):
+                    files.append((path, os.path.relpath(path, folder)))
+        return PackageManifest.from_files(kind, name, version, files)
+
+    @staticmethod
+    def loads(data: bytes) -> "PackageManifest | None":
+        try:
+            origin = json.loads(data)
+            files = {
+                str(rel): (str(digest), int(size))
+                for rel, (digest, size) in origin["files"].items()
+            }
+            return PackageManifest(
+                str(origin["type"]), str(origin["name"]), str(origin["version"]), files
+            )
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def dumps(self) -> bytes:
+        origin = {
+            "type": self.kind,
+            "name": self.name,
+            "version": self.version,
+            "files": {rel: list(entry) for rel, entry in sorted(self.files.items())},
+        }
+        return json.dumps(origin, ensure_ascii=False, separators=(",", ":")).encode()
+
+    @staticmethod
+    def load(folder: str) -> "PackageManifest | None":
+        """The manifest of an installed package, None if it has none."""
+        try:
+            with open(os.path.join(folder, MANIFEST_NAME), "rb") as f:
+                return PackageManifest.loads(f.read())
+        except OSError:
+            return None
+
+    def save(self, folder: str):
+        with open(os.path.join(folder, MANIFEST_NAME), "wb") as f:
+            f.write(self.dumps())
+
+    def shared(self, other: "PackageManifest") -> int:
+        """The bytes of the files of this manifest whose content ``other`` has."""
+        digests = {digest for digest, _ in other.files.values()}
+        return sum(size for digest, size in self.files.values() if digest in digests)
+
+    def digests(self, folder: str) -> dict[str, str]:
+        """The path in ``folder`` of every content of this manifest."""
+        return {
+            digest: os.path.join(folder, *rel.split("/"))
+            for rel, (digest, _) in self.files.items()
+        }
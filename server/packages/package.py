@@ -22,26 +22,68 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-29     xqyjlj       initial version
+# 2026-10-18     xqyjlj       allow concurrent installs of different packages
+# 2026-10-18     xqyjlj       record install throughput in metrics
+# 2026-10-18     xqyjlj       validate with the cached schema validators
+# 2026-10-18     xqyjlj       load descriptions and index with the safe loader
+# 2026-10-18     xqyjlj       extract archives with ArchiveExtractor, report bytes
+# 2026-10-18     xqyjlj       match .gitignore files with GitIgnoreMatcher
+# 2026-10-18     xqyjlj       make parallel gzip and zstd packages
+# 2026-10-18     xqyjlj       share installed files through the ObjectStore
+# 2026-10-18     xqyjlj       upgrade from an installed version with the manifest
+# 2026-10-18     xqyjlj       replace an installed version and the index atomically
+# 2026-10-18     xqyjlj       never delete a replaced version that was not restored
 #
 
-import fnmatch
 import glob
 import os
 import platform
 import shutil
 import tarfile
+import tempfile
+import time
 import zipfile
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
+from typing import BinaryIO, Callable
 
-import jsonschema
 from blinker import Signal
 from loguru import logger
 from ruamel.yaml import YAML
+from utils.io import IoUtils
+from utils.lock import PACKAGE_LOCKS
+from utils.metrics import METRICS
+from utils.schema import SCHEMAS
 from utils.sys import SysUtils
 
+from .archive import ArchiveExtractor, ReuseCallback
+from .compress import GZIP_MAGIC, ZSTD_MAGIC, ParallelGzipWriter, zstd_writer
 from .description import PackageDescription
+from .gitignore import GitIgnoreMatcher
 from .index import PackageIndex
+from .manifest import MANIFEST_NAME, PackageManifest
+from .store import ObjectStore
+
+INSTALL_SECONDS = METRICS.histogram(
+    "csp_package_install_seconds",
+    "Duration of successful package installs.",
+)
+INSTALL_BYTES = METRICS.counter(
+    "csp_package_install_bytes_total", "Bytes of installed package files."
+)
+INSTALL_FILES = METRICS.counter(
+    "csp_package_install_files_total", "Number of installed package files."
+)
+# the formats of a .csppack, "auto" is zip on windows and tar.gz elsewhere
+PACK_FORMATS = ("auto", "tar.gz", "tar.zst", "zip")
+PACK_LEVELS = {"tar.gz": 6, "tar.zst": 10, "zip": 9}
+PACK_LEVEL_RANGES = {"tar.gz": (1, 9), "tar.zst": (1, 22), "zip": (1, 9)}
+
+INSTALL_THROUGHPUT = METRICS.gauge(
+    "csp_package_install_throughput",
+    "Throughput of the last package install, per second.",
+    ("unit",),
+)
 
 
 class Package:
@@ -55,25 +97,18 @@ class Package:
             "install": Signal("install"),
             "make": Signal("make"),
         }
+        self.__extractor: ArchiveExtractor | None = None
 
     @logger.catch(default=False)
-    def __check_yaml(self, schema_path: str, instance: dict) -> bool:
-        with open(schema_path, "r", encoding="utf-8") as f:
-            yaml = YAML()
-            schema = yaml.load(f.read())
-            jsonschema.validate(instance=instance, schema=schema)
+    def __check_yaml(self, schema: str, instance: dict) -> bool:
+        SCHEMAS.validate(schema, instance)
         return True
 
     @logger.catch(default=None)
     def __get_package_description(self, path: str) -> PackageDescription | None:
         if os.path.isfile(path):
-            with open(path, "r", encoding="utf-8") as f:
-                yaml = YAML()
-                package: dict = yaml.load(f.read())
-                path = os.path.join(
-                    SysUtils.database_folder(), "schema", "packageDescription.yml"
-                )
-                succeed = self.__check_yaml(path, package)
+            package: dict = IoUtils.read_yaml(path)
+            succeed = self.__check_yaml("packageDescription", package)
             if succeed:
                 return PackageDescription(package)
             else:
@@ -96,99 +131,6 @@ class Package:
         else:
             return None
 
-    def __collect_gitignore_patterns(self, base_path: str) -> dict[str, list[str]]:
-        """Collect all .gitignore files and their patterns from the directory tree"""
-        gitignore_map = {}
-
-        for root, dirs, files in os.walk(base_path):
-            # Skip .git directories
-            dirs[:] = [d for d in dirs if d != ".git"]
-
-            gitignore_file = os.path.join(root, ".gitignore")
-            if os.path.isfile(gitignore_file):
-                patterns = []
-                try:
-                    with open(gitignore_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            # Skip empty lines and comments
-                            if line and not line.startswith("#"):
-                                patterns.append(line)
-                    if patterns:
-                        gitignore_map[root] = patterns
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to read .gitignore at {gitignore_file}: {e}"
-                    )
-
-        return gitignore_map
-
-    def __is_ignored(
-        self, file_path: str, base_path: str, gitignore_map: dict[str, list[str]]
-    ) -> bool:
-        """Check if a file should be ignored based on hierarchical .gitignore patterns"""
-        if not gitignore_map:
-            return False
-
-        # Get relative path from base directory
-        rel_path = os.path.relpath(file_path, base_path).replace("\\", "/")
-        file_dir = str(Path(file_path).parent)
-
-        # Collect applicable patterns from all .gitignore files
-        # Process from most general (base) to most specific (closest to file)
-        applicable_patterns = []
-
-        # Find all .gitignore files that could affect this file
-        for gitignore_dir, patterns in gitignore_map.items():
-            # Check if this .gitignore file is in a parent directory of the file
-            try:
-                rel_gitignore_path = os.path.relpath(gitignore_dir, base_path)
-                if file_dir.startswith(gitignore_dir) or gitignore_dir == base_path:
-                    # Calculate relative path from this .gitignore's directory
-                    if gitignore_dir == base_path:
-                        check_path = rel_path
-                    else:
-                        check_path = os.path.relpath(file_path, gitignore_dir).replace(
-                            "\\", "/"
-                        )
-
-                    applicable_patterns.append((gitignore_dir, patterns, check_path))
-            except ValueError:
-                # Skip if paths are not related
-                continue
-
-        # Sort by directory depth (deeper directories have higher precedence)
-        applicable_patterns.sort(key=lambda x: x[0].count(os.sep))
-
-        is_ignored = False
-
-        # Apply patterns in order (general to specific)
-        for gitignore_dir, patterns, check_path in applicable_patterns:
-            for pattern in patterns:
-                # Handle negation patterns (starting with !)
-                negate = pattern.startswith("!")
-                if negate:
-                    pattern = pattern[1:]
-
-                # Handle directory patterns (ending with /)
-                if pattern.endswith("/"):
-                    pattern = pattern[:-1]
-                    # Check if any parent directory matches
-                    path_parts = check_path.split("/")
-                    for i in range(len(path_parts)):
-                        dir_path = "/".join(path_parts[: i + 1])
-                        if fnmatch.fnmatch(dir_path, pattern):
-                            is_ignored = not negate
-                            break
-                else:
-                    # Check file pattern
-                    if fnmatch.fnmatch(check_path, pattern) or fnmatch.fnmatch(
-                        os.path.basename(check_path), pattern
-                    ):
-                        is_ignored = not negate
-
-        return is_ignored
-
     def get_package_description(self, path: str) -> PackageDescription | None:
         if path in self.__pdscs:
             return self.__pdscs[path]
@@ -201,16 +143,9 @@ class Package:
     def __get_package_index(self) -> PackageIndex:
         file = SysUtils.packages_index_file()
         if os.path.isfile(file):
-            with open(file, "r", encoding="utf-8") as f:
-                yaml = YAML()
-                index = yaml.load(f.read())
-                # noinspection PyArgumentList
-                succeed = self.__check_yaml(
-                    os.path.join(
-                        SysUtils.database_folder(), "schema", "packageIndex.yml"
-                    ),
-                    index,
-                )
+            index = IoUtils.read_yaml(file)
+            # noinspection PyArgumentList
+            succeed = self.__check_yaml("packageIndex", index)
             if succeed:
                 return PackageIndex(index if index is not None else {})
             else:
@@ -238,22 +173,28 @@ class Package:
         return stream.getvalue()
 
     def save(self):
-        with open(SysUtils.packages_index_file(), "w", encoding="utf-8") as f:
-            f.write(self.dump())
+        IoUtils.write_text(SysUtils.packages_index_file(), self.dump())
 
     def install(self, path: str) -> PackageDescription | None:
         if not os.path.exists(path):
             return None
 
         repository_folder = SysUtils.packages_folder()
-        tmp_folder = os.path.join(repository_folder, "tmp")
-
-        if os.path.isdir(tmp_folder):
-            shutil.rmtree(tmp_folder)
-        if os.path.isfile(tmp_folder):
-            os.remove(tmp_folder)
-        os.makedirs(tmp_folder)
-
+        os.makedirs(repository_folder, exist_ok=True)
+        # every install extracts into its own folder, so they can run side by side
+        tmp_folder = tempfile.mkdtemp(prefix="tmp.", dir=repository_folder)
+        start = time.perf_counter()
+        try:
+            package_desc = self.__install(path, tmp_folder)
+            if package_desc is not None:
+                self.__record_install(package_desc, time.perf_counter() - start)
+            return package_desc
+        finally:
+            if os.path.isdir(tmp_folder):
+                shutil.rmtree(tmp_folder, ignore_errors=True)
+
+    def __install(self, path: str, tmp_folder: str) -> PackageDescription | None:
+        repository_folder = SysUtils.packages_folder()
         if os.path.isfile(path):
             status = self._install_from_file(path, tmp_folder)
         elif os.path.isdir(path):
@@ -279,48 +220,125 @@ class Package:
             repository_folder, kind, vendor.lower(), name.lower()
         )
         folder = os.path.join(vendor_folder, version).replace("\\", "/")
-        if os.path.isdir(folder):
-            shutil.rmtree(folder)
-        elif os.path.isfile(folder):
-            os.remove(folder)
-
-        if not os.path.isdir(vendor_folder):
-            os.makedirs(vendor_folder)
-        elif os.path.isfile(vendor_folder):
-            os.remove(vendor_folder)
-            os.makedirs(vendor_folder)
-
-        shutil.move(tmp_folder, folder)
+        manifest = PackageManifest.load(tmp_folder)
+        digests = None
+        if manifest is None:
+            # a directory or a package made before the manifest, hashed here
+            manifest = PackageManifest.from_folder(kind, name, version, tmp_folder)
+            manifest.save(tmp_folder)
+            digests = {rel: digest for rel, (digest, _) in manifest.files.items()}
+
+        store = ObjectStore(SysUtils.packages_objects_folder())
+        try:
+            store.add_tree(tmp_folder, digests)
+        except OSError as e:
+            # the files stay copies, the install does not depend on the store
+            logger.warning(f"failed to store {name}-{version}: {e}")
+
+        replaced = None
+        with PACKAGE_LOCKS.lock(PACKAGE_LOCKS.key(folder)):
+            if os.path.isdir(folder):
+                # moved aside, the installed version is never missing while indexed
+                replaced = tempfile.mkdtemp(prefix="tmp.", dir=repository_folder)
+                os.rename(folder, os.path.join(replaced, version))
+            elif os.path.isfile(folder):
+                os.remove(folder)
+
+            if os.path.isfile(vendor_folder):
+                os.remove(vendor_folder)
+            os.makedirs(vendor_folder, exist_ok=True)
+
+            try:
+                shutil.move(tmp_folder, folder)
+            except BaseException:
+                if replaced is not None:
+                    self.__restore(replaced, version, folder)
+                raise
+            if replaced is not None:
+                shutil.rmtree(replaced, ignore_errors=True)
+        if replaced is not None:
+            store.collect()
+
         package_path = os.path.relpath(
             folder, str(Path(SysUtils.packages_index_file()).parent)
         ).replace("\\", "/")
-        self.__index.origin.setdefault(kind, {}).setdefault(name, {})[
-            version
-        ] = package_path
-        self.save()
+
+        def add(origin: dict):
+            origin.setdefault(kind, {}).setdefault(name, {})[version] = package_path
+
+        self.__update_index(add)
 
         return package_desc
 
+    @staticmethod
+    def __restore(replaced: str, version: str, folder: str):
+        """Put the version moved aside into ``replaced`` back to ``folder``."""
+        # a move across devices copies the tree, a partial copy may be there
+        shutil.rmtree(folder, ignore_errors=True)
+        try:
+            os.rename(os.path.join(replaced, version), folder)
+        except OSError as e:
+            logger.error(
+                f"failed to restore {folder!r}, the installed version is kept in "
+                f"{os.path.join(replaced, version)!r}: {e}"
+            )
+            return
+        shutil.rmtree(replaced, ignore_errors=True)
+
+    def __record_install(self, package_desc: PackageDescription, seconds: float):
+        folder = self.index().path(
+            package_desc.type.lower(), package_desc.name, package_desc.version.lower()
+        )
+        files = 0
+        size = 0
+        for root, _, names in os.walk(folder):
+            for name in names:
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+                files += 1
+
+        INSTALL_SECONDS.observe(seconds)
+        INSTALL_BYTES.inc(size)
+        INSTALL_FILES.inc(files)
+        if seconds > 0:
+            INSTALL_THROUGHPUT.set(size / seconds, unit="bytes")
+            INSTALL_THROUGHPUT.set(files / seconds, unit="files")
+
     def uninstall(self, kind: str, name: str, version: str) -> bool:
         path = self.index().path(kind, name, version)
 
-        if os.path.isdir(path):
-            shutil.rmtree(path)
-        elif os.path.isfile(path):
-            os.remove(path)
-        else:
-            logger.error(f"uninstall failed {kind}@{name}:{version}")
-            return False
-        # clear index tree
-        self.__index.origin[kind][name].pop(version)
-        if len(self.__index.origin[kind][name]) == 0:
-            self.__index.origin[kind].pop(name)
-            if len(self.__index.origin[kind]) == 0:
-                self.__index.origin.pop(kind)
-        self.save()
+        with PACKAGE_LOCKS.lock(PACKAGE_LOCKS.key(path)):
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.isfile(path):
+                os.remove(path)
+            else:
+                logger.error(f"uninstall failed {kind}@{name}:{version}")
+                return False
+        # the objects only this version linked to
+        ObjectStore(SysUtils.packages_objects_folder()).collect()
+
+        def clear(origin: dict):
+            # clear index tree
+            origin.get(kind, {}).get(name, {}).pop(version, None)
+            if kind in origin and len(origin[kind].get(name, {})) == 0:
+                origin[kind].pop(name, None)
+                if len(origin[kind]) == 0:
+                    origin.pop(kind)
+
+        self.__update_index(clear)
 
         return True
 
+    def __update_index(self, update: Callable[[dict], None]):
+        with PACKAGE_LOCKS.lock(PACKAGE_LOCKS.key(SysUtils.packages_index_file())):
+            # another install may have saved the index since it was loaded
+            self.__index = self.get_package_index()
+            update(self.__index.origin)
+            self.save()
+
     def _detect_file_type(self, file: str) -> str:
         """Detect file type by reading file header, not extension"""
         try:
@@ -331,15 +349,14 @@ class Package:
                 if len(header) >= 2 and header[0] == 0x50 and header[1] == 0x4B:
                     return "zip"
 
-                # TAR.GZ file magic numbers: 1F 8B 08 00
-                if (
-                    len(header) >= 4
-                    and header[0] == 0x1F
-                    and header[1] == 0x8B
-                    and header[2] == 0x08
-                ):
+                # TAR.GZ file magic numbers: 1F 8B 08
+                if header.startswith(GZIP_MAGIC):
                     return "tar.gz"
 
+                # TAR.ZST file magic numbers: 28 B5 2F FD
+                if header.startswith(ZSTD_MAGIC):
+                    return "tar.zst"
+
         except Exception as e:
             logger.error(f"Failed to detect file type: {e}")
 
@@ -349,10 +366,14 @@ class Package:
         file_type = self._detect_file_type(file)
 
         try:
+            reuse = self.__reuse_installed(file, file_type)
+            self.__extractor = ArchiveExtractor(self.__on_extract_progress, reuse=reuse)
             if file_type == "zip":
                 return self._install_from_zip(file, tmp_folder)
             elif file_type == "tar.gz":
                 return self._install_from_tar_gz(file, tmp_folder)
+            elif file_type == "tar.zst":
+                return self._install_from_tar_zst(file, tmp_folder)
             else:
                 logger.error(f"Unsupported file type: {file_type}")
                 return False
@@ -360,94 +381,121 @@ class Package:
             logger.error(e)
             return False
 
+    def __reuse_installed(self, file: str, file_type: str) -> ReuseCallback | None:
+        """
+        Find the installed version of the package sharing the most bytes.
+
+        The members of the archive it has (by the sha256 of the manifest of
+        both) are linked from it, an upgrade only extracts the changed files.
+        The manifests only pick the file, the extractor checks the content.
+        """
+        if file_type not in ("zip", "tar.gz", "tar.zst"):
+            return None
+        data = ArchiveExtractor.read_member(file, file_type, MANIFEST_NAME)
+        manifest = PackageManifest.loads(data) if data is not None else None
+        if manifest is None:
+            return None
+
+        index = self.get_package_index()
+        base = None
+        shared = 0
+        for version in index.versions(manifest.kind, manifest.name):
+            folder = index.path(manifest.kind, manifest.name, version)
+            installed = PackageManifest.load(folder)
+            if installed is None:
+                continue
+            size = manifest.shared(installed)
+            if size > shared:
+                base, shared = (folder, installed), size
+        if base is None:
+            return None
+
+        folder, installed = base
+        logger.debug(f"up to {shared} bytes of {file} are linked from {folder}")
+        sources = installed.digests(folder)
+
+        def reuse(rel: str, mode: int) -> str | None:
+            entry = manifest.files.get(rel)
+            source = sources.get(entry[0]) if entry is not None else None
+            if source is None:
+                return None
+            try:
+                st = os.stat(source)
+            except OSError:
+                return None
+            # the size guards against a file changed since, the mode lives in the inode
+            if st.st_size != entry[1]:
+                return None
+            if os.name != "nt" and bool(st.st_mode & 0o111) != bool(mode & 0o111):
+                return None
+            return source
+
+        return reuse
+
+    def __on_extract_progress(
+        self, index: int, count: int, file: str, size: int, total: int
+    ):
+        saved = self.__extractor.saved if self.__extractor is not None else 0
+        self.__emitter["install"].send(
+            "package",
+            index=index,
+            count=count,
+            file=file,
+            size=size,
+            total=total,
+            saved=saved,
+        )
+
+    def __get_extractor(self) -> ArchiveExtractor:
+        if self.__extractor is None:
+            self.__extractor = ArchiveExtractor(self.__on_extract_progress)
+        return self.__extractor
+
     def _install_from_zip(self, file: str, tmp_folder: str) -> bool:
         """Install from ZIP file"""
-        with zipfile.ZipFile(file, "r") as archive:
-            members = archive.infolist()
-            count = len(members)
-            for index, member in enumerate(members, start=1):
-                archive.extract(member, path=tmp_folder)
-                self.__emitter["install"].send(
-                    "package",
-                    index=index,
-                    count=count,
-                    file=member.filename,
-                )
-
-        self._normalize_extracted_structure(tmp_folder)
+        self.__get_extractor().extract_zip(file, tmp_folder)
         return True
 
     def _install_from_tar_gz(self, file: str, tmp_folder: str) -> bool:
         """Install from TAR.GZ file"""
-        with tarfile.open(file, "r:gz") as archive:
-            members = archive.getmembers()
-            count = len(members)
-            for index, member in enumerate(members, start=1):
-                archive.extract(member, path=tmp_folder)
-                self.__emitter["install"].send(
-                    "package",
-                    index=index,
-                    count=count,
-                    file=member.name,
-                )
-
-        self._normalize_extracted_structure(tmp_folder)
+        self.__get_extractor().extract_tar_gz(file, tmp_folder)
         return True
 
-    def _normalize_extracted_structure(self, tmp_folder: str):
-        """Normalize extracted structure - if only one directory exists, move it up one level"""
-        dirs = os.listdir(tmp_folder)
-        count = len(dirs)
-
-        if count == 1 and os.path.isdir(os.path.join(tmp_folder, dirs[0])):
-            d = os.path.join(tmp_folder, dirs[0])
-            tmp_tmp_folder = os.path.join(str(Path(tmp_folder).parent), "tmp.tmp")
-            shutil.move(d, tmp_tmp_folder)
-            shutil.rmtree(tmp_folder)
-            shutil.move(tmp_tmp_folder, tmp_folder)
+    def _install_from_tar_zst(self, file: str, tmp_folder: str) -> bool:
+        """Install from TAR.ZST file"""
+        self.__get_extractor().extract_tar_zst(file, tmp_folder)
+        return True
 
     def _install_from_dir(self, path: str, tmp_folder: str) -> bool:
-        # Collect all .gitignore files and their patterns from the directory tree
-        gitignore_map = self.__collect_gitignore_patterns(path)
-
         items = []
-        for root, dirs, files in os.walk(path):
-            # Filter out .git directory
-            dirs[:] = [d for d in dirs if d not in [".git"]]
-
-            # Filter out ignored directories based on .gitignore
-            if gitignore_map:
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self.__is_ignored(os.path.join(root, d), path, gitignore_map)
-                ]
-
+        # .gitignore files are honoured, ignored folders are not walked into
+        for root, files in GitIgnoreMatcher(path).walk():
             for file in files:
                 source_file = os.path.join(root, file)
-
-                # Skip files that match .gitignore patterns
-                if gitignore_map and self.__is_ignored(
-                    source_file, path, gitignore_map
-                ):
-                    continue
-
                 rel_path = os.path.relpath(source_file, path)
+                if rel_path == MANIFEST_NAME:
+                    # made again for what is installed
+                    continue
                 target_file = os.path.join(tmp_folder, rel_path)
-                items.append((source_file, target_file))
+                items.append((source_file, target_file, os.path.getsize(source_file)))
 
         count = len(items)
-        for index, (source_file, target_file) in enumerate(items, start=1):
+        total = sum(item[2] for item in items)
+        size = 0
+        for index, (source_file, target_file, file_size) in enumerate(items, start=1):
             os.makedirs(str(Path(target_file).parent), exist_ok=True)
             shutil.copy2(source_file, target_file)
+            size += file_size
             _file = os.path.relpath(target_file, tmp_folder).replace("\\", "/")
             self.__emitter["install"].send(
-                "package", index=index, count=count, file=_file
+                "package", index=index, count=count, file=_file, size=size, total=total
             )
 
         return True
 
-    def make(self, path: str) -> PackageDescription | None:
+    def make(
+        self, path: str, fmt: str = "auto", level: int | None = None, jobs: int = 0
+    ) -> PackageDescription | None:
         package_desc = self.get_package_description(path)
         if package_desc is None:
             return None
@@ -458,7 +506,9 @@ class Package:
         else:
             name = f"{package_desc.name}-{package_desc.version}.csppack"
 
-        self.compress_directory(path, str(Path(path).parent / name))
+        self.compress_directory(
+            path, str(Path(path).parent / name), fmt, level, jobs, package_desc
+        )
 
         return package_desc
 
@@ -474,45 +524,45 @@ class Package:
         Returns:
             list of tuples: (source_file_path, relative_path_for_archive)
         """
-        # Collect all .gitignore files and their patterns from the directory tree
-        gitignore_map = self.__collect_gitignore_patterns(directory_path)
-
         items = []
-        for root, dirs, files in os.walk(directory_path):
-            # Filter out .git directory
-            dirs[:] = [d for d in dirs if d not in [".git"]]
-
-            # Filter out ignored directories based on .gitignore
-            if gitignore_map:
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self.__is_ignored(
-                        os.path.join(root, d), directory_path, gitignore_map
-                    )
-                ]
-
+        for root, files in GitIgnoreMatcher(directory_path).walk():
             for file in files:
                 source_file = os.path.join(root, file)
-
-                # Skip files that match .gitignore patterns
-                if gitignore_map and self.__is_ignored(
-                    source_file, directory_path, gitignore_map
-                ):
-                    continue
-
                 rel_path = os.path.relpath(source_file, directory_path)
-                items.append((source_file, rel_path))
+                if rel_path != MANIFEST_NAME:
+                    items.append((source_file, rel_path))
 
         return items
 
-    def compress_directory(self, directory_path: str, output_path: str) -> str:
+    @staticmethod
+    def pack_format(fmt: str) -> str:
+        """Resolve "auto" to the format of this platform."""
+        if fmt not in PACK_FORMATS:
+            raise ValueError(f"unknown package format {fmt!r}")
+        if fmt == "auto":
+            current_platform = platform.system().lower()
+            return "zip" if current_platform == "windows" else "tar.gz"
+        return fmt
+
+    def compress_directory(
+        self,
+        directory_path: str,
+        output_path: str,
+        fmt: str = "auto",
+        level: int | None = None,
+        jobs: int = 0,
+        package_desc: PackageDescription | None = None,
+    ) -> str:
         """
         Compress directory to zip on Windows or tar.gz on Linux
 
         Args:
             directory_path: Path to directory to compress (must be a directory)
             output_path: Output path for the compressed file
+            fmt: One of PACK_FORMATS
+            level: Compression level, the default of the format if None
+            jobs: Compression threads of tar.gz and tar.zst, 0 for all cores
+            package_desc: The package, its manifest is written as the first member
 
         Returns:
             str: Path to the compressed file
@@ -523,29 +573,55 @@ class Package:
         """
         if not os.path.isdir(directory_path):
             raise ValueError(f"{directory_path} is not a directory")
+        fmt = self.pack_format(fmt)
+        if level is None:
+            level = PACK_LEVELS[fmt]
+        low, high = PACK_LEVEL_RANGES[fmt]
+        if not low <= level <= high:
+            raise ValueError(f"{fmt} level must be in {low}..{high}, not {level}")
 
         # Collect all files for compression
         files_to_compress = self.__collect_files_for_compression(directory_path)
+        manifest = None
+        if package_desc is not None:
+            manifest = PackageManifest.from_files(
+                package_desc.type.lower(),
+                package_desc.name,
+                package_desc.version.lower(),
+                files_to_compress,
+            ).dumps()
 
         try:
-            current_platform = platform.system().lower()
-
-            if current_platform == "windows":
-                return self._compress_to_zip(files_to_compress, output_path)
-            else:  # Linux and other Unix-like systems
-                return self._compress_to_tar_gz(files_to_compress, output_path)
+            if fmt == "zip":
+                return self._compress_to_zip(
+                    files_to_compress, output_path, level, manifest
+                )
+            elif fmt == "tar.zst":
+                return self._compress_to_tar_zst(
+                    files_to_compress, output_path, level, jobs, manifest
+                )
+            else:
+                return self._compress_to_tar_gz(
+                    files_to_compress, output_path, level, jobs, manifest
+                )
 
         except Exception as e:
             logger.error(f"Failed to compress directory {directory_path}: {e}")
             raise
 
     def _compress_to_zip(
-        self, files_to_compress: list[tuple[str, str]], output_path: str
+        self,
+        files_to_compress: list[tuple[str, str]],
+        output_path: str,
+        level: int,
+        manifest: bytes | None = None,
     ) -> str:
         """Compress files to ZIP format"""
         with zipfile.ZipFile(
-            output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=9
+            output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=level
         ) as zipf:
+            if manifest is not None:
+                zipf.writestr(MANIFEST_NAME, manifest)
             count = len(files_to_compress)
             for index, (source_file, arcname) in enumerate(files_to_compress, start=1):
                 zipf.write(source_file, arcname)
@@ -558,11 +634,19 @@ class Package:
         logger.info(f"Successfully compressed to {output_path}")
         return output_path
 
-    def _compress_to_tar_gz(
-        self, files_to_compress: list[tuple[str, str]], output_path: str
-    ) -> str:
-        """Compress files to TAR.GZ format"""
-        with tarfile.open(output_path, "w:gz") as tarf:
+    def _compress_to_tar(
+        self,
+        files_to_compress: list[tuple[str, str]],
+        fileobj: BinaryIO,
+        manifest: bytes | None,
+    ):
+        with tarfile.open(fileobj=fileobj, mode="w|") as tarf:
+            if manifest is not None:
+                # first, an install reads it without going through the stream
+                info = tarfile.TarInfo(MANIFEST_NAME)
+                info.size = len(manifest)
+                info.mtime = int(time.time())
+                tarf.addfile(info, BytesIO(manifest))
             count = len(files_to_compress)
             for index, (source_file, arcname) in enumerate(files_to_compress, start=1):
                 tarf.add(source_file, arcname=arcname)
@@ -572,5 +656,32 @@ class Package:
                     "package", index=index, count=count, file=arcname
                 )
 
+    def _compress_to_tar_gz(
+        self,
+        files_to_compress: list[tuple[str, str]],
+        output_path: str,
+        level: int,
+        jobs: int,
+        manifest: bytes | None = None,
+    ) -> str:
+        """Compress files to TAR.GZ format, a single gzip member any reader reads"""
+        with open(output_path, "wb") as f, ParallelGzipWriter(f, level, jobs) as gz:
+            self._compress_to_tar(files_to_compress, gz, manifest)  # type: ignore
+
+        logger.info(f"Successfully compressed to {output_path}")
+        return output_path
+
+    def _compress_to_tar_zst(
+        self,
+        files_to_compress: list[tuple[str, str]],
+        output_path: str,
+        level: int,
+        jobs: int,
+        manifest: bytes | None = None,
+    ) -> str:
+        """Compress files to TAR.ZST format"""
+        with open(output_path, "wb") as f, zstd_writer(f, level, jobs) as zst:
+            self._compress_to_tar(files_to_compress, zst, manifest)
+
         logger.info(f"Successfully compressed to {output_path}")
         return output_path
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        store.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       take the digests already known
+#
+
+import hashlib
+import os
+import stat
+
+from loguru import logger
+
+READ_SIZE = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ObjectStore:
+    """
+    Content addressed store of the installed package files.
+
+    A regular file of an installed package is a hard link to the object
+    ``<root>/<first two hex>/<sha256>``, so the files a version shares with
+    another one are stored once and installing it only costs the changed
+    files. The link count of an object is its reference count, once only the
+    store links to it ``collect`` removes it. Where hard links are refused
+    (another filesystem, FAT, too many links) a file simply stays a copy.
+
+    Installed files are shared between versions, they must never be modified
+    in place.
+    """
+
+    def __init__(self, root: str):
+        self._root = root
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    def object_path(self, digest: str, executable: bool = False) -> str:
+        # the mode lives in the inode, executables must not share it with data
+        name = f"{digest}.x" if executable else digest
+        return os.path.join(self._root, digest[:2], name)
+
+    def add(self, path: str, digest: str | None = None) -> bool:
+        """Turn ``path`` into a link to its object, True if the object existed."""
+        st = os.lstat(path)
+        digest = digest or file_digest(path)
+        obj = self.object_path(digest, bool(st.st_mode & 0o111))
+        os.makedirs(os.path.dirname(obj), exist_ok=True)
+
+        # an object removed by a concurrent collect between the two links is retried
+        for _ in range(3):
+            try:
+                os.link(path, obj)
+                return False
+            except FileExistsError:
+                pass
+            except OSError:
+                return False
+
+            tmp = f"{path}.{os.getpid()}.link"
+            try:
+                os.link(obj, tmp)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return False
+            try:
+                os.replace(tmp, path)
+            except OSError:
+                os.remove(tmp)
+                return False
+            return True
+        return False
+
+    def add_tree(
+        self, folder: str, digests: dict[str, str] | None = None
+    ) -> tuple[int, int]:
+        """
+        Link every regular file of ``folder`` into the store.
+
+        ``digests`` are the known sha256 by relative path, only to be given
+        when hashed here, an object must never have another content.
+
+        Returns:
+            tuple[int, int]: The number and size of the files whose content
+            was already stored, which the install does not cost.
+        """
+        files = 0
+        size = 0
+        for root, _, names in os.walk(folder):
+            for name in names:
+                path = os.path.join(root, name)
+                st = os.lstat(path)
+                # empty files are not worth an object, linked ones are stored already
+                if not stat.S_ISREG(st.st_mode) or not st.st_size or st.st_nlink > 1:
+                    continue
+                rel = os.path.relpath(path, folder).replace("\\", "/")
+                if self.add(path, digests.get(rel) if digests else None):
+                    files += 1
+                    size += st.st_size
+        logger.debug(f"{files} files, {size} bytes of {folder} were already stored")
+        return files, size
+
+    def collect(self) -> tuple[int, int]:
+        """
+        Remove the objects no installed file links to anymore.
+
+        Returns:
+            tuple[int, int]: The number and size of the removed objects.
+        """
+        files = 0
+        size = 0
+        if not os.path.isdir(self._root):
+            return files, size
+        for entry in os.scandir(self._root):
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            for obj in os.scandir(entry.path):
+                # os.stat, a DirEntry has no link count on windows
+                st = os.stat(obj.path, follow_symlinks=False)
+                if st.st_nlink > 1:
+                    continue
+                try:
+                    os.remove(obj.path)
+                except OSError:
+                    continue
+                files += 1
+                size += st.st_size
+        logger.debug(f"collected {files} objects, {size} bytes")
+        return files, size
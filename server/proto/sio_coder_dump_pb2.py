@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aproto/sio_coder_dump.proto\x1a\x1cgoogle/protobuf/struct.proto\"[\n\x13SioCoderDumpRequest\x12(\n\x07\x63ontent\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0c\n\x04\x64iff\x18\x03 \x01(\x08\"B\n\x14SioCoderDumpProgress\x12\r\n\x05\x63ount\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04\x66ile\x18\x03 \x01(\t\"9\n\x18SioCoderDumpResponseFile\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\x0c\n\x04\x64iff\x18\x02 \x01(\t\"\xb0\x01\n\x14SioCoderDumpResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12/\n\x05\x66iles\x18\x03 \x03(\x0b\x32 .SioCoderDumpResponse.FilesEntry\x1aG\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.SioCoderDumpResponseFile:\x02\x38\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aproto/sio_coder_dump.proto\x1a\x1cgoogle/protobuf/struct.proto\"\xdc\x02\n\x13SioCoderDumpRequest\x12(\n\x07\x63ontent\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0c\n\x04\x64iff\x18\x03 \x01(\x08\x12\x0e\n\x06stream\x18\x04 \x01(\x08\x12\x12\n\nchunk_size\x18\x05 \x01(\r\x12-\n\x0b\x63ompression\x18\x06 \x01(\x0e\x32\x18.SioCoderDumpCompression\x12\x14\n\x0c\x63ontent_data\x18\x07 \x01(\x0c\x12\x36\n\x10\x63ontent_encoding\x18\x08 \x01(\x0e\x32\x1c.SioCoderDumpContentEncoding\x12\x15\n\rcontent_delta\x18\t \x01(\x08\x12\x17\n\x0f\x63ontent_session\x18\n \x01(\x08\x12\x18\n\x10session_revision\x18\x0b \x01(\x04\x12\x14\n\x0csession_base\x18\x0c \x01(\x04\"Q\n\x14SioCoderDumpProgress\x12\r\n\x05\x63ount\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04\x66ile\x18\x03 \x01(\t\x12\r\n\x05\x66iles\x18\x04 \x03(\t\"9\n\x18SioCoderDumpResponseFile\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\x0c\n\x04\x64iff\x18\x02 \x01(\t\"\x8b\x01\n\x11SioCoderDumpFrame\x12\x0c\n\x04\x66ile\x18\x01 \x01(\t\x12\r\n\x05\x63hunk\x18\x02 \x01(\r\x12\x0e\n\x06\x63hunks\x18\x03 \x01(\r\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x12-\n\x0b\x63ompression\x18\x05 \x01(\x0e\x32\x18.SioCoderDumpCompression\x12\x0c\n\x04\x64iff\x18\x06 \x01(\t\"\xd1\x01\n\x14SioCoderDumpResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12/\n\x05\x66iles\x18\x03 \x03(\x0b\x32 .SioCoderDumpResponse.FilesEntry\x12\x10\n\x08streamed\x18\x04 \x01(\x08\x12\r\n\x05\x63ount\x18\x05 \x01(\r\x1aG\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.SioCoderDumpResponseFile:\x02\x38\x01*c\n\x17SioCoderDumpCompression\x12#\n\x1fSIO_CODER_DUMP_COMPRESSION_NONE\x10\x00\x12#\n\x1fSIO_CODER_DUMP_COMPRESSION_ZLIB\x10\x01*t\n\x1bSioCoderDumpContentEncoding\x12(\n$SIO_CODER_DUMP_CONTENT_ENCODING_JSON\x10\x00\x12+\n\'SIO_CODER_DUMP_CONTENT_ENCODING_MSGPACK\x10\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,14 +34,20 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_SIOCODERDUMPRESPONSE_FILESENTRY']._loaded_options = None
   _globals['_SIOCODERDUMPRESPONSE_FILESENTRY']._serialized_options = b'8\001'
-  _globals['_SIOCODERDUMPREQUEST']._serialized_start=60
-  _globals['_SIOCODERDUMPREQUEST']._serialized_end=151
-  _globals['_SIOCODERDUMPPROGRESS']._serialized_start=153
-  _globals['_SIOCODERDUMPPROGRESS']._serialized_end=219
-  _globals['_SIOCODERDUMPRESPONSEFILE']._serialized_start=221
-  _globals['_SIOCODERDUMPRESPONSEFILE']._serialized_end=278
-  _globals['_SIOCODERDUMPRESPONSE']._serialized_start=281
-  _globals['_SIOCODERDUMPRESPONSE']._serialized_end=457
-  _globals['_SIOCODERDUMPRESPONSE_FILESENTRY']._serialized_start=386
-  _globals['_SIOCODERDUMPRESPONSE_FILESENTRY']._serialized_end=457
+  _globals['_SIOCODERDUMPCOMPRESSION']._serialized_start=907
+  _globals['_SIOCODERDUMPCOMPRESSION']._serialized_end=1006
+  _globals['_SIOCODERDUMPCONTENTENCODING']._serialized_start=1008
+  _globals['_SIOCODERDUMPCONTENTENCODING']._serialized_end=1124
+  _globals['_SIOCODERDUMPREQUEST']._serialized_start=61
+  _globals['_SIOCODERDUMPREQUEST']._serialized_end=409
+  _globals['_SIOCODERDUMPPROGRESS']._serialized_start=411
+  _globals['_SIOCODERDUMPPROGRESS']._serialized_end=492
+  _globals['_SIOCODERDUMPRESPONSEFILE']._serialized_start=494
+  _globals['_SIOCODERDUMPRESPONSEFILE']._serialized_end=551
+  _globals['_SIOCODERDUMPFRAME']._serialized_start=554
+  _globals['_SIOCODERDUMPFRAME']._serialized_end=693
+  _globals['_SIOCODERDUMPRESPONSE']._serialized_start=696
+  _globals['_SIOCODERDUMPRESPONSE']._serialized_end=905
+  _globals['_SIOCODERDUMPRESPONSE_FILESENTRY']._serialized_start=834
+  _globals['_SIOCODERDUMPRESPONSE_FILESENTRY']._serialized_end=905
 # @@protoc_insertion_point(module_scope)
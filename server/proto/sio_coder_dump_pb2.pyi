@@ -1,31 +1,66 @@
 from google.protobuf import struct_pb2 as _struct_pb2
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from collections.abc import Mapping as _Mapping
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
 from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class SioCoderDumpCompression(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SIO_CODER_DUMP_COMPRESSION_NONE: _ClassVar[SioCoderDumpCompression]
+    SIO_CODER_DUMP_COMPRESSION_ZLIB: _ClassVar[SioCoderDumpCompression]
+
+class SioCoderDumpContentEncoding(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SIO_CODER_DUMP_CONTENT_ENCODING_JSON: _ClassVar[SioCoderDumpContentEncoding]
+    SIO_CODER_DUMP_CONTENT_ENCODING_MSGPACK: _ClassVar[SioCoderDumpContentEncoding]
+SIO_CODER_DUMP_COMPRESSION_NONE: SioCoderDumpCompression
+SIO_CODER_DUMP_COMPRESSION_ZLIB: SioCoderDumpCompression
+SIO_CODER_DUMP_CONTENT_ENCODING_JSON: SioCoderDumpContentEncoding
+SIO_CODER_DUMP_CONTENT_ENCODING_MSGPACK: SioCoderDumpContentEncoding
+
 class SioCoderDumpRequest(_message.Message):
     __slots__ = ()
     CONTENT_FIELD_NUMBER: _ClassVar[int]
     PATH_FIELD_NUMBER: _ClassVar[int]
     DIFF_FIELD_NUMBER: _ClassVar[int]
+    STREAM_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
+    COMPRESSION_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_DATA_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_ENCODING_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_DELTA_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_SESSION_FIELD_NUMBER: _ClassVar[int]
+    SESSION_REVISION_FIELD_NUMBER: _ClassVar[int]
+    SESSION_BASE_FIELD_NUMBER: _ClassVar[int]
     content: _struct_pb2.Struct
     path: str
     diff: bool
-    def __init__(self, content: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., path: _Optional[str] = ..., diff: _Optional[bool] = ...) -> None: ...
+    stream: bool
+    chunk_size: int
+    compression: SioCoderDumpCompression
+    content_data: bytes
+    content_encoding: SioCoderDumpContentEncoding
+    content_delta: bool
+    content_session: bool
+    session_revision: int
+    session_base: int
+    def __init__(self, content: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., path: _Optional[str] = ..., diff: _Optional[bool] = ..., stream: _Optional[bool] = ..., chunk_size: _Optional[int] = ..., compression: _Optional[_Union[SioCoderDumpCompression, str]] = ..., content_data: _Optional[bytes] = ..., content_encoding: _Optional[_Union[SioCoderDumpContentEncoding, str]] = ..., content_delta: _Optional[bool] = ..., content_session: _Optional[bool] = ..., session_revision: _Optional[int] = ..., session_base: _Optional[int] = ...) -> None: ...
 
 class SioCoderDumpProgress(_message.Message):
     __slots__ = ()
     COUNT_FIELD_NUMBER: _ClassVar[int]
     INDEX_FIELD_NUMBER: _ClassVar[int]
     FILE_FIELD_NUMBER: _ClassVar[int]
+    FILES_FIELD_NUMBER: _ClassVar[int]
     count: int
     index: int
     file: str
-    def __init__(self, count: _Optional[int] = ..., index: _Optional[int] = ..., file: _Optional[str] = ...) -> None: ...
+    files: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, count: _Optional[int] = ..., index: _Optional[int] = ..., file: _Optional[str] = ..., files: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class SioCoderDumpResponseFile(_message.Message):
     __slots__ = ()
@@ -35,6 +70,22 @@ class SioCoderDumpResponseFile(_message.Message):
     diff: str
     def __init__(self, content: _Optional[str] = ..., diff: _Optional[str] = ...) -> None: ...
 
+class SioCoderDumpFrame(_message.Message):
+    __slots__ = ()
+    FILE_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    CHUNKS_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    COMPRESSION_FIELD_NUMBER: _ClassVar[int]
+    DIFF_FIELD_NUMBER: _ClassVar[int]
+    file: str
+    chunk: int
+    chunks: int
+    data: bytes
+    compression: SioCoderDumpCompression
+    diff: str
+    def __init__(self, file: _Optional[str] = ..., chunk: _Optional[int] = ..., chunks: _Optional[int] = ..., data: _Optional[bytes] = ..., compression: _Optional[_Union[SioCoderDumpCompression, str]] = ..., diff: _Optional[str] = ...) -> None: ...
+
 class SioCoderDumpResponse(_message.Message):
     __slots__ = ()
     class FilesEntry(_message.Message):
@@ -47,7 +98,11 @@ class SioCoderDumpResponse(_message.Message):
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
     FILES_FIELD_NUMBER: _ClassVar[int]
+    STREAMED_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
     success: bool
     error: str
     files: _containers.MessageMap[str, SioCoderDumpResponseFile]
-    def __init__(self, success: _Optional[bool] = ..., error: _Optional[str] = ..., files: _Optional[_Mapping[str, SioCoderDumpResponseFile]] = ...) -> None: ...
+    streamed: bool
+    count: int
+    def __init__(self, success: _Optional[bool] = ..., error: _Optional[str] = ..., files: _Optional[_Mapping[str, SioCoderDumpResponseFile]] = ..., streamed: _Optional[bool] = ..., count: _Optional[int] = ...) -> None: ...
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eproto/sio_coder_generate.proto\"F\n\x17SioCoderGenerateRequest\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\t\x12\r\n\x05\x66iles\x18\x03 \x03(\t\"U\n\x18SioCoderGenerateProgress\x12\r\n\x05\x63ount\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04\x66ile\x18\x03 \x01(\t\x12\r\n\x05write\x18\x04 \x01(\x08\":\n\x18SioCoderGenerateResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\tb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eproto/sio_coder_generate.proto\"T\n\x17SioCoderGenerateRequest\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\t\x12\r\n\x05\x66iles\x18\x03 \x03(\t\x12\x0c\n\x04jobs\x18\x04 \x01(\r\"t\n\x18SioCoderGenerateProgress\x12\r\n\x05\x63ount\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04\x66ile\x18\x03 \x01(\t\x12\r\n\x05write\x18\x04 \x01(\x08\x12\r\n\x05\x66iles\x18\x05 \x03(\t\x12\x0e\n\x06writes\x18\x06 \x03(\x08\":\n\x18SioCoderGenerateResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\tb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,9 +32,9 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.sio_coder_generate_pb
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_SIOCODERGENERATEREQUEST']._serialized_start=34
-  _globals['_SIOCODERGENERATEREQUEST']._serialized_end=104
-  _globals['_SIOCODERGENERATEPROGRESS']._serialized_start=106
-  _globals['_SIOCODERGENERATEPROGRESS']._serialized_end=191
-  _globals['_SIOCODERGENERATERESPONSE']._serialized_start=193
-  _globals['_SIOCODERGENERATERESPONSE']._serialized_end=251
+  _globals['_SIOCODERGENERATEREQUEST']._serialized_end=118
+  _globals['_SIOCODERGENERATEPROGRESS']._serialized_start=120
+  _globals['_SIOCODERGENERATEPROGRESS']._serialized_end=236
+  _globals['_SIOCODERGENERATERESPONSE']._serialized_start=238
+  _globals['_SIOCODERGENERATERESPONSE']._serialized_end=296
 # @@protoc_insertion_point(module_scope)
@@ -11,10 +11,12 @@ class SioCoderGenerateRequest(_message.Message):
     PATH_FIELD_NUMBER: _ClassVar[int]
     OUTPUT_FIELD_NUMBER: _ClassVar[int]
     FILES_FIELD_NUMBER: _ClassVar[int]
+    JOBS_FIELD_NUMBER: _ClassVar[int]
     path: str
     output: str
     files: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, path: _Optional[str] = ..., output: _Optional[str] = ..., files: _Optional[_Iterable[str]] = ...) -> None: ...
+    jobs: int
+    def __init__(self, path: _Optional[str] = ..., output: _Optional[str] = ..., files: _Optional[_Iterable[str]] = ..., jobs: _Optional[int] = ...) -> None: ...
 
 class SioCoderGenerateProgress(_message.Message):
     __slots__ = ()
@@ -22,11 +24,15 @@ class SioCoderGenerateProgress(_message.Message):
     INDEX_FIELD_NUMBER: _ClassVar[int]
     FILE_FIELD_NUMBER: _ClassVar[int]
     WRITE_FIELD_NUMBER: _ClassVar[int]
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    WRITES_FIELD_NUMBER: _ClassVar[int]
     count: int
     index: int
     file: str
     write: bool
-    def __init__(self, count: _Optional[int] = ..., index: _Optional[int] = ..., file: _Optional[str] = ..., write: _Optional[bool] = ...) -> None: ...
+    files: _containers.RepeatedScalarFieldContainer[str]
+    writes: _containers.RepeatedScalarFieldContainer[bool]
+    def __init__(self, count: _Optional[int] = ..., index: _Optional[int] = ..., file: _Optional[str] = ..., write: _Optional[bool] = ..., files: _Optional[_Iterable[str]] = ..., writes: _Optional[_Iterable[bool]] = ...) -> None: ...
 
 class SioCoderGenerateResponse(_message.Message):
     __slots__ = ()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: proto/sio_job.proto
+# Protobuf Python Version: 6.33.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    33,
+    1,
+    '',
+    'proto/sio_job.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13proto/sio_job.proto\"E\n\x0cSioJobStatus\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04kind\x18\x02 \x01(\t\x12\x1b\n\x05state\x18\x03 \x01(\x0e\x32\x0c.SioJobState\"!\n\x13SioJobCancelRequest\x12\n\n\x02id\x18\x01 \x01(\t\"6\n\x14SioJobCancelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t*\x91\x01\n\x0bSioJobState\x12\x18\n\x14SIO_JOB_STATE_QUEUED\x10\x00\x12\x19\n\x15SIO_JOB_STATE_RUNNING\x10\x01\x12\x16\n\x12SIO_JOB_STATE_DONE\x10\x02\x12\x1b\n\x17SIO_JOB_STATE_CANCELLED\x10\x03\x12\x18\n\x14SIO_JOB_STATE_FAILED\x10\x04\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.sio_job_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SIOJOBSTATE']._serialized_start=186
+  _globals['_SIOJOBSTATE']._serialized_end=331
+  _globals['_SIOJOBSTATUS']._serialized_start=23
+  _globals['_SIOJOBSTATUS']._serialized_end=92
+  _globals['_SIOJOBCANCELREQUEST']._serialized_start=94
+  _globals['_SIOJOBCANCELREQUEST']._serialized_end=127
+  _globals['_SIOJOBCANCELRESPONSE']._serialized_start=129
+  _globals['_SIOJOBCANCELRESPONSE']._serialized_end=183
+# @@protoc_insertion_point(module_scope)
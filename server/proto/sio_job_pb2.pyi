@@ -0,0 +1,43 @@
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SioJobState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SIO_JOB_STATE_QUEUED: _ClassVar[SioJobState]
+    SIO_JOB_STATE_RUNNING: _ClassVar[SioJobState]
+    SIO_JOB_STATE_DONE: _ClassVar[SioJobState]
+    SIO_JOB_STATE_CANCELLED: _ClassVar[SioJobState]
+    SIO_JOB_STATE_FAILED: _ClassVar[SioJobState]
+SIO_JOB_STATE_QUEUED: SioJobState
+SIO_JOB_STATE_RUNNING: SioJobState
+SIO_JOB_STATE_DONE: SioJobState
+SIO_JOB_STATE_CANCELLED: SioJobState
+SIO_JOB_STATE_FAILED: SioJobState
+
+class SioJobStatus(_message.Message):
+    __slots__ = ()
+    ID_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    kind: str
+    state: SioJobState
+    def __init__(self, id: _Optional[str] = ..., kind: _Optional[str] = ..., state: _Optional[_Union[SioJobState, str]] = ...) -> None: ...
+
+class SioJobCancelRequest(_message.Message):
+    __slots__ = ()
+    ID_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    def __init__(self, id: _Optional[str] = ...) -> None: ...
+
+class SioJobCancelResponse(_message.Message):
+    __slots__ = ()
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    error: str
+    def __init__(self, success: _Optional[bool] = ..., error: _Optional[str] = ...) -> None: ...
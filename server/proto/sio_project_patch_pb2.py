@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: proto/sio_project_patch.proto
+# Protobuf Python Version: 6.33.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    33,
+    1,
+    '',
+    'proto/sio_project_patch.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dproto/sio_project_patch.proto\"7\n\x16SioProjectPatchRequest\x12\x0b\n\x03ops\x18\x01 \x01(\x0c\x12\x10\n\x08revision\x18\x02 \x01(\x04\"K\n\x17SioProjectPatchResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x10\n\x08revision\x18\x03 \x01(\x04\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.sio_project_patch_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SIOPROJECTPATCHREQUEST']._serialized_start=33
+  _globals['_SIOPROJECTPATCHREQUEST']._serialized_end=88
+  _globals['_SIOPROJECTPATCHRESPONSE']._serialized_start=90
+  _globals['_SIOPROJECTPATCHRESPONSE']._serialized_end=165
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,23 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SioProjectPatchRequest(_message.Message):
+    __slots__ = ()
+    OPS_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    ops: bytes
+    revision: int
+    def __init__(self, ops: _Optional[bytes] = ..., revision: _Optional[int] = ...) -> None: ...
+
+class SioProjectPatchResponse(_message.Message):
+    __slots__ = ()
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    error: str
+    revision: int
+    def __init__(self, success: _Optional[bool] = ..., error: _Optional[str] = ..., revision: _Optional[int] = ...) -> None: ...
@@ -22,25 +22,50 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-11-12     xqyjlj       initial version
+# 2026-10-18     xqyjlj       record the config paths read while rendering
 #
 
 
 import json
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 
 class Configs:
     def __init__(self, data: dict):
         self._data = data
+        self._reads: set[str] | None = None
 
     def __str__(self) -> str:
+        self._read("")
         return json.dumps(self._data, indent=2, ensure_ascii=False)
 
     @property
     def origin(self) -> dict:
+        self._read("")
         return self._data
 
+    @contextmanager
+    def record(self) -> Iterator[set[str]]:
+        """
+        Collect the dotted paths read through this object inside the ``with`` block.
+
+        An empty string in the result means the whole configs tree was read.
+        """
+        previous = self._reads
+        reads: set[str] = set()
+        self._reads = reads
+        try:
+            yield reads
+        finally:
+            self._reads = previous
+
+    def _read(self, path: str):
+        if self._reads is not None:
+            self._reads.add(path)
+
     def get(self, path: str, default=None) -> Any:
+        self._read(path)
         item = self._data
         keys = path.split(".")
         for key in keys:
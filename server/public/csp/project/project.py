@@ -22,6 +22,7 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-11-12     xqyjlj       initial version
+# 2026-10-18     xqyjlj       record a read of the whole project when printed
 #
 
 import json
@@ -39,10 +40,12 @@ class Project:
         self._user_data = user_data
 
     def __str__(self) -> str:
+        self._configs._read("")
         return json.dumps(self._data, indent=2, ensure_ascii=False)
 
     @property
     def origin(self) -> dict:
+        self._configs._read("")
         return self._data
 
     @property
@@ -0,0 +1,2 @@
+def pin_mode(project, pin):
+    return project.configs.get(f"GPIO.{pin}.mode", "input")
@@ -0,0 +1,14 @@
+def files_table(project):
+    table = {}
+    for module in project.configs.get("GPIO", {}).keys():
+        table[f"core/src/gpio_{module}.c"] = {"template": "gpio.c.j2", "module": module}
+    table["core/inc/main.h"] = {"template": "main.h.j2"}
+    return table
+
+
+def copy_library(project, output_dir, callback):
+    pass
+
+
+def get_mdk(project, path):
+    return {}
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import zlib
+from unittest import mock
+
+import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
+from actions import coder_dump
+from coder.cache import CoderCache
+from tests.tc_coder import CoderTestCase
+
+
+class _SocketIO:
+    def __init__(self):
+        self.events: list[tuple[str, bytes]] = []
+
+    def emit(self, event: str, data: bytes, to: str | None = None):
+        self.events.append((event, data))
+
+    def sleep(self, seconds: float = 0):
+        pass
+
+
+class TcActionsCoderDumpFunctional(CoderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.project = self._project()
+
+        # one file to diff against
+        folder = self.project.folder()
+        os.makedirs(os.path.join(folder, "core", "inc"))
+        with open(
+            os.path.join(folder, "core", "inc", "main.h"), "w", encoding="utf-8"
+        ) as f:
+            f.write("#define CLOCK 4\n")
+
+    @staticmethod
+    def _join(events: list[tuple[str, bytes]]) -> dict:
+        frames: dict[str, list[sio_coder_dump_pb2.SioCoderDumpFrame]] = {}
+        for event, data in events:
+            if event != "coder/dump.frame":
+                continue
+            frame = sio_coder_dump_pb2.SioCoderDumpFrame()
+            frame.ParseFromString(data)
+            frames.setdefault(frame.file, []).append(frame)
+
+        files = {}
+        for file, chunks in frames.items():
+            data = b""
+            for i, frame in enumerate(chunks):
+                assert frame.chunk == i and frame.chunks == len(chunks)
+                if (
+                    frame.compression
+                    == sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_ZLIB
+                ):
+                    data += zlib.decompress(frame.data)
+                else:
+                    data += frame.data
+            files[file] = {"content": data.decode("utf-8"), "diff": chunks[-1].diff}
+        return files
+
+    def test_stream(self):
+        path = self.project.path()
+        content = self.project.origin
+        with mock.patch.object(coder_dump, "CODER_CACHE", CoderCache()):
+            dumped = coder_dump.action_coder_dump(self.project, True, path, content)
+
+            for compression in (
+                sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_NONE,
+                sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_ZLIB,
+            ):
+                with self.subTest(compression=compression):
+                    socketio = _SocketIO()
+                    count = coder_dump.action_coder_dump_stream(
+                        self.project,
+                        True,
+                        path,
+                        content,
+                        "sid",
+                        socketio,  # type: ignore
+                        chunk_size=1000,
+                        compression=compression,
+                    )
+                    self.assertEqual(count, len(dumped))
+                    self.assertDictEqual(self._join(socketio.events), dumped)
+
+                    frames = [
+                        sio_coder_dump_pb2.SioCoderDumpFrame.FromString(data)
+                        for event, data in socketio.events
+                        if event == "coder/dump.frame"
+                    ]
+                    self.assertGreater(max(frame.chunks for frame in frames), 1)
+                    self.assertIn(compression, [frame.compression for frame in frames])
+
+        self.assertIn("+#define CLOCK 16", dumped["core/inc/main.h"]["diff"])
+
+    def test_frames(self):
+        text = "中文\n" * 300  # 2100 bytes
+        frames = list(
+            coder_dump._make_frames(
+                "a.c",
+                text,
+                "diff",
+                100,
+                sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_NONE,
+            )
+        )
+        self.assertEqual(len(frames), 21)
+        # the chunks split characters, only their join is decoded
+        self.assertEqual(b"".join(frame.data for frame in frames).decode(), text)
+        self.assertListEqual([frame.diff for frame in frames][-2:], ["", "diff"])
+
+        frames = list(
+            coder_dump._make_frames(
+                "a.c", "", "", 100, sio_coder_dump_pb2.SIO_CODER_DUMP_COMPRESSION_ZLIB
+            )
+        )
+        self.assertEqual(len(frames), 1)
+        self.assertEqual((frames[0].chunks, frames[0].data), (1, b""))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import gevent
+from actions import coder_dump, coder_generate
+
+
+class _Project:
+    def __init__(self, folder: str):
+        self._folder = folder
+
+    def path(self) -> str:
+        return os.path.join(self._folder, "demo.csp")
+
+    def folder(self) -> str:
+        return self._folder
+
+
+class TcActionsProjectLockFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.home = tempfile.TemporaryDirectory()
+        # the interprocess lock files are under ~/.csp/cache
+        self.patch = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.patch.start()
+        self.events: list[str] = []
+
+    def _work(self, name: str):
+        self.events.append(f"{name} start")
+        gevent.sleep(0.05)
+        self.events.append(f"{name} end")
+
+    def test_dump_and_generate(self):
+        project = _Project(os.path.join(self.home.name, "demo"))
+        output = os.path.join(self.home.name, "output")
+        os.makedirs(output)
+
+        coder = mock.Mock()
+        coder.dump.side_effect = lambda jobs: self._work("dump") or {}
+        cache = mock.Mock()
+        cache.get.return_value = coder
+
+        def generate(*args):
+            self._work("generate")
+            return True
+
+        with (
+            mock.patch.object(coder_dump, "CODER_CACHE", cache),
+            mock.patch.object(coder_generate, "_action_coder_generate", generate),
+        ):
+            # the dump locks the project file, the generate its output folder
+            greenlets = [
+                gevent.spawn(coder_dump.action_coder_dump, project, False, None, None),
+                gevent.spawn(
+                    coder_generate.action_coder_generate, project, output, False
+                ),
+            ]
+            gevent.joinall(greenlets, raise_error=True)
+
+        self.assertListEqual(
+            self.events, ["dump start", "dump end", "generate start", "generate end"]
+        )
+
+    def tearDown(self):
+        self.patch.stop()
+        self.home.cleanup()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_benchmark.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from utils.sys import SYS_UTILS
+
+# cold start budgets in seconds, best of RUNS
+BUDGETS = {"--version": 0.45, "list": 0.75}
+RUNS = 3
+
+# set to a Nuitka build of csp-server to check it as well
+EXE_ENV = "CSP_SERVER_EXE"
+
+# set to fail on a missed budget, the timings are only reported otherwise
+BUDGET_ENV = "CSP_STARTUP_BUDGETS"
+
+# never needed to print the version or list the packages
+HEAVY_MODULES = ("flask", "flask_socketio", "jinja2", "cantools", "tqdm", "gevent")
+
+_MODULES_SCRIPT = """
+import runpy, sys
+sys.argv = [sys.argv[1], *sys.argv[2:]]
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+except SystemExit:
+    pass
+print("\\n".join(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+class TcCliStartupBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.script = os.path.join(SYS_UTILS.exe_folder(), "csp-server.py")
+        self.home = tempfile.TemporaryDirectory()
+        self.env = dict(
+            os.environ,
+            HOME=self.home.name,
+            USERPROFILE=self.home.name,
+            CSP_NO_DAEMON="1",
+        )
+
+    def _best(self, command: list[str]) -> float:
+        best = float("inf")
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            subprocess.run(command, env=self.env, capture_output=True, check=True)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def _check_budgets(self, command: list[str], name: str):
+        for args, budget in BUDGETS.items():
+            best = self._best([*command, args])
+            print(
+                f"\n{name} {args}: {best * 1000:.0f} ms (budget {budget * 1000:.0f} ms)"
+            )
+            if os.environ.get(BUDGET_ENV):
+                self.assertLess(best, budget, f"{name} {args} starts too slowly")
+
+    def test_source(self):
+        self._check_budgets([sys.executable, self.script], "source")
+
+    def test_nuitka(self):
+        exe = os.environ.get(EXE_ENV)
+        if not exe:
+            self.skipTest(f"{EXE_ENV} is not set")
+        self._check_budgets([exe], "nuitka")
+
+    def test_modules(self):
+        for args in BUDGETS:
+            result = subprocess.run(
+                [sys.executable, "-c", _MODULES_SCRIPT, self.script, args],
+                env=self.env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            modules = set(result.stderr.split())
+            self.assertIn("click", modules)
+            for module in HEAVY_MODULES:
+                self.assertNotIn(module, modules, f"{args} imports {module}")
+
+    def tearDown(self):
+        self.home.cleanup()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        __init__.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import contextmanager
+from typing import Iterator
+from unittest import mock
+
+from coder.coder import Coder
+from public.csp.project import Project
+from public.csp.summary import Summary
+from utils.sys import SYS_UTILS
+
+HAL_FOLDER = os.path.join(SYS_UTILS.exe_folder(), "tests", "resources", "coder", "hal")
+
+PROJECT = {
+    "version": "v1.0.0",
+    "name": "demo",
+    "vendor": "StarPower",
+    "targetChip": "SP28038",
+    "configs": {
+        "GPIO": {"m1": {"mode": "output", "value": 1}, "m2": {"value": 2}},
+        "RCM": {"clock": 16},
+    },
+    "gen": {"hal": "hal_test", "halVersion": "1.0.0", "toolchains": "gcc"},
+}
+
+
+class CoderTestCase(unittest.TestCase):
+    """Projects of the hal package in tests/resources/coder, in a temporary home."""
+
+    def setUp(self):
+        self.maxDiff = None
+        self.home = tempfile.TemporaryDirectory()
+        # the jinja2 bytecode cache and the project locks are under ~/.csp/cache,
+        # spawned render workers inherit it
+        self.patch = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.patch.start()
+        self.hal = os.path.join(self.home.name, "hal")
+        shutil.copytree(HAL_FOLDER, self.hal)
+
+    def _project(self, data: dict = PROJECT, name: str = "demo") -> Project:
+        path = os.path.join(self.home.name, name, f"{name}.csp")
+        return Project(copy.deepcopy(data), {"hal_folder": self.hal, "path": path})
+
+    def _coder(self, data: dict = PROJECT, name: str = "demo") -> Coder:
+        return Coder(self._project(data, name), Summary({}))
+
+    @contextmanager
+    def _record_renders(self) -> Iterator[list[str]]:
+        """The files rendered within the block, filled in when it exits."""
+        rendered: list[str] = []
+        with mock.patch.object(
+            Coder, "_render", autospec=True, side_effect=Coder._render
+        ) as render:
+            yield rendered
+        rendered.extend(call.args[1] for call in render.call_args_list)
+
+    def tearDown(self):
+        self.patch.stop()
+        self.home.cleanup()
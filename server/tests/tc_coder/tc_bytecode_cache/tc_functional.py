@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import jinja2
+from coder.bytecode_cache import BytecodeCache
+
+SOURCE = "{% for i in range(3) %}{{ i }}{% endfor %}"
+
+
+class TcCoderBytecodeCacheFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.home = tempfile.TemporaryDirectory()
+        # the cache is under ~/.csp/cache
+        self.patch = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.patch.start()
+        self.root = Path(self.home.name) / ".csp" / "cache" / "jinja2"
+
+    @staticmethod
+    def _environment(cache: BytecodeCache, source: str) -> jinja2.Environment:
+        return jinja2.Environment(
+            loader=jinja2.DictLoader({"a.j2": source}), bytecode_cache=cache
+        )
+
+    def test_persist(self):
+        env = self._environment(BytecodeCache("hal_test", "1.0.0"), SOURCE)
+        self.assertEqual(env.get_template("a.j2").render(), "012")
+        self.assertEqual(len(list((self.root / "hal_test" / "1.0.0").iterdir())), 1)
+
+        # another process, the compiled template is loaded from disk
+        cache = BytecodeCache("hal_test", "1.0.0")
+        env = self._environment(cache, SOURCE)
+        self.assertIsNotNone(cache.get_bucket(env, "a.j2", None, SOURCE).code)
+        self.assertEqual(env.get_template("a.j2").render(), "012")
+
+        # a changed template is never served stale bytecode
+        source = SOURCE.replace("3", "4")
+        self.assertIsNone(cache.get_bucket(env, "a.j2", None, source).code)
+        env = self._environment(cache, source)
+        self.assertEqual(env.get_template("a.j2").render(), "0123")
+
+    def test_versions(self):
+        for version in ("1.0.0", "1.0.1"):
+            env = self._environment(BytecodeCache("hal_test", version), SOURCE)
+            env.get_template("a.j2")
+        self.assertCountEqual(
+            [path.name for path in (self.root / "hal_test").iterdir()],
+            ["1.0.0", "1.0.1"],
+        )
+
+    def _buckets(self, hal: str, version: str) -> list[Path]:
+        return list((self.root / hal / version).glob("*.cache"))
+
+    def test_evict(self):
+        for version in ("1.0.0", "1.0.1"):
+            env = self._environment(BytecodeCache("hal_test", version), SOURCE)
+            env.get_template("a.j2")
+        # 1.0.0 is the least recently used one
+        (bucket,) = self._buckets("hal_test", "1.0.0")
+        os.utime(bucket, (0, 0))
+        size = sum(path.stat().st_size for path in self._buckets("hal_test", "1.0.1"))
+
+        BytecodeCache("other", "1.0.0", max_size=size)
+        self.assertFalse((self.root / "hal_test" / "1.0.0").exists())
+        self.assertEqual(len(self._buckets("hal_test", "1.0.1")), 1)
+
+        # buckets of the version in use are evicted too, not its folder
+        cache = BytecodeCache("hal_test", "1.0.1", max_size=0)
+        self.assertListEqual(self._buckets("hal_test", "1.0.1"), [])
+        self.assertListEqual([path.name for path in self.root.iterdir()], ["hal_test"])
+
+        env = self._environment(cache, SOURCE)
+        env.get_template("a.j2")
+        self.assertEqual(len(self._buckets("hal_test", "1.0.1")), 1)
+
+    def test_evict_lru(self):
+        cache = BytecodeCache("hal_test", "1.0.0")
+        env = self._environment(cache, SOURCE)
+        env.get_template("a.j2")
+        source = SOURCE.replace("3", "4")
+        self._environment(cache, source).get_template("a.j2")
+        for bucket in self._buckets("hal_test", "1.0.0"):
+            os.utime(bucket, (0, 0))
+
+        # a hit marks the bucket as recently used
+        self.assertIsNotNone(cache.get_bucket(env, "a.j2", None, SOURCE).code)
+        size = max(path.stat().st_size for path in self._buckets("hal_test", "1.0.0"))
+        cache = BytecodeCache("hal_test", "1.0.0", max_size=size)
+        self.assertIsNotNone(cache.get_bucket(env, "a.j2", None, SOURCE).code)
+        self.assertIsNone(cache.get_bucket(env, "a.j2", None, source).code)
+
+    def test_removed(self):
+        cache = BytecodeCache("hal_test", "1.0.0")
+        env = self._environment(cache, SOURCE)
+        # another process evicted the folder in use
+        (self.root / "hal_test" / "1.0.0").rmdir()
+        self.assertEqual(env.get_template("a.j2").render(), "012")
+        self.assertEqual(len(self._buckets("hal_test", "1.0.0")), 1)
+
+        # and again right before the write, nothing is cached
+        shutil.rmtree(self.root / "hal_test")
+        with mock.patch("os.makedirs"):
+            env = self._environment(cache, SOURCE)
+            self.assertEqual(env.get_template("a.j2").render(), "012")
+        self.assertFalse((self.root / "hal_test").exists())
+
+    def tearDown(self):
+        self.patch.stop()
+        self.home.cleanup()
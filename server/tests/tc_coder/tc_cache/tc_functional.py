@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import copy
+import os
+
+from coder.cache import CoderCache
+from tests.tc_coder import PROJECT, CoderTestCase
+
+
+class TcCoderCacheFunctional(CoderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = CoderCache(capacity=2)
+
+    def test_hit(self):
+        coder = self.cache.get(self._project())
+        self.assertIs(self.cache.get(self._project()), coder)
+
+        # a new project content is rebound, the coder is kept
+        data = copy.deepcopy(PROJECT)
+        data["configs"]["GPIO"]["m3"] = {"value": 3}
+        self.assertIs(self.cache.get(self._project(data)), coder)
+        self.assertIn("core/src/gpio_m3.c", coder.files_list())
+
+    def test_generator_changed(self):
+        coder = self.cache.get(self._project())
+        generator = os.path.join(self.hal, "tools", "generator", "generator.py")
+        with open(generator, "a", encoding="utf-8") as f:
+            f.write("\n# changed\n")
+        self.assertIsNot(self.cache.get(self._project()), coder)
+
+    def test_capacity(self):
+        coder = self.cache.get(self._project(name="a"))
+        self.cache.get(self._project(name="b"))
+        self.assertIs(self.cache.get(self._project(name="a")), coder)
+        # "b" is the least recently used one
+        self.cache.get(self._project(name="c"))
+        self.assertIs(self.cache.get(self._project(name="a")), coder)
+        self.assertEqual(len(self.cache._entries), 2)
+        self.assertNotIn(
+            (self._project(name="b").path(), "hal_test", "1.0.0"), self.cache._entries
+        )
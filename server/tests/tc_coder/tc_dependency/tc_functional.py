@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import copy
+
+from coder.coder import Coder
+from coder.dependency import ConfigsDependency
+from tests.tc_coder import PROJECT, CoderTestCase
+
+
+class TcCoderDependencyFunctional(CoderTestCase):
+
+    def test_changed_paths(self):
+        old = PROJECT["configs"]
+        self.assertSetEqual(ConfigsDependency.changed_paths(old, old), set())
+
+        new = copy.deepcopy(old)
+        new["GPIO"]["m1"]["value"] = 3
+        new["GPIO"]["m3"] = {}
+        del new["RCM"]
+        self.assertSetEqual(
+            ConfigsDependency.changed_paths(old, new),
+            {"GPIO.m1.value", "GPIO.m3", "RCM"},
+        )
+        self.assertSetEqual(ConfigsDependency.changed_paths(1, {}), {""})
+
+    def test_overlaps(self):
+        changed = {"GPIO.m1.value"}
+        self.assertTrue(ConfigsDependency.overlaps({"GPIO.m1.value"}, changed))
+        # a read above or inside the change
+        self.assertTrue(ConfigsDependency.overlaps({"GPIO.m1"}, changed))
+        self.assertTrue(ConfigsDependency.overlaps({"GPIO.m1.value.x"}, changed))
+        self.assertTrue(ConfigsDependency.overlaps({""}, changed))
+        self.assertFalse(ConfigsDependency.overlaps({"GPIO.m10.value"}, changed))
+        self.assertFalse(ConfigsDependency.overlaps({"GPIO.m1.mode"}, changed))
+        self.assertFalse(ConfigsDependency.overlaps({"GPIO.m1"}, set()))
+
+    def test_project_reads(self):
+        project = self._project()
+        with project.configs.record() as reads:
+            str(project)
+        self.assertSetEqual(reads, {""})
+
+        with project.configs.record() as reads:
+            project.origin
+        self.assertSetEqual(reads, {""})
+
+    def _dump(self, coder: Coder, data: dict) -> tuple[dict, list[str]]:
+        coder.rebind(self._project(data))
+        with self._record_renders() as rendered:
+            dumped = coder.dump()
+        return dumped, rendered
+
+    def test_dump(self):
+        coder = self._coder()
+        data = copy.deepcopy(PROJECT)
+        first, rendered = self._dump(coder, data)
+        self.assertCountEqual(rendered, first.keys())
+
+        # nothing changed
+        dumped, rendered = self._dump(coder, data)
+        self.assertListEqual(rendered, [])
+        self.assertDictEqual(dumped, first)
+
+        # a value read by one file only
+        data["configs"]["GPIO"]["m1"]["value"] = 5
+        dumped, rendered = self._dump(coder, data)
+        self.assertListEqual(rendered, ["core/src/gpio_m1.c"])
+        self.assertIn("int m1_value = 5;", dumped["core/src/gpio_m1.c"])
+        for file in ("core/src/gpio_m2.c", "core/inc/main.h"):
+            self.assertEqual(dumped[file], first[file])
+
+        # a value read through a filter
+        data["configs"]["GPIO"]["m2"]["mode"] = "output"
+        _, rendered = self._dump(coder, data)
+        self.assertListEqual(rendered, ["core/src/gpio_m2.c"])
+
+        data["configs"]["RCM"]["clock"] = 8
+        _, rendered = self._dump(coder, data)
+        self.assertListEqual(rendered, ["core/inc/main.h"])
+
+        # the project settings are not tracked per file
+        data["name"] = "other"
+        _, rendered = self._dump(coder, data)
+        self.assertCountEqual(rendered, first.keys())
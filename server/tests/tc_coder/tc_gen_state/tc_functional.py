@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import copy
+import os
+
+from tests.tc_coder import PROJECT, CoderTestCase
+
+FILES = ["core/src/gpio_m1.c", "core/src/gpio_m2.c", "core/inc/main.h"]
+
+
+class TcCoderGenStateFunctional(CoderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.folder = os.path.join(self.home.name, "demo")
+        self.data = copy.deepcopy(PROJECT)
+
+    def _generate(self) -> list[str]:
+        """Generate like a new ``csp-server gen`` run, return the rendered files."""
+        coder = self._coder(self.data)
+        with self._record_renders() as rendered:
+            coder.generate()
+        return rendered
+
+    def _path(self, file: str) -> str:
+        return os.path.join(self.folder, *file.split("/"))
+
+    def _read(self, file: str) -> str:
+        with open(self._path(file), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_unchanged(self):
+        self.assertCountEqual(self._generate(), FILES)
+        self.assertTrue(os.path.isfile(os.path.join(self.folder, ".csp", "gen-state")))
+        self.assertListEqual(self._generate(), [])
+
+        # touched, the content is the same
+        os.utime(self._path(FILES[0]), (0, 0))
+        self.assertListEqual(self._generate(), [])
+
+        # a deleted output is written again
+        os.remove(self._path(FILES[0]))
+        self.assertListEqual(self._generate(), [FILES[0]])
+        self.assertTrue(os.path.isfile(self._path(FILES[0])))
+
+    def test_configs(self):
+        self._generate()
+        self.data["configs"]["GPIO"]["m1"]["value"] = 5
+        self.assertListEqual(self._generate(), ["core/src/gpio_m1.c"])
+        self.assertIn("int m1_value = 5;", self._read("core/src/gpio_m1.c"))
+
+        self.data["configs"]["RCM"]["clock"] = 8
+        self.assertListEqual(self._generate(), ["core/inc/main.h"])
+
+        # shared by every file
+        self.data["name"] = "other"
+        self.assertCountEqual(self._generate(), FILES)
+
+    def test_template(self):
+        self._generate()
+        template = os.path.join(
+            self.hal, "tools", "generator", "templates", "gpio.c.j2"
+        )
+        with open(template, "r", encoding="utf-8") as f:
+            source = f.read()
+        with open(template, "w", encoding="utf-8") as f:
+            f.write(source.replace("_value", "_level"))
+
+        self.assertCountEqual(self._generate(), FILES)
+        self.assertIn("int m1_level = 1;", self._read("core/src/gpio_m1.c"))
+        self.assertListEqual(self._generate(), [])
+
+    def test_user_code(self):
+        self._generate()
+        file = "core/src/gpio_m2.c"
+        text = self._read(file).replace(
+            "/**< user code begin 1, do not change this comment! */\n",
+            "/**< user code begin 1, do not change this comment! */\nint kept = 1;\n",
+        )
+        with open(self._path(file), "w", encoding="utf-8") as f:
+            f.write(text)
+
+        # the edited file is looked at again, the user code survives
+        self.assertListEqual(self._generate(), [file])
+        self.assertIn("int kept = 1;", self._read(file))
+        self.assertListEqual(self._generate(), [])
+
+    def test_broken(self):
+        self._generate()
+        with open(
+            os.path.join(self.folder, ".csp", "gen-state"), "w", encoding="utf-8"
+        ) as f:
+            f.write("{")
+        self.assertCountEqual(self._generate(), FILES)
+        self.assertListEqual(self._generate(), [])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import copy
+import os
+
+from coder.coder import CODER_PHASE, Coder
+from coder.snapshot import TIME_PATTERN
+from tests.tc_coder import PROJECT, CoderTestCase
+
+# more files than workers
+DATA = copy.deepcopy(PROJECT)
+DATA["configs"]["GPIO"] = {f"m{i}": {"mode": "output", "value": i} for i in range(8)}
+
+USER_CODE = """\
+/**< user code begin 1, do not change this comment! */
+int kept = 1;
+/**> user code end 1, do not change this comment! */
+"""
+
+
+def _read(folder: str) -> dict[str, str]:
+    result = {}
+    for root, dirs, names in os.walk(folder):
+        dirs[:] = [name for name in dirs if name != ".csp"]
+        for name in names:
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, folder).replace("\\", "/")
+            with open(path, "r", encoding="utf-8") as f:
+                # rendered at different times
+                result[rel] = TIME_PATTERN.sub("", f.read())
+    return result
+
+
+class TcCoderParallelFunctional(CoderTestCase):
+
+    def _project_coder(self, name: str) -> Coder:
+        folder = os.path.join(self.home.name, name)
+        os.makedirs(os.path.join(folder, "core", "src"))
+        with open(
+            os.path.join(folder, "core", "src", "gpio_m3.c"), "w", encoding="utf-8"
+        ) as f:
+            f.write(USER_CODE)
+        return self._coder(DATA, name)
+
+    def test_generate(self):
+        self._project_coder("serial").generate(jobs=1)
+        self._project_coder("parallel").generate(jobs=2)
+
+        serial = _read(os.path.join(self.home.name, "serial"))
+        self.assertEqual(len(serial), 9)
+        self.assertIn("int kept = 1;", serial["core/src/gpio_m3.c"])
+        self.assertDictEqual(_read(os.path.join(self.home.name, "parallel")), serial)
+
+    def test_dump(self):
+        serial = self._project_coder("serial").dump(jobs=1)
+        parallel = self._project_coder("parallel").dump(jobs=2)
+
+        self.assertListEqual(list(parallel), list(serial))
+        for file, text in serial.items():
+            self.assertEqual(
+                TIME_PATTERN.sub("", parallel[file]), TIME_PATTERN.sub("", text)
+            )
+
+    def test_metrics(self):
+        before = CODER_PHASE.count(phase="render")
+        serial = self._project_coder("serial").dump(jobs=1)
+        self.assertEqual(CODER_PHASE.count(phase="render") - before, len(serial))
+
+        # recorded in the workers, merged back
+        before = CODER_PHASE.count(phase="render")
+        self._project_coder("parallel").dump(jobs=2)
+        self.assertEqual(CODER_PHASE.count(phase="render") - before, len(serial))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import collections
+import copy
+import os
+from unittest import mock
+
+from coder.snapshot import FileSnapshot
+from tests.tc_coder import PROJECT, CoderTestCase
+
+
+class TcCoderSnapshotFunctional(CoderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.reads = collections.Counter()
+
+    def _open(self, path, *args, **kwargs):
+        self.reads[os.path.normpath(path)] += 1
+        return open(path, *args, **kwargs)
+
+    def test_snapshot(self):
+        path = os.path.join(self.home.name, "a.c")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("/* 2025-01-01 10:00:00 */\nint a;\n")
+
+        snapshot = FileSnapshot()
+        with mock.patch("coder.snapshot.open", self._open, create=True):
+            entry = snapshot.get(path)
+            self.assertEqual(snapshot.text(path), entry.text)
+            self.assertIs(snapshot.get(os.path.join(self.home.name, ".", "a.c")), entry)
+            self.assertIsNone(snapshot.get(os.path.join(self.home.name, "none.c")))
+        self.assertListEqual(list(self.reads.values()), [1])
+
+        self.assertEqual(entry.md5, FileSnapshot.md5(entry.text))
+        # only the timestamps differ
+        text = "/* 2026-10-18 12:34:56 */\nint a;\n"
+        self.assertNotEqual(FileSnapshot.md5(text), entry.md5)
+        self.assertEqual(FileSnapshot.normalized_md5(text), entry.normalized_md5)
+
+        # what was written is known without reading it again
+        snapshot.update(path, text)
+        self.assertEqual(snapshot.text(path), text)
+        snapshot.clear()
+        self.assertNotEqual(snapshot.text(path), text)
+
+    def test_generate(self):
+        self._coder().generate()
+
+        # every file is rendered again, with its user code and the changed check
+        data = copy.deepcopy(PROJECT)
+        data["name"] = "other"
+        coder = self._coder(data)
+        with mock.patch("coder.snapshot.open", self._open, create=True):
+            coder.generate()
+
+        folder = os.path.join(self.home.name, "demo")
+        outputs = [
+            os.path.normpath(os.path.join(folder, *file.split("/")))
+            for file in coder.files_list()
+        ]
+        self.assertDictEqual(dict(self.reads), {output: 1 for output in outputs})
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_benchmark.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import re
+import time
+import unittest
+
+from coder.user_code import UserCodeScanner
+
+BLOCKS = 400
+
+
+def _legacy_match_user(
+    data: str, prefix1: str, suffix1: str, prefix2: str, suffix2: str
+) -> dict:
+    # the implementation replaced by UserCodeScanner, kept as a reference
+    code = {}
+    for s in re.findall(
+        f"{prefix1} user code begin (.*), do not change this comment!{suffix1}",
+        data,
+    ):
+        matcher = f"{prefix1} user code begin {s}, do not change this comment!{suffix1}\n(.*){prefix2} user code end {s}, do not change this comment!{suffix2}"
+        code[s] = str.rstrip(re.findall(matcher, data, re.S)[0])
+    return code
+
+
+def _make_source(blocks: int) -> str:
+    lines = []
+    for i in range(blocks):
+        lines.append(f"void function_{i}(void)")
+        lines.append("{")
+        lines.append(f"    /**< user code begin {i}, do not change this comment! */")
+        lines.append(f"    do_something({i});")
+        lines.append(f"    /**> user code end {i}, do not change this comment! */")
+        lines.append("}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+class TcCoderUserCodeBenchmark(unittest.TestCase):
+
+    def test_benchmark(self):
+        data = _make_source(BLOCKS)
+        style = UserCodeScanner.C_STYLE
+
+        start = time.perf_counter()
+        legacy = _legacy_match_user(data, *style)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        code, problems = UserCodeScanner.get(*style).scan(data)
+        scan_time = time.perf_counter() - start
+
+        # timings are reported only, they depend on the machine
+        print(
+            f"\nuser code, {BLOCKS} blocks: legacy {legacy_time * 1000:.2f} ms, "
+            f"single pass {scan_time * 1000:.2f} ms"
+        )
+        self.assertDictEqual(code, legacy)
+        self.assertListEqual(problems, [])
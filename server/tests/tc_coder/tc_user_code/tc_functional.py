@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import unittest
+
+from coder.user_code import UserCodeScanner
+
+c_source = """\
+/**< user code begin header, do not change this comment! */
+/* my header */
+/**> user code end header, do not change this comment! */
+
+#include <stdint.h>
+/**< user code begin includes, do not change this comment! */
+/**> user code end includes, do not change this comment! */
+
+void init(void)
+{
+    /**< user code begin init 1, do not change this comment! */
+    int a = 1;
+
+    /**> user code end init 1, do not change this comment! */
+}
+"""
+
+cmake_source = """\
+# --< user code begin project configs, do not change this comment!
+set(FOO ON)
+# --> user code end project configs, do not change this comment!
+"""
+
+
+class TcCoderUserCodeFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_c_style(self):
+        scanner = UserCodeScanner.get(*UserCodeScanner.C_STYLE)
+        code, problems = scanner.scan(c_source)
+        self.assertDictEqual(
+            code,
+            {
+                "header": "/* my header */",
+                "includes": "",
+                "init 1": "    int a = 1;",
+            },
+        )
+        self.assertListEqual(problems, [])
+
+    def test_cmake_style(self):
+        scanner = UserCodeScanner.get(*UserCodeScanner.CMAKE_STYLE)
+        code, problems = scanner.scan(cmake_source)
+        self.assertDictEqual(code, {"project configs": "set(FOO ON)"})
+        self.assertListEqual(problems, [])
+
+    def test_scanner_is_cached(self):
+        self.assertIs(
+            UserCodeScanner.get(*UserCodeScanner.C_STYLE),
+            UserCodeScanner.get(*UserCodeScanner.C_STYLE),
+        )
+
+    def test_unbalanced(self):
+        scanner = UserCodeScanner.get(*UserCodeScanner.C_STYLE)
+        source = (
+            "/**< user code begin a, do not change this comment! */\n"
+            "int a;\n"
+            "/**> user code end b, do not change this comment! */\n"
+        )
+        code, problems = scanner.scan(source)
+        self.assertDictEqual(code, {})
+        self.assertListEqual(
+            problems,
+            [
+                "user code end 'b' has no begin marker",
+                "user code begin 'a' has no end marker",
+            ],
+        )
+
+    def tearDown(self):
+        pass
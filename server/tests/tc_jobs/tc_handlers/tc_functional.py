@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import tempfile
+import unittest
+
+from jobs.handlers import description_message, load_project
+from packages.description import PackageDescription
+
+DESCRIPTION = {
+    "author": {
+        "name": "tester",
+        "email": "t@example.com",
+        "website": {"blog": "https://example.com", "github": ""},
+    },
+    "name": "pkg_a",
+    "version": "1.0.0",
+    "license": "Apache-2.0",
+    "type": "hal",
+    "vendor": "test",
+    "url": {"en": "https://example.com"},
+    "vendorUrl": {"en": "https://example.com"},
+    "description": {"en": "test package a", "zh-CN": "测试包"},
+    "support": "t@example.com",
+}
+
+
+class TcJobsHandlersFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.home = tempfile.TemporaryDirectory()
+
+    def test_load_project(self):
+        path = os.path.join(self.home.name, "demo.csp")
+        with self.assertRaisesRegex(ValueError, "does not conform"):
+            load_project({"name": 1}, path)
+        with self.assertRaisesRegex(ValueError, "Failed to load file"):
+            load_project(None, path)
+
+    def test_description_message(self):
+        description = description_message(PackageDescription(DESCRIPTION))
+        self.assertEqual(description.name, "pkg_a")
+        self.assertEqual(description.type, "hal")
+        self.assertDictEqual(
+            dict(description.description), {"en": "test package a", "zh-CN": "测试包"}
+        )
+        self.assertEqual(description.author.website.blog, "https://example.com")
+
+    def tearDown(self):
+        self.home.cleanup()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import multiprocessing
+import unittest
+
+import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
+import proto.sio_job_pb2 as sio_job_pb2
+from jobs.scheduler import RUNNING, JobScheduler
+from jobs.worker import JobCancelled, JobChannel
+
+
+class _SocketIO:
+    def __init__(self):
+        self.events: list[tuple[str, bytes, str]] = []
+
+    def emit(self, event, data=None, to=None, **kwargs):
+        self.events.append((event, data, to))
+
+
+class _Conn:
+    def __init__(self):
+        self.sent: list[tuple] = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+class _Worker:
+    def __init__(self, job):
+        self.job = job
+        self.cancelled = multiprocessing.Array("c", 32)
+
+
+class TcJobsSchedulerFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.socketio = _SocketIO()
+        # not started, jobs stay queued
+        self.scheduler = JobScheduler(self.socketio)  # type: ignore
+
+    def _states(self) -> list[tuple[str, str, int]]:
+        states = []
+        for event, data, to in self.socketio.events:
+            if event == "job/status":
+                msg = sio_job_pb2.SioJobStatus()
+                msg.ParseFromString(data)
+                states.append((to, msg.kind, msg.state))
+        return states
+
+    def test_submit(self):
+        data = sio_coder_dump_pb2.SioCoderDumpRequest(path="a.csp").SerializeToString()
+        self.scheduler.submit("coder/dump", "sid", data)
+        self.assertListEqual(
+            self._states(), [("sid", "coder/dump", sio_job_pb2.SIO_JOB_STATE_QUEUED)]
+        )
+        self.assertEqual(self.scheduler.stats()["queued"], 1)
+
+    def test_cancel(self):
+        job_id = self.scheduler.submit("package/install", "sid", b"")
+
+        self.assertIsNotNone(self.scheduler.cancel(job_id, "other"))
+        self.assertIsNone(self.scheduler.cancel(job_id, "sid"))
+        self.assertIsNotNone(self.scheduler.cancel(job_id, "sid"))
+        self.assertEqual(self.scheduler.stats()["queued"], 0)
+
+        self.assertEqual(self._states()[-1][2], sio_job_pb2.SIO_JOB_STATE_CANCELLED)
+        results = [e for e in self.socketio.events if e[0] == "package/install.result"]
+        self.assertEqual(len(results), 1)
+
+    def test_cancel_running(self):
+        job_id = self.scheduler.submit("package/install", "sid", b"")
+        job = self.scheduler._jobs[job_id]
+        job.state = RUNNING
+
+        # the worker has already exited
+        self.assertIsNotNone(self.scheduler.cancel(job_id, "sid"))
+
+        worker = _Worker(job)
+        self.scheduler._workers.append(worker)  # type: ignore
+        self.assertIsNone(self.scheduler.cancel(job_id, "sid"))
+        # the worker is kept, it stops the job itself
+        self.assertEqual(worker.cancelled.value, job_id.encode("ascii"))
+        self.assertEqual(self._states()[-1][2], sio_job_pb2.SIO_JOB_STATE_CANCELLED)
+
+    def test_channel(self):
+        conn = _Conn()
+        cancelled = multiprocessing.Array("c", 32)
+        channel = JobChannel(conn, "a" * 32, cancelled, "package/install.result")  # type: ignore
+        channel.emit("package/install.progress", b"1", to="sid")
+        self.assertEqual(len(conn.sent), 1)
+
+        # another job was cancelled
+        cancelled.value = b"b" * 32
+        channel.emit("package/install.progress", b"2", to="sid")
+        self.assertEqual(len(conn.sent), 2)
+
+        cancelled.value = b"a" * 32
+        with self.assertRaises(JobCancelled):
+            channel.emit("package/install.progress", b"3", to="sid")
+        channel.emit("package/install.result", b"", to="sid")
+        self.assertEqual(len(conn.sent), 2)
+
+    def test_cancel_sid(self):
+        self.scheduler.submit("coder/generate", "a", b"")
+        self.scheduler.submit("coder/generate", "b", b"")
+        self.scheduler.cancel_sid("a")
+        self.assertEqual(self.scheduler.stats()["queued"], 1)
+
+    def tearDown(self):
+        pass
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import json
+import unittest
+
+import proto.sio_coder_dump_pb2 as sio_coder_dump_pb2
+from google.protobuf.json_format import MessageToDict
+from jobs.session import (
+    SessionStore,
+    WorkerProjects,
+    json_patch,
+    merge_patch,
+    request_content,
+)
+
+PROJECT = {
+    "version": "1.0.0",
+    "name": "demo",
+    "vendor": "Geehy",
+    "targetChip": "APM32F103ZET6",
+    "configs": {"pins": {"PA1": {"mode": "output"}}},
+    "modules": ["gpio"],
+    "gen": {
+        "hal": "csp_hal_apm32f1",
+        "builder": "xmake",
+        "builderVersion": "v2.9.0",
+        "toolchains": "arm-none-eabi-gcc",
+    },
+}
+
+
+def _request(content: dict, delta: bool = False) -> bytes:
+    return sio_coder_dump_pb2.SioCoderDumpRequest(
+        content_data=json.dumps(content).encode("utf-8"),
+        content_delta=delta,
+        path="/tmp/demo.csp",
+    ).SerializeToString()
+
+
+class TcJobsSessionFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_merge_patch(self):
+        target = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1, 2]}
+        patch = {"a": None, "b": {"c": 4}, "e": [3], "f": {"g": None}}
+        self.assertDictEqual(
+            merge_patch(target, patch), {"b": {"c": 4, "d": 3}, "e": [3], "f": {}}
+        )
+        self.assertEqual(merge_patch({"a": 1}, [1]), [1])
+
+    def test_json_patch(self):
+        doc = {"a": {"b": [1, 2]}, "c": 1}
+        ops = [
+            {"op": "add", "path": "/a/b/-", "value": 3},
+            {"op": "replace", "path": "/c", "value": 2},
+            {"op": "copy", "from": "/a/b", "path": "/d"},
+            {"op": "move", "from": "/d", "path": "/e~1f"},
+            {"op": "remove", "path": "/a/b/0"},
+            {"op": "test", "path": "/c", "value": 2},
+        ]
+        patched, touched = json_patch(doc, ops)
+        self.assertDictEqual(patched, {"a": {"b": [2, 3]}, "c": 2, "e/f": [1, 2, 3]})
+        self.assertSetEqual(touched, {"a", "c", "d", "e/f"})
+        # the original is left untouched
+        self.assertDictEqual(doc, {"a": {"b": [1, 2]}, "c": 1})
+
+        self.assertIsNone(json_patch(doc, [{"op": "add", "path": "", "value": {}}])[1])
+        for op in (
+            {"op": "remove", "path": "/x"},
+            {"op": "add", "path": "/a/b/5", "value": 1},
+            {"op": "test", "path": "/c", "value": 2},
+            {"op": "move", "from": "/a", "path": "/a/b"},
+            {"op": "unknown", "path": "/c"},
+            {"op": "add", "path": "c", "value": 1},
+        ):
+            with self.assertRaises(ValueError):
+                json_patch(doc, [op])
+
+    def test_request_content(self):
+        msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+        msg.content.update({"count": 1})
+        self.assertDictEqual(request_content(msg), MessageToDict(msg.content))
+        self.assertIsInstance(request_content(msg)["count"], float)
+
+        msg.content_data = b'{"count": 1}'
+        self.assertDictEqual(request_content(msg), {"count": 1})
+        self.assertIsInstance(request_content(msg)["count"], int)
+
+        msg.content_data = b"[1]"
+        with self.assertRaises(ValueError):
+            request_content(msg)
+
+    def test_resolve_dump(self):
+        sessions = SessionStore()
+        content = {"name": "demo", "modules": {"gpio": {"pin": 1}}}
+        data = _request(content)
+        self.assertEqual(sessions.resolve_dump("sid", data), data)
+
+        data = sessions.resolve_dump(
+            "sid", _request({"modules": {"gpio": {"pin": 2}}}, True)
+        )
+        msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+        msg.ParseFromString(data)
+        self.assertFalse(msg.content_delta)
+        self.assertEqual(msg.path, "/tmp/demo.csp")
+        self.assertDictEqual(
+            request_content(msg), {"name": "demo", "modules": {"gpio": {"pin": 2}}}
+        )
+
+        # deltas chain on the resolved content
+        data = sessions.resolve_dump("sid", _request({"name": None}, True))
+        msg.ParseFromString(data)
+        self.assertDictEqual(request_content(msg), {"modules": {"gpio": {"pin": 2}}})
+
+    def test_resolve_dump_struct(self):
+        sessions = SessionStore()
+        msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+        msg.content.update({"name": "demo"})
+        sessions.resolve_dump("sid", msg.SerializeToString())
+
+        data = sessions.resolve_dump("sid", _request({"count": 1}, True))
+        msg.ParseFromString(data)
+        self.assertDictEqual(request_content(msg), {"name": "demo", "count": 1})
+
+    def test_resolve_dump_without_base(self):
+        sessions = SessionStore()
+        with self.assertRaises(ValueError):
+            sessions.resolve_dump("sid", _request({"name": "demo"}, True))
+
+        sessions.resolve_dump("sid", _request({"name": "demo"}))
+        sessions.drop("sid")
+        with self.assertRaises(ValueError):
+            sessions.resolve_dump("sid", _request({"name": "demo"}, True))
+
+    def test_patch(self):
+        sessions = SessionStore()
+        session = sessions.get("sid")
+        with self.assertRaises(ValueError):
+            session.patch([])
+
+        sessions.resolve_dump("sid", _request(PROJECT))
+        revision = session.revision
+        session.patch([{"op": "replace", "path": "/name", "value": "other"}])
+        self.assertEqual(session.revision, revision + 1)
+        self.assertEqual(session.content()["name"], "other")
+
+        # invalid results and stale revisions are refused, nothing changes
+        for ops, rev in (
+            ([{"op": "replace", "path": "/name", "value": 1}], 0),
+            ([{"op": "remove", "path": "/gen/hal"}], 0),
+            ([{"op": "replace", "path": "/name", "value": "x"}], revision),
+        ):
+            with self.assertRaises(ValueError):
+                session.patch(ops, rev)
+            self.assertEqual(session.revision, revision + 1)
+            self.assertEqual(session.content()["name"], "other")
+            self.assertEqual(session.content()["gen"]["hal"], "csp_hal_apm32f1")
+
+    def test_worker_projects(self):
+        sessions = SessionStore()
+        projects = WorkerProjects()
+        sessions.resolve_dump("sid", _request(PROJECT))
+        session = sessions.get("sid")
+
+        def dump(revision: int) -> sio_coder_dump_pb2.SioCoderDumpRequest:
+            request = sio_coder_dump_pb2.SioCoderDumpRequest(
+                content_session=True, path="/tmp/demo.csp"
+            )
+            data = sessions.resolve_dump("sid", request.SerializeToString())
+            msg = sio_coder_dump_pb2.SioCoderDumpRequest()
+            msg.ParseFromString(sessions.prepare_dump("sid", data, revision))
+            return msg
+
+        # an unknown worker gets the full content
+        msg = dump(0)
+        self.assertEqual(msg.session_base, 0)
+        project = projects.resolve("sid", msg)
+        self.assertEqual(project.name, "demo")
+        self.assertEqual(projects.revision("sid"), session.revision)
+
+        # an up to date worker gets nothing
+        msg = dump(projects.revision("sid"))
+        self.assertEqual(msg.content_data, b"")
+        self.assertIs(projects.resolve("sid", msg), project)
+
+        # a late worker gets the patches it misses
+        base = projects.revision("sid")
+        session.patch([{"op": "replace", "path": "/name", "value": "other"}])
+        session.patch([{"op": "add", "path": "/configs/pins/PA2", "value": {}}])
+        msg = dump(base)
+        self.assertEqual(msg.session_base, base)
+        project = projects.resolve("sid", msg)
+        self.assertEqual(project.name, "other")
+        self.assertDictEqual(project.configs.get("pins.PA2"), {})
+        self.assertDictEqual(project.origin, session.content())
+
+        projects.drop("sid")
+        with self.assertRaises(ValueError):
+            projects.resolve("sid", dump(base + 1))
+
+    def tearDown(self):
+        pass
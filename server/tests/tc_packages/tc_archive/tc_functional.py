@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from packages.archive import ArchiveExtractor
+
+FILES = {
+    "pkg.csppdsc": b"name: demo\n",
+    "src/a.c": b"int a;\n" * 1000,
+    "src/b.c": b"int b;\n",
+    "empty.txt": b"",
+}
+
+
+def _tree(folder: str) -> dict[str, bytes]:
+    result = {}
+    for root, _, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, folder).replace("\\", "/")
+            with open(path, "rb") as f:
+                result[rel] = f.read()
+    return result
+
+
+class TcPackagesArchiveFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+        self.progress = []
+
+    def _on_progress(self, index, count, file, size, total):
+        self.progress.append((index, count, file, size, total))
+
+    def _zip(self, files: dict[str, bytes], dirs: list[str] = []) -> str:
+        path = os.path.join(self.folder.name, "pkg.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name in dirs:
+                archive.writestr(zipfile.ZipInfo(f"{name}/"), b"")
+            for name, data in files.items():
+                archive.writestr(name, data)
+        return path
+
+    def _tar_gz(self, files: dict[str, bytes], dirs: list[str] = []) -> str:
+        path = os.path.join(self.folder.name, "pkg.tar.gz")
+        with tarfile.open(path, "w:gz") as archive:
+            for name in dirs:
+                info = tarfile.TarInfo(name)
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                archive.addfile(info)
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        return path
+
+    def _extract(self, kind: str, path: str) -> dict[str, bytes]:
+        dest = tempfile.mkdtemp(dir=self.folder.name)
+        extractor = ArchiveExtractor(self._on_progress, jobs=4)
+        getattr(extractor, f"extract_{kind}")(path, dest)
+        return _tree(dest)
+
+    def test_strip_top(self):
+        nested = {f"demo/{name}": data for name, data in FILES.items()}
+        for kind, make in (("zip", self._zip), ("tar_gz", self._tar_gz)):
+            with self.subTest(kind=kind):
+                self.assertDictEqual(
+                    self._extract(kind, make(nested, ["demo", "demo/src"])), FILES
+                )
+                # without directory entries
+                self.assertDictEqual(self._extract(kind, make(nested)), FILES)
+
+    def test_keep(self):
+        for kind, make in (("zip", self._zip), ("tar_gz", self._tar_gz)):
+            with self.subTest(kind=kind):
+                self.assertDictEqual(self._extract(kind, make(FILES)), FILES)
+
+                # a later member outside the guessed top directory
+                files = {"demo/a.c": b"a", "demo/demo/b.c": b"b", "other.c": b"c"}
+                self.assertDictEqual(self._extract(kind, make(files)), files)
+
+                # a single file is not a top directory
+                files = {"demo": b"a"}
+                self.assertDictEqual(self._extract(kind, make(files)), files)
+
+    def test_progress(self):
+        total = sum(len(data) for data in FILES.values())
+        self._extract("zip", self._zip(FILES))
+        self.assertListEqual(
+            [item[0] for item in self.progress], list(range(1, len(FILES) + 1))
+        )
+        self.assertEqual(self.progress[-1][1], len(FILES))
+        self.assertEqual(self.progress[-1][3:], (total, total))
+
+        self.progress.clear()
+        path = self._tar_gz(FILES)
+        self._extract("tar_gz", path)
+        # the count is unknown until the end of the stream
+        self.assertTrue(all(item[1] == 0 for item in self.progress[:-1]))
+        size = os.path.getsize(path)
+        self.assertEqual(self.progress[-1][:2], (len(FILES), len(FILES)))
+        self.assertEqual(self.progress[-1][3:], (size, size))
+        sizes = [item[3] for item in self.progress]
+        self.assertListEqual(sizes, sorted(sizes))
+
+    def test_reuse(self):
+        installed = os.path.join(self.folder.name, "installed")
+        os.makedirs(installed)
+        with open(os.path.join(installed, "a.c"), "wb") as f:
+            f.write(FILES["src/a.c"])
+        size = len(FILES["src/a.c"])
+
+        for kind, make in (("zip", self._zip), ("tar_gz", self._tar_gz)):
+            with self.subTest(kind=kind):
+                asked = []
+
+                def reuse(name: str, mode: int) -> str | None:
+                    asked.append(name)
+                    return os.path.join(installed, "a.c") if name == "src/a.c" else None
+
+                dest = tempfile.mkdtemp(dir=self.folder.name)
+                extractor = ArchiveExtractor(reuse=reuse)
+                path = make({f"demo/{name}": data for name, data in FILES.items()})
+                getattr(extractor, f"extract_{kind}")(path, dest)
+
+                self.assertDictEqual(_tree(dest), FILES)
+                self.assertCountEqual(asked, FILES.keys())
+                self.assertEqual(extractor.saved, size)
+                self.assertTrue(
+                    os.path.samefile(
+                        os.path.join(installed, "a.c"), os.path.join(dest, "src", "a.c")
+                    )
+                )
+
+    def test_reuse_differs(self):
+        # what a stale or forged manifest claims is the same, with the same size
+        installed = os.path.join(self.folder.name, "installed")
+        os.makedirs(installed)
+        with open(os.path.join(installed, "a.c"), "wb") as f:
+            f.write(b"int c;\n" * 1000)
+
+        for kind, make in (("zip", self._zip), ("tar_gz", self._tar_gz)):
+            with self.subTest(kind=kind):
+
+                def reuse(name: str, mode: int) -> str | None:
+                    return os.path.join(installed, "a.c") if name == "src/a.c" else None
+
+                dest = tempfile.mkdtemp(dir=self.folder.name)
+                extractor = ArchiveExtractor(reuse=reuse)
+                path = make({f"demo/{name}": data for name, data in FILES.items()})
+                getattr(extractor, f"extract_{kind}")(path, dest)
+
+                self.assertDictEqual(_tree(dest), FILES)
+                self.assertEqual(extractor.saved, 0)
+                self.assertFalse(
+                    os.path.samefile(
+                        os.path.join(installed, "a.c"), os.path.join(dest, "src", "a.c")
+                    )
+                )
+
+    @unittest.skipIf(os.name == "nt", "no executable bit")
+    def test_reuse_differs_mode(self):
+        installed = os.path.join(self.folder.name, "installed")
+        os.makedirs(installed)
+        with open(os.path.join(installed, "run.sh"), "wb") as f:
+            f.write(b"#!/bin/sh\n")
+
+        path = os.path.join(self.folder.name, "pkg.tar.gz")
+        with tarfile.open(path, "w:gz") as archive:
+            data = b"#!/bin/bash\n"
+            info = tarfile.TarInfo("demo/run.sh")
+            info.size = len(data)
+            info.mode = 0o755
+            info.mtime = 1234567890
+            archive.addfile(info, io.BytesIO(data))
+
+        dest = tempfile.mkdtemp(dir=self.folder.name)
+        extractor = ArchiveExtractor(
+            reuse=lambda name, mode: os.path.join(installed, "run.sh")
+        )
+        extractor.extract_tar_gz(path, dest)
+
+        target = os.path.join(dest, "run.sh")
+        self.assertDictEqual(_tree(dest), {"run.sh": data})
+        self.assertEqual(os.stat(target).st_mode & 0o777, 0o755)
+        self.assertEqual(int(os.path.getmtime(target)), 1234567890)
+
+    def test_read_member(self):
+        files = {"first.txt": b"1", "second.txt": b"2"}
+        path = self._zip(files)
+        self.assertEqual(ArchiveExtractor.read_member(path, "zip", "second.txt"), b"2")
+        self.assertIsNone(ArchiveExtractor.read_member(path, "zip", "none.txt"))
+
+        path = self._tar_gz(files)
+        self.assertEqual(
+            ArchiveExtractor.read_member(path, "tar.gz", "first.txt"), b"1"
+        )
+        # a streamed tar is only looked at up to its first member
+        self.assertIsNone(ArchiveExtractor.read_member(path, "tar.gz", "second.txt"))
+
+    def test_unsafe(self):
+        files = {"../evil.c": b"a", "/abs.c": b"b", "ok.c": b"c"}
+        dest = tempfile.mkdtemp(dir=self.folder.name)
+        ArchiveExtractor().extract_zip(self._zip(files), dest)
+        self.assertDictEqual(
+            _tree(dest),
+            {"evil.c": b"a", "abs.c": b"b", "ok.c": b"c"},
+        )
+
+    def test_symlink_escape(self):
+        path = os.path.join(self.folder.name, "evil.tar.gz")
+        with tarfile.open(path, "w:gz") as archive:
+            # each link stays inside on its own, "a" resolves outside through "c"
+            for name, target in (("pkg/c", "."), ("pkg/a", "c/..")):
+                info = tarfile.TarInfo(name)
+                info.type = tarfile.SYMTYPE
+                info.linkname = target
+                archive.addfile(info)
+            info = tarfile.TarInfo("pkg/a/escaped.txt")
+            info.size = 3
+            archive.addfile(info, io.BytesIO(b"bad"))
+
+        for filtered in (True, False):
+            with self.subTest(filtered=filtered), mock.patch.dict(tarfile.__dict__):
+                if not filtered:
+                    # a python without extraction filters
+                    del tarfile.__dict__["data_filter"]
+                outer = tempfile.mkdtemp(dir=self.folder.name)
+                dest = os.path.join(outer, "dest")
+                os.makedirs(dest)
+                ArchiveExtractor().extract_tar_gz(path, dest)
+                self.assertListEqual(os.listdir(outer), ["dest"])
+                self.assertFalse(os.path.islink(os.path.join(dest, "a")))
+
+    def tearDown(self):
+        self.folder.cleanup()
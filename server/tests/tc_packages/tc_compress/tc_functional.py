@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import gzip
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from packages import compress
+from packages.archive import ArchiveExtractor
+from packages.compress import BLOCK_SIZE, ParallelGzipWriter, zstd_reader, zstd_writer
+from packages.package import Package
+
+
+def _data(size: int) -> bytes:
+    rand = random.Random(size)
+    words = [b"int", b"void", b"return", b"0x1F", b"gpio", b"\n", b" "]
+    data = b"".join(rand.choice(words) for _ in range(size // 3))
+    return data[:size]
+
+
+class TcPackagesCompressFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+
+    def test_gzip(self):
+        for size in (0, 1, BLOCK_SIZE, BLOCK_SIZE * 3 + 17):
+            data = _data(size)
+            for jobs in (1, 4):
+                output = io.BytesIO()
+                with ParallelGzipWriter(output, 6, jobs) as writer:
+                    # uneven writes cross the block boundaries
+                    for i in range(0, len(data), 100000):
+                        writer.write(data[i : i + 100000])
+                self.assertFalse(output.closed)
+                self.assertEqual(gzip.decompress(output.getvalue()), data)
+
+    def test_gzip_ratio(self):
+        data = _data(BLOCK_SIZE * 4)
+        output = io.BytesIO()
+        with ParallelGzipWriter(output, 6, 4) as writer:
+            writer.write(data)
+        # priming every block with its predecessor keeps the ratio of one stream
+        single = len(gzip.compress(data, 6))
+        self.assertLess(len(output.getvalue()), single * 1.01)
+
+    def test_gzip_level(self):
+        with self.assertRaises(ValueError):
+            ParallelGzipWriter(io.BytesIO(), 10)
+
+    @unittest.skipIf(compress.zstandard is None, "zstandard is not installed")
+    def test_zstd(self):
+        data = _data(BLOCK_SIZE * 2)
+        output = io.BytesIO()
+        with zstd_writer(output, 3, 2) as writer:
+            writer.write(data)
+        output.seek(0)
+        with zstd_reader(output) as reader:
+            self.assertEqual(reader.read(), data)
+
+    def _round_trip(self, fmt: str):
+        source = os.path.join(self.folder.name, "demo")
+        files = {"pkg.csppdsc": b"name: demo\n", "src/a.c": _data(300000)}
+        for name, data in files.items():
+            path = os.path.join(source, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+        output = os.path.join(self.folder.name, "demo.csppack")
+        Package().compress_directory(source, output, fmt, jobs=2)
+
+        dest = os.path.join(self.folder.name, "dest")
+        extractor = ArchiveExtractor(lambda *args: None)
+        if fmt == "tar.gz":
+            extractor.extract_tar_gz(output, dest)
+        elif fmt == "tar.zst":
+            extractor.extract_tar_zst(output, dest)
+        else:
+            extractor.extract_zip(output, dest)
+        for name, data in files.items():
+            with open(os.path.join(dest, name), "rb") as f:
+                self.assertEqual(f.read(), data, name)
+
+    def test_level(self):
+        package = Package()
+        output = os.path.join(self.folder.name, "demo.csppack")
+        for fmt, level in (("zip", 10), ("tar.gz", 0), ("tar.zst", 23)):
+            with self.subTest(fmt=fmt), self.assertRaises(ValueError):
+                package.compress_directory(self.folder.name, output, fmt, level)
+        self.assertFalse(os.path.exists(output))
+
+    def test_tar_gz(self):
+        self._round_trip("tar.gz")
+
+    def test_zip(self):
+        self._round_trip("zip")
+
+    @unittest.skipIf(compress.zstandard is None, "zstandard is not installed")
+    def test_tar_zst(self):
+        self._round_trip("tar.zst")
+
+    def tearDown(self):
+        self.folder.cleanup()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_benchmark.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import fnmatch
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from packages.gitignore import GitIgnoreMatcher
+
+MODULES = 60
+FILES = 60
+GITIGNORE = "\n".join(
+    ["# build outputs", "*.o", "*.d", "*.map", "build/", "*.tmp", "!keep.tmp"]
+    + [f"*.ext{i}" for i in range(20)]
+)
+
+
+def _legacy_collect(base_path: str) -> dict[str, list[str]]:
+    # the implementation replaced by GitIgnoreMatcher, kept as a reference
+    gitignore_map = {}
+    for root, dirs, files in os.walk(base_path):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        gitignore_file = os.path.join(root, ".gitignore")
+        if os.path.isfile(gitignore_file):
+            patterns = []
+            with open(gitignore_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        patterns.append(line)
+            if patterns:
+                gitignore_map[root] = patterns
+    return gitignore_map
+
+
+def _legacy_is_ignored(file_path: str, base_path: str, gitignore_map: dict) -> bool:
+    rel_path = os.path.relpath(file_path, base_path).replace("\\", "/")
+    file_dir = str(Path(file_path).parent)
+    applicable_patterns = []
+    for gitignore_dir, patterns in gitignore_map.items():
+        if file_dir.startswith(gitignore_dir) or gitignore_dir == base_path:
+            if gitignore_dir == base_path:
+                check_path = rel_path
+            else:
+                check_path = os.path.relpath(file_path, gitignore_dir).replace(
+                    "\\", "/"
+                )
+            applicable_patterns.append((gitignore_dir, patterns, check_path))
+    applicable_patterns.sort(key=lambda x: x[0].count(os.sep))
+
+    is_ignored = False
+    for gitignore_dir, patterns, check_path in applicable_patterns:
+        for pattern in patterns:
+            negate = pattern.startswith("!")
+            if negate:
+                pattern = pattern[1:]
+            if pattern.endswith("/"):
+                pattern = pattern[:-1]
+                path_parts = check_path.split("/")
+                for i in range(len(path_parts)):
+                    dir_path = "/".join(path_parts[: i + 1])
+                    if fnmatch.fnmatch(dir_path, pattern):
+                        is_ignored = not negate
+                        break
+            else:
+                if fnmatch.fnmatch(check_path, pattern) or fnmatch.fnmatch(
+                    os.path.basename(check_path), pattern
+                ):
+                    is_ignored = not negate
+    return is_ignored
+
+
+def _legacy_walk(path: str) -> list[str]:
+    gitignore_map = _legacy_collect(path)
+    items = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in [".git"]]
+        if gitignore_map:
+            dirs[:] = [
+                d
+                for d in dirs
+                if not _legacy_is_ignored(os.path.join(root, d), path, gitignore_map)
+            ]
+        for file in files:
+            source_file = os.path.join(root, file)
+            if gitignore_map and _legacy_is_ignored(source_file, path, gitignore_map):
+                continue
+            items.append(os.path.relpath(source_file, path))
+    return items
+
+
+def _make_hal(folder: str):
+    """A HAL like tree, a .gitignore at the top and in every tenth module."""
+    with open(os.path.join(folder, ".gitignore"), "w", encoding="utf-8") as f:
+        f.write(GITIGNORE)
+    for module in range(MODULES):
+        src = os.path.join(folder, "drivers", f"module{module}", "src")
+        os.makedirs(src)
+        if module % 10 == 0:
+            with open(
+                os.path.join(folder, "drivers", f"module{module}", ".gitignore"),
+                "w",
+                encoding="utf-8",
+            ) as f:
+                f.write(GITIGNORE)
+        for i in range(FILES):
+            ext = (".c", ".h", ".o", ".tmp", ".ext3")[i % 5]
+            Path(src, f"file{i}{ext}").touch()
+
+
+class TcPackagesGitIgnoreBenchmark(unittest.TestCase):
+
+    def test_benchmark(self):
+        with tempfile.TemporaryDirectory() as folder:
+            _make_hal(folder)
+
+            start = time.perf_counter()
+            legacy = _legacy_walk(folder)
+            legacy_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            files = [
+                os.path.relpath(os.path.join(root, name), folder)
+                for root, names in GitIgnoreMatcher(folder).walk()
+                for name in names
+            ]
+            matcher_time = time.perf_counter() - start
+
+        print(
+            f"\n.gitignore, {MODULES * FILES} files: legacy {legacy_time * 1000:.2f} ms, "
+            f"compiled {matcher_time * 1000:.2f} ms"
+        )
+        self.assertListEqual(sorted(files), sorted(legacy))
+        self.assertLess(matcher_time, legacy_time)
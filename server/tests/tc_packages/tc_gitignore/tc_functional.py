@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import os
+import tempfile
+import unittest
+
+from packages.gitignore import GitIgnoreMatcher, GitIgnoreRules
+
+TREE = {
+    ".gitignore": "*.o\n!keep.o\nbuild/\n/doc/*.pdf\n",
+    "src/.gitignore": "*.tmp\n!*.o\n",
+    "a.c": "",
+    "a.o": "",
+    "keep.o": "",
+    "build/out.bin": "",
+    "doc/manual.pdf": "",
+    "doc/api/api.pdf": "",
+    "src/b.c": "",
+    "src/b.o": "",
+    "src/b.tmp": "",
+    "src/build/x.c": "",
+    ".git/config": "",
+}
+
+
+class TcPackagesGitIgnoreFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+        for name, text in TREE.items():
+            path = os.path.join(self.folder.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+    def test_rules(self):
+        rules = GitIgnoreRules("*.o\n!keep.o\nbuild/\n/doc/*.pdf\n**/tmp\nfoo/**\n")
+        cases = [
+            ("x/y.o", False, True),
+            ("x/keep.o", False, False),
+            ("x/build", True, True),
+            ("x/build", False, None),
+            ("doc/a.pdf", False, True),
+            ("x/doc/a.pdf", False, None),
+            ("doc/x/a.pdf", False, None),
+            ("x/y/tmp", False, True),
+            ("foo/x/y", False, True),
+            ("a.c", False, None),
+        ]
+        for path, folder, expected in cases:
+            with self.subTest(path=path, folder=folder):
+                self.assertEqual(rules.match(path, folder), expected)
+
+    def test_walk(self):
+        matcher = GitIgnoreMatcher(self.folder.name)
+        files = set()
+        for root, names in matcher.walk():
+            for name in names:
+                path = os.path.relpath(os.path.join(root, name), self.folder.name)
+                files.add(path.replace("\\", "/"))
+        self.assertSetEqual(
+            files,
+            {
+                ".gitignore",
+                "src/.gitignore",
+                "a.c",
+                "keep.o",
+                "doc/api/api.pdf",
+                "src/b.c",
+                # the deeper .gitignore takes it back
+                "src/b.o",
+            },
+        )
+
+    def tearDown(self):
+        self.folder.cleanup()
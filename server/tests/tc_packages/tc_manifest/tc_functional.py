@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import hashlib
+import os
+import tempfile
+import unittest
+
+from packages.manifest import MANIFEST_NAME, PackageManifest
+
+
+class TcPackagesManifestFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+
+    def _tree(self, files: dict[str, bytes]) -> str:
+        folder = tempfile.mkdtemp(dir=self.folder.name)
+        for rel, data in files.items():
+            path = os.path.join(folder, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+        return folder
+
+    def test_folder(self):
+        folder = self._tree({"a.c": b"a", "src/b.c": b"bb", MANIFEST_NAME: b"{}"})
+        manifest = PackageManifest.from_folder("hal", "demo", "1.0.0", folder)
+        self.assertDictEqual(
+            manifest.files,
+            {
+                "a.c": (hashlib.sha256(b"a").hexdigest(), 1),
+                "src/b.c": (hashlib.sha256(b"bb").hexdigest(), 2),
+            },
+        )
+
+        manifest.save(folder)
+        loaded = PackageManifest.load(folder)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(
+            (loaded.kind, loaded.name, loaded.version), ("hal", "demo", "1.0.0")
+        )
+        self.assertDictEqual(loaded.files, manifest.files)
+
+    def test_invalid(self):
+        for data in (b"", b"[]", b'{"files": {}}', b"\xff"):
+            self.assertIsNone(PackageManifest.loads(data))
+        self.assertIsNone(PackageManifest.load(self.folder.name))
+
+    def test_shared(self):
+        v1 = PackageManifest.from_folder(
+            "hal", "demo", "1.0.0", self._tree({"a.c": b"a" * 10, "b.c": b"b"})
+        )
+        v2_folder = self._tree({"a.c": b"a" * 10, "moved/a.h": b"a" * 10, "b.c": b"c"})
+        v2 = PackageManifest.from_folder("hal", "demo", "1.0.1", v2_folder)
+        self.assertEqual(v2.shared(v1), 20)
+
+        digest = hashlib.sha256(b"c").hexdigest()
+        self.assertEqual(v2.digests(v2_folder)[digest], os.path.join(v2_folder, "b.c"))
+
+    def tearDown(self):
+        self.folder.cleanup()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from packages import package
+from packages.package import Package
+
+DESCRIPTION = """\
+author:
+  name: tester
+  email: t@example.com
+  website:
+    blog: https://example.com
+    github: https://github.com/example
+name: pkg_a
+version: 1.0.0
+license: Apache-2.0
+type: hal
+vendor: test
+url:
+  en: https://example.com
+vendorUrl:
+  en: https://example.com
+description:
+  en: test package a
+support: t@example.com
+"""
+
+
+class TcPackagesPackageFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.home = tempfile.TemporaryDirectory()
+        # the packages are installed under ~/.csp/packages
+        self.patch = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.patch.start()
+        self.source = os.path.join(self.home.name, "pkg_a")
+        os.makedirs(os.path.join(self.source, "src"))
+        with open(os.path.join(self.source, "pkg_a.csppdsc"), "w") as f:
+            f.write(DESCRIPTION)
+        self._write("v1")
+        self.repository = os.path.join(self.home.name, ".csp", "packages")
+        self.folder = os.path.join(self.repository, "hal", "test", "pkg_a", "1.0.0")
+
+    def _write(self, text: str):
+        with open(os.path.join(self.source, "src", "a.c"), "w") as f:
+            f.write(text)
+
+    def _installed(self) -> str:
+        with open(os.path.join(self.folder, "src", "a.c")) as f:
+            return f.read()
+
+    @staticmethod
+    def _partial_move(src: str, dst: str):
+        # a move across devices that stops half way
+        os.makedirs(os.path.join(dst, "src"))
+        raise OSError("no space left on device")
+
+    def test_reinstall(self):
+        self.assertIsNotNone(Package().install(self.source))
+        self._write("v2")
+        self.assertIsNotNone(Package().install(self.source))
+        self.assertEqual(self._installed(), "v2")
+        self.assertListEqual(glob.glob(os.path.join(self.repository, "tmp.*")), [])
+
+    def test_move_failed(self):
+        Package().install(self.source)
+        self._write("v2")
+        with mock.patch.object(package.shutil, "move", self._partial_move):
+            with self.assertRaises(OSError):
+                Package().install(self.source)
+
+        self.assertEqual(self._installed(), "v1")
+        self.assertListEqual(glob.glob(os.path.join(self.repository, "tmp.*")), [])
+
+    def test_restore_failed(self):
+        Package().install(self.source)
+        self._write("v2")
+        rename = os.rename
+        renames = []
+
+        def restore_fails(src: str, dst: str):
+            renames.append(dst)
+            if len(renames) > 1:
+                raise OSError("busy")
+            rename(src, dst)
+
+        with (
+            mock.patch.object(package.shutil, "move", self._partial_move),
+            mock.patch.object(package.os, "rename", restore_fails),
+        ):
+            with self.assertRaises(OSError):
+                Package().install(self.source)
+
+        # the previous version is still there, moved aside
+        kept = glob.glob(os.path.join(self.repository, "tmp.*", "1.0.0", "src", "a.c"))
+        self.assertEqual(len(kept), 1)
+        with open(kept[0]) as f:
+            self.assertEqual(f.read(), "v1")
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.home.name, ignore_errors=True)
+        self.home.cleanup()
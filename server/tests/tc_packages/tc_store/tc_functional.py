@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+
+import os
+import tempfile
+import unittest
+
+from packages.store import ObjectStore, file_digest
+
+
+class TcPackagesStoreFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+        self.store = ObjectStore(os.path.join(self.folder.name, ".objects"))
+
+    def _tree(self, name: str, files: dict[str, bytes]) -> str:
+        folder = os.path.join(self.folder.name, name)
+        for rel, data in files.items():
+            path = os.path.join(folder, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+        return folder
+
+    def _objects(self) -> int:
+        return sum(len(files) for _, _, files in os.walk(self.store.root))
+
+    def test_share(self):
+        v1 = self._tree("v1", {"a.c": b"a" * 100, "b.c": b"b" * 10, "e": b""})
+        v2 = self._tree(
+            "v2", {"a.c": b"a" * 100, "b.c": b"c" * 10, "d/a.h": b"a" * 100}
+        )
+
+        self.assertEqual(self.store.add_tree(v1), (0, 0))
+        # a.c is stored by v1, d/a.h has the same content
+        self.assertEqual(self.store.add_tree(v2), (2, 200))
+        self.assertEqual(self.store.add_tree(v2), (0, 0))
+        self.assertEqual(self._objects(), 3)
+
+        a1 = os.stat(os.path.join(v1, "a.c"))
+        a2 = os.stat(os.path.join(v2, "d", "a.h"))
+        self.assertEqual(a1.st_ino, a2.st_ino)
+        self.assertEqual(a1.st_nlink, 4)
+        obj = self.store.object_path(file_digest(os.path.join(v1, "a.c")))
+        self.assertTrue(os.path.samefile(obj, os.path.join(v2, "a.c")))
+        with open(os.path.join(v2, "b.c"), "rb") as f:
+            self.assertEqual(f.read(), b"c" * 10)
+
+    @unittest.skipIf(os.name == "nt", "no executable bit")
+    def test_executable(self):
+        v1 = self._tree("v1", {"run": b"#!/bin/sh\n", "data": b"#!/bin/sh\n"})
+        os.chmod(os.path.join(v1, "run"), 0o755)
+        self.assertEqual(self.store.add_tree(v1), (0, 0))
+        self.assertEqual(self._objects(), 2)
+        self.assertFalse(os.stat(os.path.join(v1, "data")).st_mode & 0o111)
+
+    def test_collect(self):
+        v1 = self._tree("v1", {"a.c": b"a" * 100, "b.c": b"b" * 10})
+        v2 = self._tree("v2", {"a.c": b"a" * 100, "c.c": b"c" * 10})
+        self.store.add_tree(v1)
+        self.store.add_tree(v2)
+        self.assertEqual(self.store.collect(), (0, 0))
+
+        os.remove(os.path.join(v1, "a.c"))
+        os.remove(os.path.join(v1, "b.c"))
+        # b.c was only in v1, a.c is still linked by v2
+        self.assertEqual(self.store.collect(), (1, 10))
+        self.assertEqual(self._objects(), 2)
+
+        os.remove(os.path.join(v2, "a.c"))
+        os.remove(os.path.join(v2, "c.c"))
+        self.assertEqual(self.store.collect(), (2, 110))
+
+    def tearDown(self):
+        self.folder.cleanup()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import gzip
+import json
+import unittest
+
+import proto.sio_package_list_pb2 as sio_package_list_pb2
+from flask import Flask
+from google.protobuf.json_format import MessageToDict
+from utils.content import COMPRESS_THRESHOLD, ContentUtils
+
+
+def _make_app(data: dict) -> Flask:
+    app = Flask("tc_content")
+
+    @app.route("/list")
+    def route_list():
+        return ContentUtils.respond(
+            data,
+            lambda: sio_package_list_pb2.SioPackageListResponse(
+                success=True, packages=data
+            ),
+        )
+
+    app.after_request(ContentUtils.compress)
+    return app
+
+
+class TcUtilsContentFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.small = {"hal": {"a": {"1.0.0": "/a"}}}
+        self.large = {
+            "hal": {f"p{i}": {"1.0.0": f"/packages/p{i}"} for i in range(200)}
+        }
+
+    def test_json(self):
+        client = _make_app(self.small).test_client()
+        for accept in (None, "*/*", "application/json"):
+            headers = {"Accept": accept} if accept else {}
+            response = client.get("/list", headers=headers)
+            self.assertEqual(response.mimetype, "application/json")
+            self.assertDictEqual(response.get_json(), self.small)
+
+    def test_protobuf(self):
+        client = _make_app(self.small).test_client()
+        response = client.get(
+            "/list", headers={"Accept": "application/x-protobuf, */*;q=0.1"}
+        )
+        self.assertEqual(response.mimetype, "application/x-protobuf")
+        msg = sio_package_list_pb2.SioPackageListResponse()
+        msg.ParseFromString(response.data)
+        self.assertTrue(msg.success)
+        self.assertDictEqual(MessageToDict(msg.packages), self.small)
+        self.assertIn("Accept", response.headers["Vary"])
+
+    def test_not_acceptable(self):
+        client = _make_app(self.small).test_client()
+        response = client.get("/list", headers={"Accept": "text/csv"})
+        self.assertEqual(response.status_code, 406)
+
+    def test_compress(self):
+        client = _make_app(self.large).test_client()
+        response = client.get("/list", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertDictEqual(json.loads(gzip.decompress(response.data)), self.large)
+
+        response = client.get("/list", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_threshold(self):
+        client = _make_app(self.small).test_client()
+        response = client.get("/list", headers={"Accept-Encoding": "gzip"})
+        self.assertLess(len(response.data), COMPRESS_THRESHOLD)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+
+    def tearDown(self):
+        pass
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.daemon import DaemonClient
+from utils.net import NetUtils
+
+
+class _InfoHandler(BaseHTTPRequestHandler):
+    info: dict = {}
+
+    def do_GET(self):
+        body = json.dumps(self.info).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TcUtilsDaemonFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_no_daemon(self):
+        port = NetUtils.find_local_available_port(56432)
+        self.assertIsNone(DaemonClient.connect(port))
+
+    def test_other_daemon(self):
+        # a daemon of another version must not be used
+        _InfoHandler.info = {"version": "0.0.0"}
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _InfoHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self.assertIsNone(DaemonClient.connect(server.server_address[1]))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def tearDown(self):
+        pass
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import difflib
+import random
+import unittest
+
+from utils.diff import DiffUtils
+
+
+def _lcs(a: list[str], b: list[str]) -> int:
+    row = [0] * (len(b) + 1)
+    for i in range(len(a) - 1, -1, -1):
+        prev = [0] * (len(b) + 1)
+        for j in range(len(b) - 1, -1, -1):
+            if a[i] == b[j]:
+                prev[j] = row[j + 1] + 1
+            else:
+                prev[j] = max(row[j], prev[j + 1])
+        row = prev
+    return row[0]
+
+
+class TcUtilsDiffFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_equal(self):
+        lines = ["a\n", "b\n"]
+        self.assertEqual(DiffUtils.unified_text(lines, list(lines), "f", "f"), "")
+        self.assertListEqual(DiffUtils.hunks(lines, list(lines)), [])
+
+    def test_minimal(self):
+        rand = random.Random(0)
+        for _ in range(500):
+            a = [rand.choice("abcd") for _ in range(rand.randint(0, 25))]
+            b = [rand.choice("abcd") for _ in range(rand.randint(0, 25))]
+            codes = DiffUtils.opcodes(a, b)
+
+            result = []
+            for tag, i1, i2, j1, j2 in codes:
+                if tag == "equal":
+                    self.assertListEqual(a[i1:i2], b[j1:j2])
+                result.extend(b[j1:j2])
+            self.assertListEqual(result, b)
+
+            equal = sum(i2 - i1 for tag, i1, i2, _, _ in codes if tag == "equal")
+            self.assertEqual(equal, _lcs(a, b))
+
+    def test_unified(self):
+        a = [f"line {i}\n" for i in range(200)]
+        b = list(a)
+        b[50] = "changed\n"
+        del b[120]
+        b.insert(180, "new\n")
+
+        expected = "".join(difflib.unified_diff(a, b, "f", "f", lineterm=""))
+        self.assertEqual(DiffUtils.unified_text(a, b, "f", "f"), expected)
+
+    def test_hunks(self):
+        a = ["a\n", "b\n", "c\n"]
+        b = ["a\n", "x\n", "c\n"]
+        hunks = DiffUtils.hunks(a, b, 1)
+        self.assertEqual(len(hunks), 1)
+        hunk = hunks[0]
+        self.assertEqual(
+            (hunk.old_start, hunk.old_count, hunk.new_start, hunk.new_count),
+            (1, 3, 1, 3),
+        )
+        self.assertListEqual(hunk.lines, [" a\n", "-b\n", "+x\n", " c\n"])
+
+    def tearDown(self):
+        pass
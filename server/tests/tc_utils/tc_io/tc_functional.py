@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import tempfile
+import unittest
+
+from utils.io import IoUtils, YamlCache
+
+
+class TcUtilsIoFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.folder.name, "doc.yml")
+        self.cache = YamlCache(os.path.join(self.folder.name, "cache"))
+
+    def _write(self, text: str, mtime_ns: int):
+        with open(self.file, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.utime(self.file, ns=(mtime_ns, mtime_ns))
+
+    def test_read_yaml(self):
+        self._write("a: 1\nb: [x, 0x10, yes]\n# comment\n", 10**18)
+        data = IoUtils.read_yaml(self.file)
+        self.assertIs(type(data), dict)
+        self.assertDictEqual(data, {"a": 1, "b": ["x", 16, "yes"]})
+
+    def test_cache(self):
+        self._write("a: 1\n", 10**18)
+        st = os.stat(self.file)
+        self.assertEqual(self.cache.get(self.file, st), (False, None))
+        self.cache.put(self.file, st, {"a": 1})
+        self.assertEqual(self.cache.get(self.file, st), (True, {"a": 1}))
+
+        # same size, other mtime
+        self._write("a: 2\n", 2 * 10**18)
+        self.assertEqual(self.cache.get(self.file, os.stat(self.file)), (False, None))
+
+    def test_prune(self):
+        self.cache.LIMIT = 4096
+        for i in range(20):
+            file = os.path.join(self.folder.name, f"doc{i}.yml")
+            with open(file, "w", encoding="utf-8") as f:
+                f.write("a: 1\n")
+            self.cache.put(file, os.stat(file), "x" * 1024)
+        size = sum(entry.stat().st_size for entry in os.scandir(self.cache.folder()))
+        self.assertLessEqual(size, self.cache.LIMIT)
+
+    def tearDown(self):
+        self.folder.cleanup()
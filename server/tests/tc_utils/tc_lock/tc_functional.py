@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import gevent
+from utils.lock import FileLock, LockManager
+
+from utils import lock
+
+
+class TcUtilsLockFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.home = tempfile.TemporaryDirectory()
+        # the interprocess lock files are under ~/.csp/cache
+        self.patch = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.patch.start()
+        self.manager = LockManager("test", interprocess=True)
+        self.key = LockManager.key(self.home.name)
+
+    def _lock_again(self):
+        with gevent.Timeout(2):
+            with self.manager.lock(self.key):
+                pass
+        self.assertDictEqual(self.manager.stats()["held"], {})
+
+    def test_killed(self):
+        # another process holds the file lock
+        holder = FileLock(self.manager._lock_file(self.key))
+        holder.acquire()
+
+        def work():
+            with self.manager.lock(self.key):
+                pass
+
+        waiter = gevent.spawn(work)
+        gevent.sleep(0.1)
+        waiter.kill()
+        holder.release()
+        self._lock_again()
+
+    def test_failed(self):
+        with mock.patch.object(FileLock, "acquire", side_effect=OSError("denied")):
+            with self.assertRaises(OSError):
+                with self.manager.lock(self.key):
+                    pass
+        self._lock_again()
+
+    def test_file_lock_closed(self):
+        file_lock = FileLock(os.path.join(self.home.name, "a.lock"))
+        with (
+            mock.patch.object(lock, "_try_lock", side_effect=KeyboardInterrupt),
+            mock.patch.object(lock.os, "close", wraps=os.close) as close,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                file_lock.acquire()
+        close.assert_called_once()
+        # nothing to release
+        file_lock.release()
+
+    def tearDown(self):
+        self.patch.stop()
+        self.home.cleanup()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import unittest
+
+from utils.metrics import MetricsRegistry
+
+
+class TcUtilsMetricsFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("t_total", "Test.", ("kind",))
+        histogram = registry.histogram("t_seconds", "Test.", buckets=(0.1, 1.0))
+        counter.inc(kind='a"b')
+        counter.inc(2, kind='a"b')
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        self.assertListEqual(
+            registry.render().splitlines(),
+            [
+                "# HELP t_total Test.",
+                "# TYPE t_total counter",
+                't_total{kind="a\\"b"} 3',
+                "# HELP t_seconds Test.",
+                "# TYPE t_seconds histogram",
+                't_seconds_bucket{le="0.1"} 1',
+                't_seconds_bucket{le="1"} 2',
+                't_seconds_bucket{le="+Inf"} 3',
+                "t_seconds_sum 3.6",
+                "t_seconds_count 3",
+            ],
+        )
+
+    def test_merge(self):
+        worker = MetricsRegistry()
+        server = MetricsRegistry()
+        for registry in (worker, server):
+            registry.counter("t_total", "Test.")
+            registry.histogram("t_seconds", "Test.", ("phase",))
+
+        worker.counter("t_total", "Test.").inc(5)
+        worker.histogram("t_seconds", "Test.", ("phase",)).observe(1, phase="x")
+        server.merge(worker.drain())
+        server.merge(worker.drain())
+
+        self.assertEqual(server.counter("t_total", "Test.").value(), 5)
+        self.assertEqual(
+            server.histogram("t_seconds", "Test.", ("phase",)).count(phase="x"), 1
+        )
+        self.assertEqual(worker.counter("t_total", "Test.").value(), 0)
+
+    def tearDown(self):
+        pass
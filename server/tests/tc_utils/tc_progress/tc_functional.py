@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import unittest
+
+from blinker import Signal
+from utils.progress import ProgressBatch, ProgressEmitter
+
+
+class TcUtilsProgressFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.signal = Signal()
+        self.batches: list[ProgressBatch] = []
+
+    def _send(self, count: int):
+        for index in range(1, count + 1):
+            self.signal.send("test", count=count, index=index, file=f"f{index}")
+
+    def test_coalesce(self):
+        emitter = ProgressEmitter(self.batches.append, interval=3600)
+        with emitter.connected_to(self.signal):
+            self._send(1000)
+
+        self.assertEqual(len(self.batches), 2)
+        first, last = self.batches
+        self.assertEqual((first.index, first.files), (1, ["f1"]))
+        self.assertEqual((last.index, last.count, len(last.files)), (1000, 1000, 999))
+        self.assertEqual(last.file, "f1000")
+        self.assertTrue(last.done)
+
+    def test_no_interval(self):
+        emitter = ProgressEmitter(self.batches.append, interval=0)
+        with emitter.connected_to(self.signal):
+            self._send(5)
+        self.assertListEqual([batch.index for batch in self.batches], [1, 2, 3, 4, 5])
+
+    def test_flush_pending(self):
+        emitter = ProgressEmitter(self.batches.append, interval=3600)
+        with emitter.connected_to(self.signal):
+            for index in range(1, 4):
+                self.signal.send("test", count=10, index=index, file=f"f{index}")
+        # disconnected early, the pending files are still delivered
+        self.assertListEqual(
+            [batch.files for batch in self.batches], [["f1"], ["f2", "f3"]]
+        )
+        self.signal.send("test", count=10, index=4, file="f4")
+        self.assertEqual(len(self.batches), 2)
+
+    def tearDown(self):
+        pass
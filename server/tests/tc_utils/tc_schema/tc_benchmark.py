@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_benchmark.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import time
+import unittest
+
+import jsonschema
+from ruamel.yaml import YAML
+from utils.schema import SchemaRegistry
+from utils.summary import SummaryUtils
+from utils.sys import SysUtils
+
+RUNS = 20
+
+
+def _validate_uncached(path: str, instance: dict):
+    # what every check did before the registry
+    with open(path, "r", encoding="utf-8") as f:
+        yaml = YAML()
+        schema = yaml.load(f.read())
+        jsonschema.validate(instance=instance, schema=schema)
+
+
+class TcUtilsSchemaBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        with open(
+            SummaryUtils.summary_file("StarPower", "SP28038"), "r", encoding="utf-8"
+        ) as f:
+            self.summary = YAML().load(f.read())
+        self.registry = SchemaRegistry()
+
+    def _per_call(self, validate) -> float:
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            validate()
+        return (time.perf_counter() - start) / RUNS
+
+    def test_summary(self):
+        path = os.path.join(SysUtils.database_folder(), "schema", "summary.yml")
+        self.registry.validate("summary", self.summary)
+
+        before = self._per_call(lambda: _validate_uncached(path, self.summary))
+        after = self._per_call(lambda: self.registry.validate("summary", self.summary))
+        print(
+            f"\nsummary validation: {before * 1000:.2f} ms -> {after * 1000:.2f} ms per call"
+        )
+        self.assertLess(after, before)
+
+    def tearDown(self):
+        pass
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        tc_functional.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import os
+import tempfile
+import unittest
+
+import jsonschema
+from utils.schema import SchemaRegistry
+
+SCHEMA = """\
+$schema: "http://json-schema.org/draft-07/schema#"
+type: object
+properties:
+  name:
+    type: string
+  gen:
+    type: object
+    required: [hal]
+required:
+  - name
+"""
+
+
+class TcUtilsSchemaFunctional(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.folder.name, "test.yml")
+        with open(self.file, "w", encoding="utf-8") as f:
+            f.write(SCHEMA)
+        self.registry = SchemaRegistry(self.folder.name)
+
+    def test_validate(self):
+        self.registry.validate("test", {"name": "a"})
+        with self.assertRaises(jsonschema.ValidationError):
+            self.registry.validate("test", {"name": 1})
+        with self.assertRaises(jsonschema.ValidationError):
+            self.registry.validate("test", {})
+
+    def test_validate_keys(self):
+        # only the given keys are looked at
+        self.registry.validate_keys("test", {"name": 1, "gen": {"hal": "a"}}, ["gen"])
+        self.registry.validate_keys("test", {"name": "a", "other": 1}, ["other"])
+        with self.assertRaises(jsonschema.ValidationError) as cm:
+            self.registry.validate_keys("test", {"name": "a", "gen": {}}, ["gen"])
+        self.assertEqual(list(cm.exception.path), ["gen"])
+        with self.assertRaises(jsonschema.ValidationError):
+            self.registry.validate_keys("test", {"gen": {"hal": "a"}}, ["name"])
+
+    def test_cached(self):
+        validator = self.registry.validator("test")
+        self.assertIsInstance(validator, jsonschema.Draft7Validator)
+        self.assertIs(self.registry.validator("test"), validator)
+
+    def test_reload(self):
+        validator = self.registry.validator("test")
+        with open(self.file, "w", encoding="utf-8") as f:
+            f.write(SCHEMA.replace("type: string", "type: integer"))
+        st = os.stat(self.file)
+        # make sure the change is seen on file systems with a coarse mtime
+        os.utime(self.file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertIsNot(self.registry.validator("test"), validator)
+        self.registry.validate("test", {"name": 1})
+        with self.assertRaises(jsonschema.ValidationError):
+            self.registry.validate("test", {"name": "a"})
+
+    def tearDown(self):
+        self.folder.cleanup()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        content.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import gzip
+from typing import Any, Callable
+
+from flask import Response, abort, jsonify, request
+from google.protobuf.message import Message
+
+try:
+    import msgpack
+except ImportError:  # optional, msgpack is then not offered
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # optional, gzip only
+    zstandard = None
+
+MEDIA_JSON = "application/json"
+MEDIA_PROTOBUF = "application/x-protobuf"
+MEDIA_MSGPACK = "application/msgpack"
+MEDIA_MSGPACK_LEGACY = "application/x-msgpack"
+
+# below this many bytes compression costs more than it saves
+COMPRESS_THRESHOLD = 1024
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+COMPRESSIBLE = (MEDIA_JSON, MEDIA_PROTOBUF, MEDIA_MSGPACK, MEDIA_MSGPACK_LEGACY)
+
+
+class ContentUtils:
+    """
+    Content negotiation of the REST API.
+
+    ``respond`` encodes a result as JSON (the default), protobuf or msgpack
+    according to the ``Accept`` header. ``compress`` then gzip or zstd
+    encodes any large enough response according to ``Accept-Encoding``.
+    """
+
+    @staticmethod
+    def media_types() -> list[str]:
+        types = [MEDIA_JSON, MEDIA_PROTOBUF]
+        if msgpack is not None:
+            types += [MEDIA_MSGPACK, MEDIA_MSGPACK_LEGACY]
+        return types
+
+    @staticmethod
+    def encodings() -> list[str]:
+        if zstandard is not None:
+            return ["zstd", "gzip"]
+        return ["gzip"]
+
+    @staticmethod
+    def respond(data: Any, message: Callable[[], Message]) -> Response:
+        """
+        Encode ``data`` as the client asks, ``message`` builds its protobuf form.
+
+        Answers 406 when none of the supported types is acceptable.
+        """
+        accept = request.accept_mimetypes
+        media = accept.best_match(ContentUtils.media_types()) if accept else MEDIA_JSON
+        if media is None:
+            abort(
+                406, description=f"Supported: {', '.join(ContentUtils.media_types())}"
+            )
+
+        if media == MEDIA_PROTOBUF:
+            response = Response(message().SerializeToString(), mimetype=media)
+        elif media in (MEDIA_MSGPACK, MEDIA_MSGPACK_LEGACY):
+            response = Response(msgpack.packb(data, use_bin_type=True), mimetype=media)
+        else:
+            response = jsonify(data)
+        response.vary.add("Accept")
+        return response
+
+    @staticmethod
+    def compress(response: Response) -> Response:
+        if (
+            response.direct_passthrough
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        mimetype = response.mimetype or ""
+        if mimetype not in COMPRESSIBLE and not mimetype.startswith("text/"):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        data = response.get_data()
+        if len(data) < COMPRESS_THRESHOLD:
+            return response
+
+        encoding = request.accept_encodings.best_match(ContentUtils.encodings())
+        if encoding == "zstd":
+            data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        elif encoding == "gzip":
+            data = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+        else:
+            return response
+
+        response.set_data(data)
+        response.headers["Content-Encoding"] = encoding
+        return response
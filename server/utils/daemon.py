@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        daemon.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       show the install progress in bytes
+# 2026-10-18     xqyjlj       show the bytes an upgrade saved
+#
+
+import json
+import os
+import queue
+import time
+from typing import Callable
+
+from loguru import logger
+
+from .net import NetUtils
+from .sys import SysUtils
+
+DEFAULT_PORT = 55432
+
+
+class DaemonClient:
+    """
+    Forwards cli commands to a ``serve`` daemon already running on this host.
+
+    The daemon keeps the loaded packages, schemas and generators warm, so a
+    ``gen`` run through it skips the cold start. The same socket events and
+    protobuf messages as the application are used, progress is streamed back
+    and printed as the in-process command would. ``connect`` returns ``None``
+    when there is no daemon, or one of another version or ``HOME``, the
+    caller then runs the command itself.
+    """
+
+    CONNECT_TIMEOUT = 1.0
+    # events are handled on their own threads, a progress may trail the result
+    PROGRESS_GRACE = 0.5
+
+    def __init__(self, sio):
+        self._sio = sio
+        self._events: queue.Queue = queue.Queue()
+
+    @staticmethod
+    def connect(port: int) -> "DaemonClient | None":
+        if not NetUtils.check_local_port_used(port):
+            return None
+
+        # imported here, only needed when a daemon is running
+        import urllib.request
+
+        import socketio
+
+        url = f"http://127.0.0.1:{port}"
+        try:
+            with urllib.request.urlopen(
+                f"{url}/api/server/info", timeout=DaemonClient.CONNECT_TIMEOUT
+            ) as response:
+                info = json.loads(response.read())
+        except (OSError, ValueError) as e:
+            logger.trace(f"no csp daemon on port {port}: {e}")
+            return None
+
+        expected = {
+            "version": SysUtils.version(),
+            "packages": SysUtils.packages_folder(),
+            "database": SysUtils.database_folder(),
+        }
+        if not isinstance(info, dict) or any(
+            info.get(key) != value for key, value in expected.items()
+        ):
+            logger.trace(f"ignore csp daemon on port {port}: {info!r}")
+            return None
+
+        sio = socketio.Client(reconnection=False)
+        try:
+            # websocket-client is not a dependency, the messages are small
+            sio.connect(
+                url,
+                transports=["polling"],
+                wait_timeout=DaemonClient.CONNECT_TIMEOUT,
+            )
+        except Exception as e:
+            logger.trace(f"failed to connect to csp daemon on port {port}: {e}")
+            return None
+        logger.trace(f"using csp daemon on port {port}")
+        return DaemonClient(sio)
+
+    def close(self):
+        self._sio.disconnect()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def request(
+        self,
+        event: str,
+        data: bytes | None,
+        result_event: str,
+        progress_event: str = "",
+        on_progress: Callable[[bytes], bool] | None = None,
+    ) -> bytes | None:
+        """
+        Emit ``event`` and wait for its result, ``None`` if the daemon is gone.
+
+        ``on_progress`` gets every progress and returns whether it was the
+        last one, which is waited for a moment after the result.
+        """
+        for name in (result_event, progress_event, "job/status"):
+            if name:
+                self._sio.on(name, self._handler(name))
+
+        if data is None:
+            self._sio.emit(event)
+        else:
+            self._sio.emit(event, data)
+
+        result = None
+        done = on_progress is None
+        deadline = None
+        while result is None or not done:
+            try:
+                name, payload = self._events.get(timeout=0.1)
+            except queue.Empty:
+                if not self._sio.connected:
+                    logger.error("lost the connection to the csp daemon")
+                    return None
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+                continue
+
+            if name == result_event:
+                result = payload
+                deadline = time.monotonic() + self.PROGRESS_GRACE
+            elif name == progress_event and on_progress is not None:
+                done = on_progress(payload) or done
+            elif name == "job/status":
+                self._log_status(payload)
+        return result
+
+    def _handler(self, name: str) -> Callable:
+        def handler(data=None):
+            self._events.put((name, data))
+
+        return handler
+
+    @staticmethod
+    def _log_status(data: bytes):
+        import proto.sio_job_pb2 as sio_job_pb2
+
+        status = sio_job_pb2.SioJobStatus()
+        status.ParseFromString(data)
+        state = sio_job_pb2.SioJobState.Name(status.state)
+        logger.trace(f"daemon job {status.id} {status.kind}: {state}")
+
+    def coder_generate(
+        self,
+        path: str,
+        output: str | None,
+        progress: bool,
+        files: list[str],
+        jobs: int,
+    ) -> bool:
+        import proto.sio_coder_generate_pb2 as sio_coder_generate_pb2
+
+        display = _ProgressDisplay("generate", progress)
+
+        def on_progress(data: bytes) -> bool:
+            msg = sio_coder_generate_pb2.SioCoderGenerateProgress()
+            msg.ParseFromString(data)
+            if not progress:
+                first = msg.index - len(msg.files) + 1
+                items = zip(msg.files, msg.writes)
+                for index, (file, write) in enumerate(items, first):
+                    if write:
+                        print(
+                            f"[{index}/{msg.count}] generate {file!r}, because the file or config has been modified."
+                        )
+                    else:
+                        print(
+                            f"[{index}/{msg.count}] skip {file!r}, because the file or config has not been modified."
+                        )
+            display.update(msg.count, msg.index, os.path.basename(msg.file))
+            return msg.index >= msg.count
+
+        request = sio_coder_generate_pb2.SioCoderGenerateRequest(
+            path=os.path.abspath(path),
+            output=os.path.abspath(output) if output else "",
+            files=files,
+            jobs=jobs,
+        )
+        data = self.request(
+            "sio/coder/generate",
+            request.SerializeToString(),
+            "coder/generate.result",
+            "coder/generate.progress",
+            on_progress,
+        )
+        display.close()
+        if data is None:
+            return False
+
+        response = sio_coder_generate_pb2.SioCoderGenerateResponse()
+        response.ParseFromString(data)
+        if not response.success:
+            logger.error(response.error)
+        return response.success
+
+    def package_install(self, path: str, progress: bool, verbose: bool) -> bool:
+        import proto.sio_package_install_pb2 as sio_package_install_pb2
+
+        display = _ProgressDisplay("install", progress, "B")
+
+        def on_progress(data: bytes) -> bool:
+            msg = sio_package_install_pb2.SioPackageInstallProgress()
+            msg.ParseFromString(data)
+            if verbose:
+                first = msg.index - len(msg.files) + 1
+                for index, file in enumerate(msg.files, first):
+                    print(f"[{index}/{msg.count or '?'}] install {file}")
+            display.update(msg.total, msg.size, msg.file, msg.saved)
+            # the count of a streamed archive is only known at the end
+            return msg.count > 0 and msg.index >= msg.count
+
+        request = sio_package_install_pb2.SioPackageInstallRequest(
+            path=os.path.abspath(path)
+        )
+        data = self.request(
+            "sio/package/install",
+            request.SerializeToString(),
+            "package/install.result",
+            "package/install.progress",
+            on_progress,
+        )
+        display.close()
+        if data is None:
+            return False
+
+        response = sio_package_install_pb2.SioPackageInstallResponse()
+        response.ParseFromString(data)
+        if not response.success:
+            logger.error(response.error)
+            logger.error(f"Failed to install {path}")
+            return False
+        description = response.description
+        logger.success(
+            f"Successfully installed {description.name}-{description.version}"
+        )
+        return True
+
+    def package_list(self, dump: str) -> bool:
+        import proto.sio_package_list_pb2 as sio_package_list_pb2
+        from google.protobuf.json_format import MessageToDict
+
+        data = self.request("sio/package/list", None, "package/list.result")
+        if data is None:
+            return False
+
+        response = sio_package_list_pb2.SioPackageListResponse()
+        response.ParseFromString(data)
+        if not response.success:
+            logger.error(response.error)
+            return False
+        index = MessageToDict(response.packages)
+        if dump == "json":
+            print(json.dumps(index, indent=2, ensure_ascii=False))
+        else:
+            for kind, package in index.items():
+                print(f"{kind}:")
+                for name, info in package.items():
+                    print(f"  {name}:")
+                    for version, path in info.items():
+                        print(f"    {version}: {path}")
+        return True
+
+    def tools_check_ip(self, path: str, vendor: str, name: str, ip_type: str) -> bool:
+        import proto.sio_tools_check_ip_pb2 as sio_tools_check_ip_pb2
+        from actions.tools_check_ip import print_check_results
+
+        request = sio_tools_check_ip_pb2.SioToolsCheckIpRequest(
+            path=os.path.abspath(path) if path else "",
+            vendor=vendor or "",
+            name=name or "",
+            type=ip_type or "",
+        )
+        data = self.request(
+            "sio/tools/check-ip", request.SerializeToString(), "tools/check-ip.result"
+        )
+        if data is None:
+            return False
+
+        response = sio_tools_check_ip_pb2.SioToolsCheckIpResponse()
+        response.ParseFromString(data)
+        if not response.success:
+            logger.error(response.error)
+            return False
+        print_check_results(list(response.errors), list(response.warnings))
+        return response.valid
+
+
+class _ProgressDisplay:
+    """The ``--progress`` bar of a forwarded command."""
+
+    def __init__(self, desc: str, enabled: bool, unit: str = "file"):
+        self._desc = desc
+        self._enabled = enabled
+        self._unit = unit
+        self._bar = None
+
+    def update(self, count: int, index: int, file: str, saved: int = 0):
+        if not self._enabled:
+            return
+        if self._bar is None:
+            from tqdm import tqdm
+
+            self._bar = tqdm(
+                total=count,
+                desc=self._desc,
+                unit=self._unit,
+                unit_scale=self._unit == "B",
+            )
+        self._bar.set_description(f"{self._desc} {file}")
+        self._bar.n = index
+        if saved:
+            saved_size = self._bar.format_sizeof(saved)
+            self._bar.set_postfix_str(f"saved {saved_size}B", refresh=False)
+        self._bar.refresh()
+        if index >= count:
+            self.close()
+
+    def close(self):
+        if self._bar is not None:
+            self._bar.set_description(self._desc)
+            self._bar.close()
+            self._bar = None
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        diff.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator
+
+Opcode = tuple[str, int, int, int, int]
+
+
+@dataclass
+class DiffHunk:
+    """One hunk of a unified diff, ``lines`` keep their `` ``/``-``/``+`` prefix."""
+
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    lines: list[str] = field(default_factory=list)
+
+
+class DiffUtils:
+    """
+    Line diff of generated files.
+
+    Equal texts are short-circuited before anything else. Otherwise the
+    common head and tail are stripped, the lines are interned to integers and
+    the rest is compared with the linear space variant of Myers' O(ND)
+    algorithm. Opcodes, grouping and unified output follow ``difflib``.
+    """
+
+    # below this number of lines to compare, a process pool costs more than it saves
+    PARALLEL_THRESHOLD = 20000
+
+    @staticmethod
+    def opcodes(a: list[str], b: list[str]) -> list[Opcode]:
+        if a == b:
+            return [("equal", 0, len(a), 0, len(b))] if a else []
+
+        ids: dict[str, int] = {}
+        ia = [ids.setdefault(line, len(ids)) for line in a]
+        ib = [ids.setdefault(line, len(ids)) for line in b]
+
+        codes = []
+        i = j = 0
+        for mi, mj, size in DiffUtils._matching_blocks(ia, ib):
+            if i < mi and j < mj:
+                codes.append(("replace", i, mi, j, mj))
+            elif i < mi:
+                codes.append(("delete", i, mi, j, mj))
+            elif j < mj:
+                codes.append(("insert", i, mi, j, mj))
+            if size:
+                codes.append(("equal", mi, mi + size, mj, mj + size))
+            i, j = mi + size, mj + size
+        return codes
+
+    @staticmethod
+    def grouped_opcodes(codes: list[Opcode], n: int = 3) -> Iterator[list[Opcode]]:
+        """Split opcodes into hunks with ``n`` lines of context, as ``difflib``."""
+        codes = list(codes)
+        if not codes:
+            codes = [("equal", 0, 1, 0, 1)]
+        if codes[0][0] == "equal":
+            tag, i1, i2, j1, j2 = codes[0]
+            codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+        if codes[-1][0] == "equal":
+            tag, i1, i2, j1, j2 = codes[-1]
+            codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+        nn = n + n
+        group = []
+        for tag, i1, i2, j1, j2 in codes:
+            if tag == "equal" and i2 - i1 > nn:
+                group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+                yield group
+                group = []
+                i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+            group.append((tag, i1, i2, j1, j2))
+        if group and not (len(group) == 1 and group[0][0] == "equal"):
+            yield group
+
+    @staticmethod
+    def hunks(a: list[str], b: list[str], n: int = 3) -> list[DiffHunk]:
+        result = []
+        for group in DiffUtils.grouped_opcodes(DiffUtils.opcodes(a, b), n):
+            first, last = group[0], group[-1]
+            hunk = DiffHunk(
+                old_start=first[1] + 1,
+                old_count=last[2] - first[1],
+                new_start=first[3] + 1,
+                new_count=last[4] - first[3],
+            )
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    hunk.lines.extend(f" {line}" for line in a[i1:i2])
+                    continue
+                if tag in ("replace", "delete"):
+                    hunk.lines.extend(f"-{line}" for line in a[i1:i2])
+                if tag in ("replace", "insert"):
+                    hunk.lines.extend(f"+{line}" for line in b[j1:j2])
+            result.append(hunk)
+        return result
+
+    @staticmethod
+    def unified(
+        a: list[str],
+        b: list[str],
+        fromfile: str = "",
+        tofile: str = "",
+        n: int = 3,
+        lineterm: str = "\n",
+    ) -> Iterator[str]:
+        """Same output as ``difflib.unified_diff`` without dates."""
+        for index, hunk in enumerate(DiffUtils.hunks(a, b, n)):
+            if index == 0:
+                yield f"--- {fromfile}{lineterm}"
+                yield f"+++ {tofile}{lineterm}"
+            old = DiffUtils._format_range(hunk.old_start, hunk.old_count)
+            new = DiffUtils._format_range(hunk.new_start, hunk.new_count)
+            yield f"@@ -{old} +{new} @@{lineterm}"
+            yield from hunk.lines
+
+    @staticmethod
+    def unified_text(
+        a: list[str], b: list[str], fromfile: str = "", tofile: str = ""
+    ) -> str:
+        if a == b:
+            return ""
+        return "".join(DiffUtils.unified(a, b, fromfile, tofile, lineterm=""))
+
+    @staticmethod
+    def unified_many(
+        items: list[tuple[str, list[str], list[str]]], jobs: int | None = None
+    ) -> dict[str, str]:
+        """
+        Diff ``(name, old lines, new lines)`` items, equal ones cost a comparison.
+
+        Large batches are spread over ``jobs`` processes, all cores by default.
+        """
+        result = {}
+        pending = []
+        for name, a, b in items:
+            if a == b:
+                result[name] = ""
+            else:
+                pending.append((name, a, b))
+
+        jobs = jobs or os.cpu_count() or 1
+        lines = sum(len(a) + len(b) for _, a, b in pending)
+        if jobs > 1 and len(pending) > 1 and lines >= DiffUtils.PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(pending)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                for name, text in executor.map(_unified_worker, pending):
+                    result[name] = text
+        else:
+            for item in pending:
+                name, text = _unified_worker(item)
+                result[name] = text
+        return result
+
+    @staticmethod
+    def _format_range(start: int, count: int) -> str:
+        if count == 1:
+            return f"{start}"
+        if not count:
+            start -= 1
+        return f"{start},{count}"
+
+    @staticmethod
+    def _matching_blocks(a: list[int], b: list[int]) -> list[tuple[int, int, int]]:
+        """
+        Return ``(i, j, size)`` blocks of equal lines, ending with a sentinel.
+        """
+        matches: list[tuple[int, int]] = []
+        stack = [(0, len(a), 0, len(b))]
+        while stack:
+            a0, a1, b0, b1 = stack.pop()
+            while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+                matches.append((a0, b0))
+                a0 += 1
+                b0 += 1
+            while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+                a1 -= 1
+                b1 -= 1
+                matches.append((a1, b1))
+            if a0 == a1 or b0 == b1:
+                continue
+
+            x, y = DiffUtils._bisect(a, a0, a1, b, b0, b1)
+            if (x, y) in ((a0, b0), (a1, b1)):
+                # no split point, the whole range is one replace
+                continue
+            stack.append((x, a1, y, b1))
+            stack.append((a0, x, b0, y))
+
+        matches.sort()
+        blocks = []
+        for i, j in matches:
+            if blocks:
+                bi, bj, size = blocks[-1]
+                if bi + size == i and bj + size == j:
+                    blocks[-1] = (bi, bj, size + 1)
+                    continue
+            blocks.append((i, j, 1))
+        blocks.append((len(a), len(b), 0))
+        return blocks
+
+    @staticmethod
+    def _bisect(
+        a: list[int], a0: int, a1: int, b: list[int], b0: int, b1: int
+    ) -> tuple[int, int]:
+        """
+        Find the middle snake of ``a[a0:a1]`` and ``b[b0:b1]``.
+
+        Forward and backward searches run in lockstep until they overlap, the
+        point where the forward path reached is returned as the split point.
+        """
+        n = a1 - a0
+        m = b1 - b0
+        max_d = (n + m + 1) // 2
+        offset = max_d
+        length = 2 * max_d + 2
+        v1 = [-1] * length
+        v2 = [-1] * length
+        v1[offset + 1] = 0
+        v2[offset + 1] = 0
+        delta = n - m
+        front = delta % 2 != 0
+        k1start = k1end = k2start = k2end = 0
+
+        for d in range(max_d):
+            for k1 in range(-d + k1start, d + 1 - k1end, 2):
+                k1_offset = offset + k1
+                if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                    x1 = v1[k1_offset + 1]
+                else:
+                    x1 = v1[k1_offset - 1] + 1
+                y1 = x1 - k1
+                while x1 < n and y1 < m and a[a0 + x1] == b[b0 + y1]:
+                    x1 += 1
+                    y1 += 1
+                v1[k1_offset] = x1
+                if x1 > n:
+                    k1end += 2
+                elif y1 > m:
+                    k1start += 2
+                elif front:
+                    k2_offset = offset + delta - k1
+                    if 0 <= k2_offset < length and v2[k2_offset] != -1:
+                        if x1 >= n - v2[k2_offset]:
+                            return a0 + x1, b0 + y1
+
+            for k2 in range(-d + k2start, d + 1 - k2end, 2):
+                k2_offset = offset + k2
+                if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                    x2 = v2[k2_offset + 1]
+                else:
+                    x2 = v2[k2_offset - 1] + 1
+                y2 = x2 - k2
+                while x2 < n and y2 < m and a[a1 - x2 - 1] == b[b1 - y2 - 1]:
+                    x2 += 1
+                    y2 += 1
+                v2[k2_offset] = x2
+                if x2 > n:
+                    k2end += 2
+                elif y2 > m:
+                    k2start += 2
+                elif not front:
+                    k1_offset = offset + delta - k2
+                    if 0 <= k1_offset < length and v1[k1_offset] != -1:
+                        x1 = v1[k1_offset]
+                        y1 = offset + x1 - k1_offset
+                        if x1 >= n - x2:
+                            return a0 + x1, b0 + y1
+
+        # no commonality at all
+        return a0, b0
+
+
+def _unified_worker(item: tuple[str, list[str], list[str]]) -> tuple[str, str]:
+    name, a, b = item
+    return name, DiffUtils.unified_text(a, b, name, name)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        import_profile.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+#
+
+import sys
+import time
+from dataclasses import dataclass
+from typing import TextIO
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    depth: int
+    cumulative: float = 0.0
+    own: float = 0.0
+
+
+class _TimedLoader:
+    """Wrap a loader to time ``exec_module``, everything else is delegated."""
+
+    def __init__(self, loader, profiler: "ImportProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        record = self._profiler.enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.leave(record)
+
+
+class ImportProfiler:
+    """
+    Time the modules imported after ``install``, like ``python -X importtime``.
+
+    It works on the meta path, so it also covers a Nuitka build where the
+    interpreter option does not apply. The time of a module includes its own
+    imports (``cumulative``), ``own`` excludes them.
+    """
+
+    def __init__(self):
+        self.records: list[ImportRecord] = []
+        self._stack: list[tuple[ImportRecord, float, float]] = []
+        self._finding = False
+        self._start = 0.0
+
+    def install(self):
+        if self in sys.meta_path:
+            return
+        self._start = time.perf_counter()
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def enter(self, name: str) -> ImportRecord:
+        record = ImportRecord(name, len(self._stack))
+        self.records.append(record)
+        self._stack.append((record, time.perf_counter(), 0.0))
+        return record
+
+    def leave(self, record: ImportRecord):
+        _, start, children = self._stack.pop()
+        record.cumulative = time.perf_counter() - start
+        record.own = record.cumulative - children
+        if self._stack:
+            parent, parent_start, parent_children = self._stack[-1]
+            self._stack[-1] = (
+                parent,
+                parent_start,
+                parent_children + record.cumulative,
+            )
+
+    def report(self, file: TextIO = sys.stderr, limit: int = 30):
+        total = sum(r.cumulative for r in self.records if r.depth == 0)
+        print(
+            f"imported {len(self.records)} modules in {total * 1000:.1f} ms, "
+            f"{(time.perf_counter() - self._start) * 1000:.1f} ms since start",
+            file=file,
+        )
+        print(f"{'cumulative':>12} {'own':>10}  module", file=file)
+        records = sorted(self.records, key=lambda r: r.cumulative, reverse=True)
+        for record in records[:limit]:
+            print(
+                f"{record.cumulative * 1000:10.1f}ms {record.own * 1000:8.1f}ms  "
+                f"{'  ' * record.depth}{record.name}",
+                file=file,
+            )
+
+
+IMPORT_PROFILER = ImportProfiler()
@@ -22,16 +22,124 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-10     xqyjlj       initial version
+# 2026-10-18     xqyjlj       load read-only yaml with the safe loader and a cache
+# 2026-10-18     xqyjlj       add write_text, replacing a file atomically
 #
 
 
 import hashlib
 import os
+import pickle
+import shutil
 from pathlib import Path
 from typing import Any
 
+from loguru import logger
 from ruamel.yaml import YAML
 
+from .metrics import CACHE_REQUESTS
+from .sys import SysUtils
+
+# set to 0 to always parse the yaml files
+YAML_CACHE_ENV = "CSP_YAML_CACHE"
+
+
+class YamlCache:
+    """
+    Parsed yaml documents pickled under ``~/.csp/cache/yaml``.
+
+    An entry is keyed by the absolute path and only used while the size and
+    the mtime of the file are unchanged. When the folder grows over
+    ``LIMIT`` bytes, the least recently written entries are removed.
+    """
+
+    VERSION = 1
+    LIMIT = 64 * 1024 * 1024
+
+    def __init__(self, folder: str | None = None):
+        self._folder = folder
+
+    def folder(self) -> str:
+        if self._folder is not None:
+            return self._folder
+        return os.path.join(SysUtils.cache_folder(), "yaml")
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get(YAML_CACHE_ENV, "1") != "0"
+
+    def _entry(self, file: str) -> str:
+        digest = hashlib.sha1(file.encode("utf-8")).hexdigest()
+        return os.path.join(self.folder(), f"{digest}.pickle")
+
+    def get(self, file: str, st: os.stat_result) -> tuple[bool, Any]:
+        try:
+            with open(self._entry(file), "rb") as f:
+                version, path, size, mtime, data = pickle.load(f)
+        except FileNotFoundError:
+            CACHE_REQUESTS.inc(cache="yaml", result="miss")
+            return False, None
+        except Exception as e:
+            logger.debug(f"ignore broken yaml cache of {file!r}: {e}")
+            CACHE_REQUESTS.inc(cache="yaml", result="miss")
+            return False, None
+
+        if (version, path, size, mtime) != (
+            self.VERSION,
+            file,
+            st.st_size,
+            st.st_mtime_ns,
+        ):
+            CACHE_REQUESTS.inc(cache="yaml", result="miss")
+            return False, None
+        CACHE_REQUESTS.inc(cache="yaml", result="hit")
+        return True, data
+
+    def put(self, file: str, st: os.stat_result, data: Any):
+        entry = self._entry(file)
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.folder(), exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(
+                    (self.VERSION, file, st.st_size, st.st_mtime_ns, data),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.debug(f"failed to cache {file!r}: {e}")
+            return
+        self._prune()
+
+    def _prune(self):
+        entries = []
+        total = 0
+        with os.scandir(self.folder()) as it:
+            for item in it:
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, item.path))
+                total += st.st_size
+        if total <= self.LIMIT:
+            return
+
+        # down to 3/4 of the limit, so that the next writes do not prune again
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.LIMIT * 3 // 4:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+YAML_CACHE = YamlCache()
+
 
 class IoUtils:
     @staticmethod
@@ -42,10 +150,50 @@ class IoUtils:
             return f.readlines()
 
     @staticmethod
-    def read_yaml(file: str) -> Any:
-        with open(file, "r", encoding="utf-8") as f:
-            yaml = YAML()
-            return yaml.load(f.read())
+    def read_yaml(file: str, cache: bool = False) -> Any:
+        """
+        Load a yaml file that is only read, never written back.
+
+        The C safe loader returns plain dicts, lists and scalars, several times
+        faster than the round-trip ``YAML()`` which keeps comments. With
+        ``cache`` the parsed document is also kept in ``YAML_CACHE``.
+        """
+        file = os.path.abspath(file)
+        if cache and YamlCache.enabled():
+            st = os.stat(file)
+            hit, data = YAML_CACHE.get(file, st)
+            if hit:
+                return data
+            data = IoUtils._load_yaml(file)
+            YAML_CACHE.put(file, st, data)
+            return data
+        return IoUtils._load_yaml(file)
+
+    @staticmethod
+    def _load_yaml(file: str) -> Any:
+        with open(file, "rb") as f:
+            return YAML(typ="safe").load(f)
+
+    @staticmethod
+    def write_text(path: str, text: str):
+        """
+        Write a text file through a temporary file renamed over it.
+
+        A reader (or a process killed while writing) sees either the old or
+        the new content, never a truncated file. The mode of an existing file
+        is kept.
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            if os.path.exists(path):
+                shutil.copymode(path, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
 
     @staticmethod
     def sha1(file: Path) -> str:
@@ -22,14 +22,16 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-10-09     xqyjlj       initial version
+# 2026-10-18     xqyjlj       validate with the cached schema validator
+# 2026-10-18     xqyjlj       load with the cached safe loader
 #
 import os
 
-import jsonschema
 from loguru import logger
 from public.csp.ip import Ip
-from ruamel.yaml import YAML
 
+from .io import IoUtils
+from .schema import SCHEMAS
 from .sys import SysUtils
 
 
@@ -41,24 +43,16 @@ class IpUtils:
     @staticmethod
     @logger.catch(default=False)
     def __check_ip(ip: dict) -> bool:
-        with open(
-            os.path.join(SysUtils.database_folder(), "schema", "ip.yml"),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            yaml = YAML()
-            schema = yaml.load(f.read())
-            validator = jsonschema.Draft7Validator(schema)
-            errors = sorted(validator.iter_errors(ip), key=lambda e: e.path)
-            if not errors:
-                return True
-            for e in errors:
-                print("Validation error:", e.message)
-                print("Error path:", list(e.path))
-                print("Error schema path:", list(e.schema_path))
-                logger.error(f"IP validation failed: {e}")
-            return False
-        return True
+        validator = SCHEMAS.validator("ip")
+        errors = sorted(validator.iter_errors(ip), key=lambda e: e.path)
+        if not errors:
+            return True
+        for e in errors:
+            print("Validation error:", e.message)
+            print("Error path:", list(e.path))
+            print("Error schema path:", list(e.schema_path))
+            logger.error(f"IP validation failed: {e}")
+        return False
 
     @staticmethod
     @logger.catch(default=Ip({}))
@@ -72,10 +66,8 @@ class IpUtils:
     @logger.catch(default=Ip({}))
     def load_ip_from_file(file: str) -> Ip:
         if os.path.isfile(file):
-            with open(file, "r", encoding="utf-8") as f:
-                yaml = YAML()
-                ip = yaml.load(f.read())
-                succeed = IpUtils.__check_ip(ip)
+            ip = IoUtils.read_yaml(file, cache=True)
+            succeed = IpUtils.__check_ip(ip)
             if succeed:
                 logger.info(f"Successfully loaded IP: {file}")
                 return Ip(ip)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        lock.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       add interprocess locks for job workers
+# 2026-10-18     xqyjlj       import gevent on first lock
+# 2026-10-18     xqyjlj       add project_lock, one key for every project action
+# 2026-10-18     xqyjlj       release a lock whose acquisition failed or was killed
+#
+
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, ContextManager, Iterator
+
+from loguru import logger
+
+from .sys import SysUtils
+
+if TYPE_CHECKING:
+    from public.csp.project import Project
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@dataclass
+class LockStats:
+    acquired: int = 0
+    contended: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+
+class _Entry:
+    def __init__(self):
+        # imported here, most cli commands never lock
+        from gevent.lock import Semaphore
+
+        self.semaphore = Semaphore()
+        self.users = 0
+
+
+class FileLock:
+    """
+    An exclusive lock on a file shared with other processes.
+
+    Taking the lock polls with ``gevent.sleep`` so that waiting never blocks
+    the event loop. The operating system drops the lock when the holding
+    process dies.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: str):
+        self._path = path
+        self._fd: int | None = None
+
+    def acquire(self):
+        import gevent
+
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    _try_lock(fd)
+                    break
+                except OSError:
+                    gevent.sleep(self.POLL_INTERVAL)
+        except BaseException:
+            # a failed or killed wait must not leak the descriptor
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            _unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class LockManager:
+    """
+    Named locks, one per key (a project folder, a package destination...).
+
+    Work on different keys runs concurrently, work on the same key is
+    serialised. A lock only lives while someone holds or waits for it. The
+    time spent waiting is recorded for monitoring. An ``interprocess`` manager
+    also takes a ``FileLock`` per key, so that the job worker processes
+    exclude each other too.
+    """
+
+    _managers: dict[str, "LockManager"] = {}
+
+    def __init__(self, name: str, interprocess: bool = False):
+        self._name = name
+        self._interprocess = interprocess
+        self._entries: dict[str, _Entry] = {}
+        self._stats = LockStats()
+        LockManager._managers[name] = self
+
+    @staticmethod
+    def key(path: str) -> str:
+        """Normalise a path so that different spellings share one lock."""
+        return os.path.normcase(os.path.abspath(path))
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+        entry.users += 1
+
+        # released in reverse, only what was acquired before a failure or a kill
+        acquired = False
+        file_lock = None
+        try:
+            start = time.perf_counter()
+            contended = entry.semaphore.locked()
+            entry.semaphore.acquire()
+            acquired = True
+            if self._interprocess:
+                lock = FileLock(self._lock_file(key))
+                lock.acquire()
+                file_lock = lock
+            wait = time.perf_counter() - start
+
+            self._stats.acquired += 1
+            self._stats.wait_total += wait
+            self._stats.wait_max = max(self._stats.wait_max, wait)
+            if contended:
+                self._stats.contended += 1
+                logger.debug(f"waited {wait:.3f}s for {self._name} lock {key!r}")
+
+            yield
+        finally:
+            if file_lock is not None:
+                file_lock.release()
+            if acquired:
+                entry.semaphore.release()
+            entry.users -= 1
+            if entry.users == 0:
+                del self._entries[key]
+
+    def _lock_file(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(
+            SysUtils.cache_folder(), "locks", f"{self._name}-{digest}.lock"
+        )
+
+    def stats(self) -> dict:
+        stats = asdict(self._stats)
+        # held locks with the number of waiters behind the holder
+        stats["held"] = {key: entry.users - 1 for key, entry in self._entries.items()}
+        return stats
+
+    @staticmethod
+    def all_stats() -> dict:
+        return {
+            name: manager.stats() for name, manager in LockManager._managers.items()
+        }
+
+
+PROJECT_LOCKS = LockManager("project", interprocess=True)
+PACKAGE_LOCKS = LockManager("package", interprocess=True)
+
+
+def project_lock(project: "Project") -> ContextManager[None]:
+    """
+    Lock a project for an action, keyed on its folder.
+
+    Every action reading or writing a project (dump, generate...) takes this
+    lock, so that actions on the same project are serialised whatever file
+    or output folder they were given.
+    """
+    return PROJECT_LOCKS.lock(PROJECT_LOCKS.key(project.folder()))
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        metrics.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       make _Metric an abstract base class
+#
+
+import abc
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+# seconds, from a cached dump to a cold install
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _labels(self, labels: dict[str, str]) -> Labels:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _format_labels(self, values: Labels, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    @abc.abstractmethod
+    def _samples(self) -> list[str]:
+        pass
+
+    @abc.abstractmethod
+    def drain(self):
+        pass
+
+    @abc.abstractmethod
+    def merge(self, state):
+        pass
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._labels(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._labels(labels), 0)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+    def drain(self) -> dict[Labels, float]:
+        values, self._values = self._values, {}
+        return values
+
+    def merge(self, state: dict[Labels, float]):
+        for key, value in state.items():
+            self._values[key] = self._values.get(key, 0) + value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        function: Callable[[], dict[Labels, float]] | None = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+        # computed when rendered, instead of set
+        self._function = function
+
+    def set(self, value: float, **labels: str):
+        self._values[self._labels(labels)] = value
+
+    def _samples(self) -> list[str]:
+        values = self._function() if self._function else self._values
+        return [
+            f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+    def drain(self) -> dict[Labels, float]:
+        # a gauge is a last value, keep it for the local endpoint as well
+        return dict(self._values) if self._function is None else {}
+
+    def merge(self, state: dict[Labels, float]):
+        self._values.update(state)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # per labels: counts of every bucket (+Inf last), sum
+        self._values: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._labels(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = ([0] * (len(self._buckets) + 1), [0.0])
+        entry[0][bisect.bisect_left(self._buckets, value)] += 1
+        entry[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._labels(labels))
+        return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self._buckets, math.inf), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, le)} {cumulative}"
+                )
+            labels = self._format_labels(key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def drain(self) -> dict[Labels, tuple[list[int], list[float]]]:
+        values, self._values = self._values, {}
+        return values
+
+    def merge(self, state: dict[Labels, tuple[list[int], list[float]]]):
+        for key, (counts, total) in state.items():
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self._buckets) + 1), [0.0])
+            for index, count in enumerate(counts):
+                entry[0][index] += count
+            entry[1][0] += total[0]
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """
+    Process wide metrics, rendered in the Prometheus text format.
+
+    Recording is a dict update, there is no lock: the server records from the
+    gevent loop only. Job worker processes ``drain`` what they recorded after
+    every job and the server ``merge``s it, so ``/api/metrics`` covers them.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _M) -> _M:
+        # modules may be imported again under another name, keep the first one
+        return self._metrics.setdefault(metric.name, metric)  # type: ignore
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Labels = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        function: Callable[[], dict[Labels, float]] | None = None,
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, function))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> dict:
+        return {name: metric.drain() for name, metric in self._metrics.items()}
+
+    def merge(self, state: dict):
+        for name, values in state.items():
+            metric = self._metrics.get(name)
+            if metric is not None and values:
+                metric.merge(values)
+
+
+METRICS = MetricsRegistry()
+
+CACHE_REQUESTS = METRICS.counter(
+    "csp_cache_requests_total",
+    "Cache lookups by cache and result (hit/miss).",
+    ("cache", "result"),
+)
+
+
+def _cache_hit_ratio() -> dict[Labels, float]:
+    totals: dict[str, list[float]] = {}
+    for (cache, result), value in CACHE_REQUESTS._values.items():
+        total = totals.setdefault(cache, [0, 0])
+        total[1] += value
+        if result == "hit":
+            total[0] += value
+    return {(cache,): hit / total for cache, (hit, total) in totals.items() if total}
+
+
+CACHE_HIT_RATIO = METRICS.gauge(
+    "csp_cache_hit_ratio",
+    "Hits over lookups of every cache since the server started.",
+    ("cache",),
+    function=_cache_hit_ratio,
+)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        progress.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       add the bytes done and an unknown count
+# 2026-10-18     xqyjlj       add the bytes an install saved
+#
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from blinker import Signal
+
+INTERVAL_ENV = "CSP_PROGRESS_INTERVAL"
+DEFAULT_INTERVAL = 0.1
+
+
+@dataclass
+class ProgressBatch:
+    """Progress coalesced over an interval, ``items`` are the sent kwargs."""
+
+    count: int
+    index: int
+    items: list[dict] = field(default_factory=list)
+
+    @property
+    def files(self) -> list[str]:
+        return [item.get("file", "") for item in self.items]
+
+    @property
+    def file(self) -> str:
+        return self.items[-1].get("file", "") if self.items else ""
+
+    @property
+    def size(self) -> int:
+        """Bytes done, for the actions that send ``size`` and ``total``."""
+        return self.items[-1].get("size", 0) if self.items else 0
+
+    @property
+    def total(self) -> int:
+        return self.items[-1].get("total", 0) if self.items else 0
+
+    @property
+    def saved(self) -> int:
+        """Bytes of the files an install linked instead of extracting."""
+        return self.items[-1].get("saved", 0) if self.items else 0
+
+    @property
+    def done(self) -> bool:
+        # a count of 0 is not known yet
+        return self.count > 0 and self.index >= self.count
+
+
+class ProgressEmitter:
+    """
+    Rate-limited receiver of the ``emitter`` progress signals.
+
+    The signals send ``count``, ``index`` and ``file`` (plus action specific
+    values, like the ``size`` and ``total`` bytes) for every file. They are
+    coalesced and handed to ``deliver`` as a ``ProgressBatch`` at most once per
+    ``interval`` seconds, the first and the last progress are always delivered
+    right away.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[ProgressBatch], None],
+        interval: float | None = None,
+    ):
+        self._deliver = deliver
+        self._interval = self.interval() if interval is None else interval
+        self._batch: ProgressBatch | None = None
+        self._last = 0.0
+        self._started = False
+
+    @staticmethod
+    def interval() -> float:
+        """The configured interval, ``serve`` passes it to the job workers."""
+        try:
+            return max(0.0, float(os.environ.get(INTERVAL_ENV, DEFAULT_INTERVAL)))
+        except ValueError:
+            return DEFAULT_INTERVAL
+
+    def __call__(self, sender, **kwargs):
+        count = kwargs.get("count", 0)
+        index = kwargs.get("index", 0)
+        if self._batch is None:
+            self._batch = ProgressBatch(count, index)
+        self._batch.count = count
+        self._batch.index = index
+        self._batch.items.append(kwargs)
+
+        now = time.monotonic()
+        if not self._started or self._batch.done or now - self._last >= self._interval:
+            self._started = True
+            self._last = now
+            self.flush()
+
+    def flush(self):
+        batch, self._batch = self._batch, None
+        if batch is not None:
+            self._deliver(batch)
+
+    @contextmanager
+    def connected_to(self, signal: Signal) -> Iterator["ProgressEmitter"]:
+        """Receive ``signal`` within the block, what is pending is then flushed."""
+        with signal.connected_to(self):
+            try:
+                yield self
+            finally:
+                self.flush()
@@ -22,17 +22,19 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-07     xqyjlj       initial version
+# 2026-10-18     xqyjlj       validate with the cached schema validator
+# 2026-10-18     xqyjlj       load with the safe loader
+# 2026-10-18     xqyjlj       skip the check of already validated content
 #
 
 import os
 
-import jsonschema
 from loguru import logger
 from packages.package import Package
 from public.csp.project import Project
-from ruamel.yaml import YAML
 
-from .sys import SysUtils
+from .io import IoUtils
+from .schema import SCHEMAS
 
 
 class ProjectUtils:
@@ -42,33 +44,23 @@ class ProjectUtils:
     @staticmethod
     @logger.catch(default=False)
     def check_project(project: dict) -> bool:
-        with open(
-            os.path.join(SysUtils.database_folder(), "schema", "project.yml"),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            yaml = YAML()
-            schema = yaml.load(f.read())
-            jsonschema.validate(instance=project, schema=schema)
+        SCHEMAS.validate("project", project)
         return True
 
     @staticmethod
     @logger.catch(default=Project({}))
     def load_project_from_file(file: str) -> Project:
         if os.path.isfile(file):
-            with open(file, "r", encoding="utf-8") as f:
-                yaml = YAML()
-                project = yaml.load(f.read())
-                return ProjectUtils.load_project(project, file)
+            project = IoUtils.read_yaml(file)
+            return ProjectUtils.load_project(project, file)
         else:
             logger.error(f"{file} is not file!")
             return Project({})
 
     @staticmethod
     @logger.catch(default=Project({}))
-    def load_project(project: dict, file: str) -> Project:
-        yaml = YAML()
-        succeed = ProjectUtils.check_project(project)
+    def load_project(project: dict, file: str, check: bool = True) -> Project:
+        succeed = not check or ProjectUtils.check_project(project)
         if succeed:
             p = Project(project)
             index = Package().index()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Licensed under the Apache License v. 2 (the "License")
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Copyright (C) 2025-2026 xqyjlj<xqyjlj@126.com>
+#
+# @author      xqyjlj
+# @file        schema.py
+#
+# Change Logs:
+# Date           Author       Notes
+# ------------   ----------   -----------------------------------------------
+# 2026-10-18     xqyjlj       initial version
+# 2026-10-18     xqyjlj       read the schemas through IoUtils
+# 2026-10-18     xqyjlj       validate the top level keys of an object alone
+#
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import jsonschema
+from jsonschema.exceptions import best_match
+
+from .io import IoUtils
+from .sys import SysUtils
+
+# the root keywords validate_keys understands, other schemas are validated whole
+_KEYS_KEYWORDS = {
+    "$schema",
+    "$id",
+    "title",
+    "description",
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "definitions",
+}
+
+
+@dataclass
+class _Entry:
+    validator: jsonschema.Draft7Validator
+    mtime: int
+    size: int
+    properties: dict[str, jsonschema.Draft7Validator] = field(default_factory=dict)
+
+
+class SchemaRegistry:
+    """
+    Draft 7 validators of the schemas in ``database/schema``, by file stem.
+
+    A schema is read, checked and compiled into a validator the first time it
+    is used. Later uses only stat the file and reload it when its mtime or
+    size changed, so editing a schema still takes effect without a restart.
+    """
+
+    def __init__(self, folder: str | None = None):
+        self._folder = folder
+        self._entries: dict[str, _Entry] = {}
+
+    def folder(self) -> str:
+        if self._folder is not None:
+            return self._folder
+        return os.path.join(SysUtils.database_folder(), "schema")
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.folder(), f"{name}.yml")
+
+    def validator(self, name: str) -> jsonschema.Draft7Validator:
+        path = self.path(name)
+        st = os.stat(path)
+        entry = self._entries.get(path)
+        if entry is None or (entry.mtime, entry.size) != (st.st_mtime_ns, st.st_size):
+            schema = IoUtils.read_yaml(path, cache=True)
+            jsonschema.Draft7Validator.check_schema(schema)
+            entry = _Entry(
+                jsonschema.Draft7Validator(schema), st.st_mtime_ns, st.st_size
+            )
+            self._entries[path] = entry
+        return entry.validator
+
+    def validate(self, name: str, instance: Any):
+        """Raise the most relevant ``ValidationError``, as ``jsonschema.validate``."""
+        error = best_match(self.validator(name).iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def validate_keys(self, name: str, instance: dict, keys: Iterable[str]):
+        """
+        Validate only the top level ``keys`` of an object, as ``validate``.
+
+        Used after an update touching these keys of an instance that was valid,
+        the rest of it is not looked at again.
+        """
+        validator = self.validator(name)
+        schema = validator.schema
+        if (
+            not isinstance(schema, dict)
+            or schema.get("type") != "object"
+            or not set(schema) <= _KEYS_KEYWORDS
+            or not isinstance(instance, dict)
+        ):
+            self.validate(name, instance)
+            return
+
+        entry = self._entries[self.path(name)]
+        properties = schema.get("properties", {})
+        for key in keys:
+            if key not in instance:
+                if key in schema.get("required", []):
+                    raise jsonschema.ValidationError(
+                        f"{key!r} is a required property", validator="required"
+                    )
+                continue
+
+            subschema = properties.get(key, schema.get("additionalProperties", True))
+            if subschema is False:
+                raise jsonschema.ValidationError(
+                    f"Additional properties are not allowed ({key!r} was unexpected)",
+                    validator="additionalProperties",
+                )
+            sub = entry.properties.get(key)
+            if sub is None:
+                sub = entry.properties[key] = validator.evolve(schema=subschema)
+            error = best_match(sub.iter_errors(instance[key]))
+            if error is not None:
+                error.path.appendleft(key)
+                raise error
+
+    def clear(self):
+        self._entries.clear()
+
+
+SCHEMAS = SchemaRegistry()
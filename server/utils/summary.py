@@ -22,15 +22,17 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-21     xqyjlj       initial version
+# 2026-10-18     xqyjlj       validate with the cached schema validator
+# 2026-10-18     xqyjlj       load with the cached safe loader
 #
 
 import os
 
-import jsonschema
 from loguru import logger
 from public.csp.summary import Summary
-from ruamel.yaml import YAML
 
+from .io import IoUtils
+from .schema import SCHEMAS
 from .sys import SysUtils
 
 
@@ -42,27 +44,22 @@ class SummaryUtils:
     @staticmethod
     @logger.catch(default=False)
     def __check_summary(summary: dict) -> bool:
-        with open(
-            os.path.join(SysUtils.database_folder(), "schema", "summary.yml"),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            yaml = YAML()
-            schema = yaml.load(f.read())
-            jsonschema.validate(instance=summary, schema=schema)
+        SCHEMAS.validate("summary", summary)
         return True
 
     @staticmethod
-    @logger.catch(default=Summary({}))
-    def load_summary(vendor: str, name: str) -> Summary:
-        file = os.path.join(
+    def summary_file(vendor: str, name: str) -> str:
+        return os.path.join(
             SysUtils.database_folder(), "summary", vendor, f"{name}.yml"
         )
+
+    @staticmethod
+    @logger.catch(default=Summary({}))
+    def load_summary(vendor: str, name: str) -> Summary:
+        file = SummaryUtils.summary_file(vendor, name)
         if os.path.isfile(file):
-            with open(file, "r", encoding="utf-8") as f:
-                yaml = YAML()
-                summary = yaml.load(f.read())
-                succeed = SummaryUtils.__check_summary(summary)
+            summary = IoUtils.read_yaml(file, cache=True)
+            succeed = SummaryUtils.__check_summary(summary)
             if succeed:
                 return Summary(summary)
             else:
@@ -22,6 +22,7 @@
 # Date           Author       Notes
 # ------------   ----------   -----------------------------------------------
 # 2025-07-07     xqyjlj       initial version
+# 2026-10-18     xqyjlj       add packages_objects_folder
 #
 
 
@@ -114,6 +115,26 @@ class SysUtils:
         """
         return str(Path.home() / ".csp" / "packages")
 
+    @staticmethod
+    def packages_objects_folder() -> str:
+        """
+        @brief      Get the folder of the package object store.
+        @return     The folder of the package object store.
+        @details    It is the subfolder ".objects" of the packages folder, installed files are hard links into it.
+        @note       It is a static method.
+        """
+        return str(Path(SysUtils.packages_folder()) / ".objects")
+
+    @staticmethod
+    def cache_folder() -> str:
+        """
+        @brief      Get the folder of the caches.
+        @return     The folder of the caches.
+        @details    It is the subfolder "cache" of the user's csp folder, everything in it can be safely removed.
+        @note       It is a static method.
+        """
+        return str(Path.home() / ".csp" / "cache")
+
     @staticmethod
     def packages_index_file() -> str:
         """
@@ -18,6 +18,10 @@ export interface SioPackageInstallProgress {
   count: number;
   index: number;
   file: string;
+  files: string[];
+  size: number;
+  total: number;
+  saved: number;
 }
 
 export interface SioPackageInstallResponse {
@@ -85,7 +89,7 @@ export const SioPackageInstallRequest: MessageFns<SioPackageInstallRequest> = {
 };
 
 function createBaseSioPackageInstallProgress(): SioPackageInstallProgress {
-  return { count: 0, index: 0, file: "" };
+  return { count: 0, index: 0, file: "", files: [], size: 0, total: 0, saved: 0 };
 }
 
 export const SioPackageInstallProgress: MessageFns<SioPackageInstallProgress> = {
@@ -99,6 +103,18 @@ export const SioPackageInstallProgress: MessageFns<SioPackageInstallProgress> =
     if (message.file !== "") {
       writer.uint32(26).string(message.file);
     }
+    for (const v of message.files) {
+      writer.uint32(34).string(v!);
+    }
+    if (message.size !== 0) {
+      writer.uint32(40).uint64(message.size);
+    }
+    if (message.total !== 0) {
+      writer.uint32(48).uint64(message.total);
+    }
+    if (message.saved !== 0) {
+      writer.uint32(56).uint64(message.saved);
+    }
     return writer;
   },
 
@@ -133,6 +149,38 @@ export const SioPackageInstallProgress: MessageFns<SioPackageInstallProgress> =
           message.file = reader.string();
           continue;
         }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.files.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.size = longToNumber(reader.uint64());
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.total = longToNumber(reader.uint64());
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.saved = longToNumber(reader.uint64());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -147,6 +195,10 @@ export const SioPackageInstallProgress: MessageFns<SioPackageInstallProgress> =
       count: isSet(object.count) ? globalThis.Number(object.count) : 0,
       index: isSet(object.index) ? globalThis.Number(object.index) : 0,
       file: isSet(object.file) ? globalThis.String(object.file) : "",
+      files: globalThis.Array.isArray(object?.files) ? object.files.map((e: any) => globalThis.String(e)) : [],
+      size: isSet(object.size) ? globalThis.Number(object.size) : 0,
+      total: isSet(object.total) ? globalThis.Number(object.total) : 0,
+      saved: isSet(object.saved) ? globalThis.Number(object.saved) : 0,
     };
   },
 
@@ -161,6 +213,18 @@ export const SioPackageInstallProgress: MessageFns<SioPackageInstallProgress> =
     if (message.file !== "") {
       obj.file = message.file;
     }
+    if (message.files?.length) {
+      obj.files = message.files;
+    }
+    if (message.size !== 0) {
+      obj.size = Math.round(message.size);
+    }
+    if (message.total !== 0) {
+      obj.total = Math.round(message.total);
+    }
+    if (message.saved !== 0) {
+      obj.saved = Math.round(message.saved);
+    }
     return obj;
   },
 
@@ -172,6 +236,10 @@ export const SioPackageInstallProgress: MessageFns<SioPackageInstallProgress> =
     message.count = object.count ?? 0;
     message.index = object.index ?? 0;
     message.file = object.file ?? "";
+    message.files = object.files?.map((e) => e) || [];
+    message.size = object.size ?? 0;
+    message.total = object.total ?? 0;
+    message.saved = object.saved ?? 0;
     return message;
   },
 };
@@ -282,6 +350,17 @@ type KeysOfUnion<T> = T extends T ? keyof T : never;
 export type Exact<P, I extends P> = P extends Builtin ? P
   : P & { [K in keyof P]: Exact<P[K], I[K]> } & { [K in Exclude<keyof I, KeysOfUnion<P>>]: never };
 
+function longToNumber(int64: { toString(): string }): number {
+  const num = globalThis.Number(int64.toString());
+  if (num > globalThis.Number.MAX_SAFE_INTEGER) {
+    throw new globalThis.Error("Value is larger than Number.MAX_SAFE_INTEGER");
+  }
+  if (num < globalThis.Number.MIN_SAFE_INTEGER) {
+    throw new globalThis.Error("Value is smaller than Number.MIN_SAFE_INTEGER");
+  }
+  return num;
+}
+
 function isSet(value: any): boolean {
   return value !== null && value !== undefined;
 }
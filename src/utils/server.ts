@@ -25,6 +25,7 @@
  *  Date           Author       Notes
  *  ------------   ----------   -----------------------------------------------
  *  2025-07-10     xqyjlj       initial version
+ *  2026-10-18     xqyjlj       show the install progress in bytes
  */
 
 import type { ProjectType } from '@/electron/types'
@@ -216,7 +217,13 @@ export class Server {
       if (onProgress) {
         this._socket.on('package/install.progress', (progress: ArrayBuffer) => {
           const req = SioPackageInstallProgress.decode(new Uint8Array(progress))
-          onProgress(req.count, req.index, req.file)
+          if (req.total > 0) {
+            // bytes are known up front, the file count is not for a streamed tar.gz
+            onProgress(req.total, req.size, req.file)
+          }
+          else {
+            onProgress(req.count, req.index, req.file)
+          }
         })
       }
 